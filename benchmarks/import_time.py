@@ -0,0 +1,145 @@
+"""Check the Todo CLI's startup cost against an import-time budget.
+
+Runs ``python -X importtime -c "import todo.main"`` in a fresh interpreter,
+reports the slowest modules and fails if the application's own modules take
+longer than the budget. It also dispatches ``--version`` and ``--help`` and
+fails if either imports a storage backend or a command module.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 25] [--total-budget-ms 300]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that must stay unimported until a command is dispatched
+_DEFERRED_PREFIXES = ("todo.storage.", "todo.commands.")
+
+_DISPATCH_PROBE = """
+import sys
+from todo.main import app
+try:
+    app([{flag!r}])
+except SystemExit:
+    pass
+loaded = sorted(
+    name for name in sys.modules if name.startswith({prefixes!r})
+)
+print("LOADED:" + ",".join(loaded), file=sys.stderr)
+"""
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run Python code in a fresh interpreter with the src tree importable.
+
+    Args:
+        code: The code to run.
+        *args: Extra interpreter options.
+
+    Returns:
+        The completed process, with captured output.
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=SRC_DIR.parent,
+    )
+
+
+def measure_imports() -> list[tuple[str, int, int]]:
+    """Import ``todo.main`` under ``-X importtime``.
+
+    Returns:
+        (module, self microseconds, cumulative microseconds) per module.
+
+    Raises:
+        SystemExit: If the import fails.
+    """
+    result = _run("import todo.main", "-X", "importtime")
+    if result.returncode != 0:
+        sys.exit(f"Importing todo.main failed:\n{result.stderr}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def check_dispatch(flag: str) -> list[str]:
+    """Dispatch a flag and list the deferred modules it imported.
+
+    Args:
+        flag: The command-line flag to pass, e.g. '--version'.
+
+    Returns:
+        Names of storage and command modules that were imported.
+    """
+    code = _DISPATCH_PROBE.format(flag=flag, prefixes=_DEFERRED_PREFIXES)
+    result = _run(code)
+    for line in result.stderr.splitlines():
+        if line.startswith("LOADED:"):
+            return [name for name in line[len("LOADED:") :].split(",") if name]
+    sys.exit(f"Dispatching {flag} failed:\n{result.stderr}")
+
+
+def main() -> None:
+    """Report import timings and enforce the budgets."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=25.0,
+        help="Budget for the self time of the todo package's own modules",
+    )
+    parser.add_argument(
+        "--total-budget-ms",
+        type=float,
+        default=300.0,
+        help="Budget for importing todo.main, dependencies included",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules shown")
+    args = parser.parse_args()
+
+    timings = measure_imports()
+    total_ms = next(cum for name, _, cum in timings if name == "todo.main") / 1000
+    own_ms = sum(s for name, s, _ in timings if name.split(".")[0] == "todo") / 1000
+
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda t: -t[1])[
+        : args.top
+    ]:
+        print(f"{self_us / 1000:9.2f} {cumulative_us / 1000:9.2f}  {name}")
+    print(f"\nimport todo.main: {total_ms:.1f} ms (budget {args.total_budget_ms} ms)")
+    print(f"todo.* modules:   {own_ms:.1f} ms (budget {args.budget_ms} ms)")
+
+    failures = []
+    if own_ms > args.budget_ms:
+        failures.append("todo.* modules exceed their import budget")
+    if total_ms > args.total_budget_ms:
+        failures.append("import todo.main exceeds its budget")
+    eager = [name for name, _, _ in timings if name.startswith(_DEFERRED_PREFIXES)]
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    for flag in ("--version", "--help"):
+        loaded = check_dispatch(flag)
+        if loaded:
+            failures.append(f"{flag} imported: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
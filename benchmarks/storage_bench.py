@@ -0,0 +1,419 @@
+"""Time the storage backends' operations on synthetic stores of several sizes.
+
+For every backend and store size a fresh store is generated in a temporary
+directory, then ``get_by_id``, ``get_by_status``, ``update``,
+``toggle_status``, ``add``, ``delete``, load (opening the store) and save
+(rewriting the full snapshot, where the backend has one) are each timed
+call by call. Every combination runs in its own interpreter, so its peak
+memory is measured in isolation.
+
+Results are written as JSON with ops/s, p50/p99/mean latency and memory per
+operation. Given ``--baseline`` with an earlier result file, the run fails
+if any operation's median latency grew by more than ``--tolerance``.
+
+Usage:
+    python benchmarks/storage_bench.py [--sizes 1000,100000,1000000]
+        [--backends memory,json,json-journal,sqlite,binary]
+        [--output results.json] [--baseline old.json] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from todo.config import StorageSettings  # noqa: E402
+from todo.models import Task, TaskStatus  # noqa: E402
+from todo.storage import open_storage  # noqa: E402
+from todo.storage.memory import TaskStorage  # noqa: E402
+
+# Backend name to the settings it is opened with; None means in-memory.
+# A new backend becomes benchmarkable by adding its settings here.
+BACKENDS: Dict[str, Dict[str, Any] | None] = {
+    "memory": None,
+    "json": {"backend": "json"},
+    "json-journal": {"backend": "json", "journal": True},
+    "sqlite": {"backend": "sqlite"},
+    "binary": {"backend": "binary"},
+}
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _percentile(sorted_ns: List[int], fraction: float) -> float:
+    """Pick a percentile from sorted samples by the nearest-rank method.
+
+    Args:
+        sorted_ns: Latencies in nanoseconds, ascending.
+        fraction: The percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        The percentile in microseconds.
+    """
+    rank = max(0, min(len(sorted_ns) - 1, round(fraction * len(sorted_ns)) - 1))
+    return sorted_ns[rank] / 1000
+
+
+class Case:
+    """One backend at one store size, timed in the current process.
+
+    Attributes:
+        backend: Name of the backend in ``BACKENDS``.
+        size: Number of tasks in the generated store.
+        budget: Seconds each operation may spend collecting samples.
+        min_samples: Samples taken regardless of the budget.
+        max_samples: Samples after which an operation stops early.
+        directory: Temporary directory holding the store's files.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        size: int,
+        budget: float,
+        min_samples: int,
+        max_samples: int,
+        directory: Path,
+    ) -> None:
+        """Prepare a case; nothing is generated until ``run``.
+
+        Args:
+            backend: Name of the backend in ``BACKENDS``.
+            size: Number of tasks to generate.
+            budget: Seconds each operation may spend collecting samples.
+            min_samples: Samples taken regardless of the budget.
+            max_samples: Samples after which an operation stops early.
+            directory: Temporary directory for the store's files.
+        """
+        self.backend = backend
+        self.size = size
+        self.budget = budget
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.directory = directory
+        self._rng = random.Random(size)
+        self._ids: List[int] = []
+        self._next_memory_id = 1
+
+    def _open(self) -> Any:
+        """Open the backend's store in the case directory.
+
+        Returns:
+            A storage instance.
+        """
+        options = BACKENDS[self.backend]
+        if options is None:
+            return TaskStorage()
+        settings = StorageSettings(
+            data_file=str(self.directory / "todos.json"),
+            sqlite_file=str(self.directory / "todos.db"),
+            binary_file=str(self.directory / "todos.bin"),
+            **options,
+        )
+        return open_storage(settings)
+
+    def _task(self, n: int) -> Task:
+        """Build a synthetic task; the in-memory store needs explicit IDs.
+
+        Args:
+            n: Sequence number used in the title.
+
+        Returns:
+            A new task.
+        """
+        task_id = 0
+        if self.backend == "memory":
+            task_id = self._next_memory_id
+            self._next_memory_id += 1
+        return Task(
+            id=task_id,
+            title=f"Synthetic task {n}",
+            description=f"Generated for the {self.size} task benchmark",
+            status=TaskStatus.COMPLETE if n % 3 == 0 else TaskStatus.INCOMPLETE,
+        )
+
+    def _time(self, op: Callable[[], Any]) -> Dict[str, float]:
+        """Call an operation repeatedly and summarize its latency.
+
+        Args:
+            op: The operation; each call is one sample.
+
+        Returns:
+            Samples taken, ops/s and p50/p99/mean latency in microseconds.
+        """
+        samples: List[int] = []
+        deadline = time.perf_counter() + self.budget
+        while len(samples) < self.max_samples and (
+            len(samples) < self.min_samples or time.perf_counter() < deadline
+        ):
+            start = time.perf_counter_ns()
+            op()
+            samples.append(time.perf_counter_ns() - start)
+        samples.sort()
+        total = sum(samples)
+        return {
+            "samples": len(samples),
+            "ops_per_sec": len(samples) / (total / 1e9) if total else 0.0,
+            "p50_us": _percentile(samples, 0.50),
+            "p99_us": _percentile(samples, 0.99),
+            "mean_us": total / len(samples) / 1000,
+        }
+
+    def _traced_peak(self, op: Callable[[], Any]) -> int:
+        """Measure the peak Python allocation of one call of an operation.
+
+        Tracing slows everything down, so it runs apart from the timing.
+
+        Args:
+            op: The operation to trace.
+
+        Returns:
+            Peak bytes allocated above the level before the call.
+        """
+        tracemalloc.start()
+        try:
+            op()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def run(self) -> Dict[str, Any]:
+        """Generate the store and time every operation on it.
+
+        Returns:
+            The case's results, ready to serialize.
+        """
+        rng = self._rng
+        start = time.perf_counter()
+        storage = self._open()
+        added = storage.add_many(self._task(n) for n in range(self.size))
+        self._ids = [task.id for task in added]
+        del added
+        setup_seconds = time.perf_counter() - start
+        ops: Dict[str, Dict[str, float]] = {}
+
+        ops["get_by_id"] = self._time(lambda: storage.get_by_id(rng.choice(self._ids)))
+        ops["get_by_status"] = self._time(
+            lambda: storage.get_by_status(TaskStatus.COMPLETE)
+        )
+        ops["update"] = self._time(
+            lambda: storage.update(rng.choice(self._ids), title=str(rng.random()))
+        )
+        ops["toggle_status"] = self._time(
+            lambda: storage.toggle_status(rng.choice(self._ids))
+        )
+
+        def add() -> None:
+            self._ids.append(storage.add(self._task(len(self._ids))).id)
+
+        ops["add"] = self._time(add)
+
+        def delete() -> None:
+            index = rng.randrange(len(self._ids))
+            self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+            storage.delete(self._ids.pop())
+
+        ops["delete"] = self._time(delete)
+
+        if hasattr(storage, "compact"):
+            ops["save"] = self._time(storage.compact)
+            ops["save"]["peak_bytes"] = self._traced_peak(storage.compact)
+        if hasattr(storage, "close"):
+            storage.close()
+
+        if BACKENDS[self.backend] is not None:
+
+            def load() -> None:
+                reopened = self._open()
+                reopened.get_by_id(self._ids[0])
+                reopened.close()
+
+            ops["load"] = self._time(load)
+            ops["load"]["peak_bytes"] = self._traced_peak(load)
+
+        return {
+            "backend": self.backend,
+            "size": self.size,
+            "setup_seconds": setup_seconds,
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            * _RSS_UNIT,
+            "ops": ops,
+        }
+
+
+def run_isolated(backend: str, size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one case in a fresh interpreter so its peak memory is its own.
+
+    Args:
+        backend: Name of the backend in ``BACKENDS``.
+        size: Number of tasks to generate.
+        args: Parsed command line, for the sampling options.
+
+    Returns:
+        The case's results.
+    """
+    command = [
+        sys.executable,
+        __file__,
+        "--case",
+        f"{backend}:{size}",
+        "--budget",
+        str(args.budget),
+        "--min-samples",
+        str(args.min_samples),
+        "--max-samples",
+        str(args.max_samples),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"Benchmark {backend} at {size} tasks failed:\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def find_regressions(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """Compare median latencies with an earlier run.
+
+    Args:
+        results: Cases from this run.
+        baseline: Cases from the earlier run.
+        tolerance: Allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        A description of every operation that got slower than allowed.
+    """
+    previous = {
+        (case["backend"], case["size"], op): stats["p50_us"]
+        for case in baseline
+        for op, stats in case["ops"].items()
+    }
+    regressions = []
+    for case in results:
+        for op, stats in case["ops"].items():
+            before = previous.get((case["backend"], case["size"], op))
+            if before and stats["p50_us"] > before * (1 + tolerance):
+                regressions.append(
+                    f"{case['backend']} {op} at {case['size']} tasks: "
+                    f"p50 {before:.1f}us -> {stats['p50_us']:.1f}us"
+                )
+    return regressions
+
+
+def _print_summary(results: List[Dict[str, Any]]) -> None:
+    """Print a human-readable table of the results to stderr.
+
+    Args:
+        results: The cases to summarize.
+    """
+    print(
+        f"{'backend':<13}{'size':>9}  {'op':<14}{'ops/s':>12}"
+        f"{'p50 us':>11}{'p99 us':>11}",
+        file=sys.stderr,
+    )
+    for case in results:
+        for op, stats in case["ops"].items():
+            print(
+                f"{case['backend']:<13}{case['size']:>9}  {op:<14}"
+                f"{stats['ops_per_sec']:>12,.0f}{stats['p50_us']:>11.1f}"
+                f"{stats['p99_us']:>11.1f}",
+                file=sys.stderr,
+            )
+        print(
+            f"{case['backend']:<13}{case['size']:>9}  peak RSS "
+            f"{case['max_rss_bytes'] / 2**20:.0f} MiB, "
+            f"setup {case['setup_seconds']:.1f}s",
+            file=sys.stderr,
+        )
+
+
+def main() -> None:
+    """Run the benchmark matrix and write the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated store sizes",
+    )
+    parser.add_argument(
+        "--backends", default=",".join(BACKENDS), help="Comma-separated backends"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=2.0, help="Seconds of sampling per operation"
+    )
+    parser.add_argument("--min-samples", type=int, default=5)
+    parser.add_argument("--max-samples", type=int, default=5000)
+    parser.add_argument("--output", help="File for the JSON results (default: stdout)")
+    parser.add_argument("--baseline", help="Earlier results to check for regressions")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed p50 slowdown against the baseline, as a fraction",
+    )
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        backend, size = args.case.split(":")
+        with tempfile.TemporaryDirectory() as tmp:
+            case = Case(
+                backend,
+                int(size),
+                args.budget,
+                args.min_samples,
+                args.max_samples,
+                Path(tmp),
+            )
+            print(json.dumps(case.run()))
+        return
+
+    backends = args.backends.split(",")
+    unknown = [name for name in backends if name not in BACKENDS]
+    if unknown:
+        parser.error(f"Unknown backend(s): {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results = []
+    for size in sizes:
+        for backend in backends:
+            print(f"Running {backend} at {size} tasks...", file=sys.stderr)
+            results.append(run_isolated(backend, size, args))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    _print_summary(results)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = find_regressions(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Hammer a storage from many threads and check nothing was lost.
+
+Each thread adds tasks, then updates, toggles and deletes only the tasks it
+added, interleaved with reads of the whole store. Since no two threads touch
+the same task, the final state is fully determined: the run fails if any
+ID was handed out twice, any add, update, toggle or delete went missing,
+the status counts disagree with the tasks, or (for the JSON backend) the
+file on disk disagrees with memory.
+
+Usage:
+    python benchmarks/thread_stress.py [--threads 8] [--ops 500]
+        [--backend json|memory] [--journal]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from todo.models import Task, TaskStatus  # noqa: E402
+from todo.storage.file import FileStorage  # noqa: E402
+from todo.storage.memory import TaskStorage  # noqa: E402
+
+
+class Worker(threading.Thread):
+    """Thread mutating its own tasks and recording what it expects to see.
+
+    Attributes:
+        expected: Mapping of task ID to the (title, status) this thread
+            left it with; deleted tasks are removed.
+        added: Every ID this thread was handed by ``add``.
+        errors: Exceptions raised by storage calls.
+    """
+
+    def __init__(self, storage, number: int, ops: int, seed: int) -> None:
+        """Prepare a worker.
+
+        Args:
+            storage: The shared storage to hammer.
+            number: The worker's index, used in task titles.
+            ops: Number of operations to perform.
+            seed: Seed for this worker's random choices.
+        """
+        super().__init__(name=f"worker-{number}")
+        self.storage = storage
+        self.number = number
+        self.ops = ops
+        self.rng = random.Random(seed)
+        self.expected: dict[int, tuple[str, str]] = {}
+        self.added: list[int] = []
+        self.errors: list[BaseException] = []
+        self._next_local_id = 0
+
+    def _new_task(self) -> Task:
+        """Build a task to add; memory storage expects callers to pick IDs."""
+        title = f"w{self.number} task {len(self.added)}"
+        if isinstance(self.storage, TaskStorage):
+            self._next_local_id += 1
+            task_id = self.number * 10_000_000 + self._next_local_id
+            return Task(id=task_id, title=title)
+        return Task(id=0, title=title)
+
+    def run(self) -> None:
+        """Perform the operations, recording failures instead of raising."""
+        try:
+            for _ in range(self.ops):
+                self._step()
+        except BaseException as e:  # noqa: BLE001 - reported by the main thread
+            self.errors.append(e)
+
+    def _step(self) -> None:
+        """Perform one randomly chosen operation."""
+        storage = self.storage
+        roll = self.rng.random()
+        if roll < 0.35 or not self.expected:
+            task = storage.add(self._new_task())
+            self.added.append(task.id)
+            self.expected[task.id] = (task.title, task.status)
+        elif roll < 0.5:
+            task_id = self.rng.choice(list(self.expected))
+            title = f"w{self.number} renamed {self.rng.random():.6f}"
+            storage.update(task_id, title=title)
+            self.expected[task_id] = (title, self.expected[task_id][1])
+        elif roll < 0.65:
+            task_id = self.rng.choice(list(self.expected))
+            task = storage.toggle_status(task_id)
+            self.expected[task_id] = (self.expected[task_id][0], task.status)
+        elif roll < 0.75:
+            task_id = self.rng.choice(list(self.expected))
+            storage.delete(task_id)
+            del self.expected[task_id]
+        elif roll < 0.85:
+            storage.counts()
+            storage.get_all()
+        elif roll < 0.95:
+            storage.page(20, after=self.rng.choice(list(self.expected)))
+        else:
+            storage.search(f"w{self.number}", limit=5)
+
+
+def check(storage, workers: list[Worker]) -> list[str]:
+    """Compare the storage's final state with what the workers expect.
+
+    Args:
+        storage: The storage after every worker finished.
+        workers: The finished workers.
+
+    Returns:
+        A description of every discrepancy found.
+    """
+    failures = []
+    for worker in workers:
+        failures.extend(f"{worker.name}: {e!r}" for e in worker.errors)
+
+    added = [task_id for worker in workers for task_id in worker.added]
+    if len(added) != len(set(added)):
+        failures.append(f"{len(added) - len(set(added))} duplicate ID(s) handed out")
+
+    expected = {}
+    for worker in workers:
+        expected.update(worker.expected)
+    actual = {task.id: (task.title, task.status) for task in storage.get_all()}
+    missing = expected.keys() - actual.keys()
+    extra = actual.keys() - expected.keys()
+    wrong = [i for i in expected.keys() & actual.keys() if expected[i] != actual[i]]
+    if missing:
+        failures.append(f"{len(missing)} task(s) lost, e.g. {sorted(missing)[:5]}")
+    if extra:
+        failures.append(f"{len(extra)} deleted task(s) resurrected")
+    if wrong:
+        failures.append(f"{len(wrong)} task(s) with a lost update")
+
+    complete = sum(status == TaskStatus.COMPLETE for _, status in actual.values())
+    counts = storage.counts()
+    if counts != {
+        "total": len(actual),
+        TaskStatus.COMPLETE: complete,
+        TaskStatus.INCOMPLETE: len(actual) - complete,
+    }:
+        failures.append(f"Status counts {counts} disagree with the tasks")
+    return failures
+
+
+def main() -> None:
+    """Run the stress test and exit non-zero on any discrepancy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=500, help="Operations per thread")
+    parser.add_argument("--backend", choices=["json", "memory"], default="json")
+    parser.add_argument("--journal", action="store_true", help="Journal JSON writes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_file = Path(tmp) / "todos.json"
+        if args.backend == "json":
+            storage = FileStorage(data_file, journal=args.journal)
+        else:
+            storage = TaskStorage()
+
+        workers = [
+            Worker(storage, n, args.ops, args.seed * 1000 + n)
+            for n in range(args.threads)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        failures = check(storage, workers)
+        if args.backend == "json":
+            reopened = FileStorage(data_file, journal=args.journal)
+            on_disk = {t.id: (t.title, t.status) for t in reopened.get_all()}
+            in_memory = {t.id: (t.title, t.status) for t in storage.get_all()}
+            if on_disk != in_memory:
+                failures.append("Data file disagrees with memory")
+            reopened.close()
+            storage.close()
+
+    total_ops = args.threads * args.ops
+    print(
+        f"{args.backend}{' (journal)' if args.journal else ''}: "
+        f"{args.threads} threads x {args.ops} ops in {elapsed:.2f}s "
+        f"({total_ops / elapsed:,.0f} ops/s)"
+    )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: no lost updates or duplicate IDs")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
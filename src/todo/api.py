@@ -0,0 +1,183 @@
+"""Framework-independent helpers for the Todo HTTP APIs.
+
+This module holds the request handling logic shared by the FastAPI and
+Flask applications, so each app only adapts it to its own framework.
+"""
+
+from typing import Any, Dict, List
+
+from todo.exceptions import TaskNotFoundError, ValidationError
+from todo.models import Task
+from todo.utils import validate_title
+
+# Largest page a client may request from a paginated task listing
+MAX_PAGE_LIMIT = 1000
+
+# Largest number of operations accepted in one batch request
+MAX_BATCH_OPERATIONS = 1000
+
+
+def make_etag(storage: Any) -> str:
+    """Build a strong ETag for the current state of a storage.
+
+    The tag combines the storage's per-instance token with its version
+    counter, so it changes on every mutation and never collides between
+    processes that count versions independently.
+
+    Args:
+        storage: A storage exposing ``instance_id`` and ``version``.
+
+    Returns:
+        The quoted ETag value.
+    """
+    return f'"{storage.instance_id}-{storage.version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match request header against the current ETag.
+
+    Args:
+        if_none_match: Raw header value, or None if it was not sent.
+        etag: The current quoted ETag.
+
+    Returns:
+        True if the client's cached copy is still current.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def clamp_limit(limit: int) -> int:
+    """Restrict a requested page size to the supported range.
+
+    Args:
+        limit: The page size asked for by the client.
+
+    Returns:
+        The page size to use, between 1 and MAX_PAGE_LIMIT.
+    """
+    return max(1, min(limit, MAX_PAGE_LIMIT))
+
+
+def parse_flag(value: str | None) -> bool:
+    """Interpret a boolean query parameter such as ``reverse=true``.
+
+    Args:
+        value: The raw parameter value, or None if it was not sent.
+
+    Returns:
+        True for '1', 'true', 'yes' or 'on' in any case, False otherwise.
+    """
+    return value is not None and value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def changes_since(storage: Any, since: int) -> Dict[str, Any]:
+    """Build the change feed response for a client at a given version.
+
+    Clients load every task once, note the version it was served at (the
+    ``X-Version`` header of ``/api/tasks``), then poll for the changes
+    since their version and apply them. The 'instance' lets a client notice
+    that the server restarted and its versions no longer apply.
+
+    Args:
+        storage: A storage exposing ``changes()`` and ``instance_id``.
+        since: The version the client's copy of the tasks is at.
+
+    Returns:
+        The response object: the current 'version' and 'instance', the
+        'changes' to apply, and 'resync', which is True if the changes are
+        unavailable and the client must reload every task instead.
+    """
+    version, changes = storage.changes(since)
+    return {
+        "version": version,
+        "instance": storage.instance_id,
+        "resync": changes is None,
+        "changes": changes or [],
+    }
+
+
+def _apply_operation(storage: Any, operation: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply one batch operation and describe its outcome.
+
+    Args:
+        storage: The storage to mutate.
+        operation: Operation object with an 'op' field.
+
+    Returns:
+        The operation's result object.
+
+    Raises:
+        TaskNotFoundError: If the operation targets a missing task.
+        ValidationError: If the operation is malformed.
+    """
+    op = operation.get("op")
+    if op == "add":
+        task = Task(
+            id=0,
+            title=validate_title(str(operation.get("title", ""))),
+            description=str(operation.get("description", "")).strip(),
+        )
+        return {"ok": True, "task": storage.add(task).to_dict()}
+
+    if not isinstance(operation.get("id"), int):
+        raise ValidationError("Operation requires an integer 'id'")
+    task_id = operation["id"]
+
+    if op == "update":
+        title = operation.get("title")
+        description = operation.get("description")
+        if title is None and description is None:
+            raise ValidationError("Update requires 'title' or 'description'")
+        task = storage.update(
+            task_id,
+            title=validate_title(str(title)) if title is not None else None,
+            description=str(description).strip() if description is not None else None,
+        )
+        return {"ok": True, "task": task.to_dict()}
+    if op == "toggle":
+        return {"ok": True, "task": storage.toggle_status(task_id).to_dict()}
+    if op == "delete":
+        storage.delete(task_id)
+        return {"ok": True, "id": task_id}
+    raise ValidationError(
+        f"Unknown op '{op}'. Use 'add', 'update', 'toggle' or 'delete'."
+    )
+
+
+def apply_batch(storage: Any, operations: List[Any]) -> List[Dict[str, Any]]:
+    """Apply a list of task operations with a single persist.
+
+    Operations run in order inside ``storage.batch()``. A failing operation
+    does not stop the others; its result carries the error instead.
+
+    Args:
+        storage: The storage to mutate.
+        operations: Operation objects, each with an 'op' field of 'add',
+                    'update', 'toggle' or 'delete'.
+
+    Returns:
+        One result object per operation, in the same order.
+
+    Raises:
+        ValidationError: If the batch is not a list or is too large.
+    """
+    if not isinstance(operations, list):
+        raise ValidationError("'operations' must be a list")
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise ValidationError(
+            f"A batch may contain at most {MAX_BATCH_OPERATIONS} operations"
+        )
+
+    results = []
+    with storage.batch():
+        for operation in operations:
+            try:
+                if not isinstance(operation, dict):
+                    raise ValidationError("Each operation must be an object")
+                results.append(_apply_operation(storage, operation))
+            except (TaskNotFoundError, ValidationError) as e:
+                results.append({"ok": False, "error": e.message})
+    return results
@@ -1,14 +1,46 @@
 """Command handlers for the Todo CLI application.
 
 This package contains the implementation of all CLI commands.
-Each command is implemented in its own module.
+Each command is implemented in its own module, which is only imported when
+its handler is first looked up, so dispatching one command does not pay for
+the others.
 """
 
-from todo.commands.add import add_task
-from todo.commands.delete import delete_task
-from todo.commands.list import list_tasks
-from todo.commands.toggle import toggle_status
-from todo.commands.update import update_task
+import importlib
+from typing import Any
+
+# Command handlers re-exported from this package, by defining module
+_HANDLERS = {
+    "add_task": "todo.commands.add",
+    "list_tasks": "todo.commands.list",
+    "update_task": "todo.commands.update",
+    "delete_task": "todo.commands.delete",
+    "toggle_status": "todo.commands.toggle",
+    "import_tasks": "todo.commands.import_tasks",
+    "export_tasks": "todo.commands.export_tasks",
+    "search_tasks": "todo.commands.search",
+    "clear_tasks": "todo.commands.clear",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command handler's module on first access.
+
+    Args:
+        name: The handler being looked up.
+
+    Returns:
+        The command handler function.
+
+    Raises:
+        AttributeError: If there is no such handler.
+    """
+    if name not in _HANDLERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    handler = getattr(importlib.import_module(_HANDLERS[name]), name)
+    globals()[name] = handler
+    return handler
+
 
 __all__ = [
     "add_task",
@@ -16,4 +48,8 @@ __all__ = [
     "update_task",
     "delete_task",
     "toggle_status",
+    "import_tasks",
+    "export_tasks",
+    "search_tasks",
+    "clear_tasks",
 ]
@@ -0,0 +1,61 @@
+"""Clear command implementation for the Todo CLI application.
+
+This module provides the functionality to remove every completed task at
+once. The tasks are deleted in a single pass and persisted with one write,
+however many there are.
+"""
+
+import sys
+
+from todo.models import TaskStatus
+from todo.storage import storage
+
+
+def confirm_clear(count: int) -> bool:
+    """Prompt user to confirm clearing completed tasks.
+
+    Args:
+        count: The number of tasks that would be deleted.
+
+    Returns:
+        True if user confirms, False otherwise.
+    """
+    while True:
+        response = input(f"Delete {count} completed task(s)? [y/N]: ").strip().lower()
+        if response in ("y", "yes"):
+            return True
+        if response in ("n", "no", ""):
+            return False
+        print("Please enter 'y' or 'n': ", end="")
+
+
+def clear_tasks(completed: bool = False, force: bool = False) -> None:
+    """Delete every completed task.
+
+    By default, prompts for confirmation before deletion.
+    Use force=True to skip the confirmation prompt.
+
+    Args:
+        completed: Must be True; clearing is limited to completed tasks.
+        force: If True, skip confirmation prompt.
+
+    Raises:
+        SystemExit: If completed is not set.
+    """
+    if not completed:
+        print("Error: Nothing to clear. Use --completed to delete completed tasks")
+        sys.exit(1)
+
+    count = storage.counts()[TaskStatus.COMPLETE]
+    if count == 0:
+        print("No completed tasks to clear.")
+        return
+
+    if not force and not confirm_clear(count):
+        print("Clear cancelled.")
+        return
+
+    # IDs come from the status index, so no task other than these is read
+    ids = [task.id for task in storage.iter_tasks(TaskStatus.COMPLETE)]
+    deleted = storage.delete_many(ids)
+    print(f"Cleared {len(deleted)} completed task(s)!")
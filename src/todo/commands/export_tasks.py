@@ -0,0 +1,151 @@
+"""Export command implementation for the Todo CLI application.
+
+This module provides the functionality to dump tasks as NDJSON, CSV, TSV
+or a JSON array. Tasks are pulled from storage with a generator and written one
+at a time, so memory use does not grow with the number of tasks exported.
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, TextIO
+
+from todo.models import Task, TaskStatus
+from todo.storage import storage
+
+# Column order of CSV exports, compatible with 'todo import'
+CSV_FIELDS = ["id", "title", "description", "status", "created_at"]
+
+# Characters escaped in TSV fields so each task stays on one line
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _write_ndjson(tasks: Iterable[Task], out: TextIO) -> int:
+    """Write one compact JSON object per line.
+
+    Args:
+        tasks: The tasks to write.
+        out: Destination text stream.
+
+    Returns:
+        The number of tasks written.
+    """
+    count = 0
+    for task in tasks:
+        out.write(json.dumps(task.to_dict(), ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _write_csv(tasks: Iterable[Task], out: TextIO) -> int:
+    """Write a header row followed by one CSV record per task.
+
+    Args:
+        tasks: The tasks to write.
+        out: Destination text stream.
+
+    Returns:
+        The number of tasks written.
+    """
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    count = 0
+    for task in tasks:
+        writer.writerow(task.to_dict())
+        count += 1
+    return count
+
+
+def _write_json(tasks: Iterable[Task], out: TextIO) -> int:
+    """Write a JSON array, emitting each element as soon as it is encoded.
+
+    Args:
+        tasks: The tasks to write.
+        out: Destination text stream.
+
+    Returns:
+        The number of tasks written.
+    """
+    count = 0
+    out.write("[")
+    for task in tasks:
+        out.write(",\n  " if count else "\n  ")
+        out.write(json.dumps(task.to_dict(), ensure_ascii=False))
+        count += 1
+    out.write("\n]\n" if count else "]\n")
+    return count
+
+
+def _write_tsv(tasks: Iterable[Task], out: TextIO) -> int:
+    """Write a header line followed by one tab-separated line per task.
+
+    Backslashes, tabs and line breaks inside fields are escaped with a
+    backslash, as in ``\\t``, so every task is exactly one line.
+
+    Args:
+        tasks: The tasks to write.
+        out: Destination text stream.
+
+    Returns:
+        The number of tasks written.
+    """
+    out.write("\t".join(CSV_FIELDS) + "\n")
+    count = 0
+    for task in tasks:
+        out.write(
+            f"{task.id}\t{task.title.translate(_TSV_ESCAPES)}\t"
+            f"{task.description.translate(_TSV_ESCAPES)}\t{task.status}\t"
+            f"{task.created_at.isoformat()}\n"
+        )
+        count += 1
+    return count
+
+
+# Output writers by format name, shared with 'todo list --output'
+WRITERS = {
+    "ndjson": _write_ndjson,
+    "csv": _write_csv,
+    "json": _write_json,
+    "tsv": _write_tsv,
+}
+
+
+def export_tasks(
+    fmt: str = "ndjson",
+    status: str | None = None,
+    output: str | None = None,
+) -> None:
+    """Export tasks as NDJSON, CSV, TSV or a JSON array.
+
+    Args:
+        fmt: Output format ('ndjson', 'csv', 'tsv' or 'json').
+        status: Optional filter ('complete' or 'incomplete').
+        output: File to write to. If None or '-', tasks are written to
+                standard output.
+
+    Raises:
+        SystemExit: If the format or status is invalid or the output file
+                    cannot be written.
+    """
+    writer = WRITERS.get(fmt)
+    if writer is None:
+        print("Error: Invalid format. Use 'ndjson', 'csv', 'tsv' or 'json'")
+        sys.exit(1)
+    if status is not None and not TaskStatus.is_valid(status):
+        print("Error: Invalid status. Use 'complete' or 'incomplete'")
+        sys.exit(1)
+
+    tasks = storage.iter_tasks(status)
+    if output is None or output == "-":
+        writer(tasks, sys.stdout)
+        return
+
+    try:
+        with Path(output).open("w", encoding="utf-8", newline="") as out:
+            count = writer(tasks, out)
+    except OSError as e:
+        print(f"Error: Cannot write '{output}': {e.strerror}")
+        sys.exit(1)
+    print(f"Exported {count} task(s) to {output}")
@@ -0,0 +1,237 @@
+"""Import command implementation for the Todo CLI application.
+
+This module provides the functionality to bulk-load tasks from JSONL or
+CSV input. Rows are streamed from the input, validated (in worker
+processes for large inputs) and committed to storage with a single save.
+"""
+
+import csv
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from todo.exceptions import EmptyTitleError
+from todo.models import Task, TaskStatus
+from todo.utils import validate_title
+
+# Rows handed to a validation worker at a time
+_CHUNK_SIZE = 5000
+
+# Maximum number of skipped rows reported individually
+_MAX_REPORTED_ERRORS = 10
+
+# A parsed input row: (line number, title, description, status)
+Row = tuple[int, str, str, str]
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[Row | tuple[int, str]]:
+    """Parse JSON Lines input one line at a time.
+
+    Args:
+        stream: Text stream with one JSON object per line.
+
+    Yields:
+        A row for each parsed object, or (line number, error) for bad lines.
+    """
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            yield (line_no, "Invalid JSON")
+            continue
+        if not isinstance(data, dict):
+            yield (line_no, "Expected a JSON object")
+            continue
+        title = data.get("title")
+        if title is None:
+            title = ""
+        elif not isinstance(title, str):
+            yield (line_no, "Title must be a string")
+            continue
+        yield (
+            line_no,
+            title,
+            str(data.get("description", "") or ""),
+            str(data.get("status", "") or ""),
+        )
+
+
+def _read_csv(stream: TextIO) -> Iterator[Row]:
+    """Parse CSV input with a header row one record at a time.
+
+    Args:
+        stream: Text stream with 'title', 'description' and 'status' columns.
+
+    Yields:
+        A row for each CSV record.
+    """
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield (
+            reader.line_num,
+            record.get("title") or "",
+            record.get("description") or "",
+            record.get("status") or "",
+        )
+
+
+def _validate_chunk(
+    rows: list[Row | tuple[int, str]],
+) -> tuple[list[tuple[str, str, str]], list[tuple[int, str]]]:
+    """Validate a chunk of parsed rows.
+
+    Runs in a worker process for large inputs, so it only takes and returns
+    plain tuples.
+
+    Args:
+        rows: Parsed rows, possibly including (line number, error) entries.
+
+    Returns:
+        The cleaned (title, description, status) values and the
+        (line number, error) pairs for rejected rows.
+    """
+    valid = []
+    errors = []
+    for row in rows:
+        if len(row) == 2:
+            errors.append(row)
+            continue
+        line_no, title, description, status = row
+        try:
+            cleaned_title = validate_title(title)
+        except EmptyTitleError as e:
+            errors.append((line_no, e.message))
+            continue
+        if status and not TaskStatus.is_valid(status):
+            errors.append((line_no, f"Invalid status '{status}'"))
+            continue
+        valid.append(
+            (cleaned_title, description.strip(), status or TaskStatus.INCOMPLETE)
+        )
+    return valid, errors
+
+
+def _chunked(rows: Iterable[Row], size: int) -> Iterator[list[Row]]:
+    """Split a row stream into lists of at most ``size`` rows.
+
+    Args:
+        rows: The rows to split.
+        size: Maximum rows per chunk.
+
+    Yields:
+        Consecutive chunks of rows.
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _validate_all(
+    rows: Iterable[Row],
+) -> Iterator[tuple[list[tuple[str, str, str]], list[tuple[int, str]]]]:
+    """Validate rows, fanning out to worker processes for large inputs.
+
+    Inputs that fit in a single chunk are validated in-process, since
+    starting workers would cost more than the validation itself.
+
+    Args:
+        rows: The parsed input rows.
+
+    Yields:
+        Validation results per chunk, in input order.
+    """
+    chunks = _chunked(rows, _CHUNK_SIZE)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None:
+        yield _validate_chunk(first)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_validate_chunk, chain([first, second], chunks))
+
+
+def import_tasks(source: str, fmt: str | None = None) -> None:
+    """Import tasks from a JSONL or CSV file.
+
+    Each input row becomes a new task with a freshly assigned ID. Rows with
+    an empty or non-string title or an invalid status are skipped and
+    reported. All accepted tasks are committed with a single save.
+
+    Args:
+        source: Path to the input file, or '-' to read standard input.
+        fmt: Input format ('jsonl' or 'csv'). If None, it is inferred from
+             the file extension, defaulting to 'jsonl'.
+
+    Raises:
+        SystemExit: If the format is invalid, or the file cannot be read or
+                    is not valid UTF-8.
+    """
+    if fmt is None:
+        fmt = "csv" if source.lower().endswith(".csv") else "jsonl"
+    if fmt not in ("jsonl", "csv"):
+        print("Error: Invalid format. Use 'jsonl' or 'csv'")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    if source == "-":
+        # Decode strictly; the default stdin may escape invalid bytes instead
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    else:
+        try:
+            stream = Path(source).open("r", encoding="utf-8", newline="")
+        except OSError as e:
+            print(f"Error: Cannot read '{source}': {e.strerror}")
+            sys.exit(1)
+
+    tasks: list[Task] = []
+    errors: list[tuple[int, str]] = []
+    try:
+        rows = _read_csv(stream) if fmt == "csv" else _read_jsonl(stream)
+        for valid, chunk_errors in _validate_all(rows):
+            errors.extend(chunk_errors)
+            tasks.extend(
+                Task(id=0, title=title, description=description, status=status)
+                for title, description, status in valid
+            )
+    except UnicodeDecodeError:
+        # Nothing has been stored yet, so the import is cleanly abandoned
+        print(f"Error: Cannot read '{source}': not valid UTF-8 text")
+        sys.exit(1)
+    except OSError as e:
+        print(f"Error: Cannot read '{source}': {e.strerror}")
+        sys.exit(1)
+    finally:
+        if source == "-":
+            # Leave standard input itself open
+            stream.detach()
+        else:
+            stream.close()
+
+    # Imported here rather than at module level: validation workers started
+    # with spawn or forkserver re-import this module, and must not each open
+    # the data store
+    from todo.storage import storage
+
+    storage.add_many(tasks)
+    elapsed = time.perf_counter() - started
+
+    for line_no, message in errors[:_MAX_REPORTED_ERRORS]:
+        print(f"Skipped line {line_no}: {message}")
+    if len(errors) > _MAX_REPORTED_ERRORS:
+        print(f"... and {len(errors) - _MAX_REPORTED_ERRORS} more skipped line(s)")
+
+    rate = len(tasks) / elapsed if elapsed > 0 else float(len(tasks))
+    print(
+        f"Imported {len(tasks)} task(s), skipped {len(errors)} "
+        f"in {elapsed:.2f}s ({rate:,.0f} tasks/s)"
+    )
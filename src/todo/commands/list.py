@@ -1,37 +1,69 @@
 """List command implementation for the Todo CLI application.
 
-This module provides the functionality to list and filter tasks.
+This module provides the functionality to list, filter and sort tasks,
+either as a table streamed to the terminal row by row or in a plain format
+for scripts.
 """
 
 import sys
 
+from todo import profiling
+from todo.commands.export_tasks import WRITERS
 from todo.models import TaskStatus
 from todo.storage import storage
-from todo.utils import format_table, truncate_text
+from todo.storage.index import SORT_KEYS
+from todo.utils import truncate_text, write_table
 
+# Output formats; all but 'table' are for scripts and skip table formatting
+OUTPUT_FORMATS = ["table", "json", "ndjson", "tsv"]
 
-def list_tasks(status: str | None = None) -> None:
+
+def list_tasks(
+    status: str | None = None,
+    sort: str = "id",
+    reverse: bool = False,
+    limit: int | None = None,
+    output: str = "table",
+) -> None:
     """List all tasks or filter by status.
 
     Displays tasks in a formatted table with ID, title, status, and description.
-    Supports filtering by 'complete' or 'incomplete' status.
+    Supports filtering by 'complete' or 'incomplete' status, sorting, and
+    showing only the first few tasks of the sort order. The other output
+    formats write just the tasks, without messages or a summary.
 
     Args:
         status: Optional filter ('complete' or 'incomplete').
                 If None, all tasks are displayed.
+        sort: Sort order: 'id', 'created', 'title' or 'status'.
+        reverse: If True, list in descending order.
+        limit: Maximum number of tasks to show, or None for all.
+        output: 'table', or 'json', 'ndjson' or 'tsv' for scripting.
 
     Raises:
-        SystemExit: If an invalid status filter is provided.
+        SystemExit: If the status filter, sort order, limit or output format
+                    is invalid.
     """
-    if status is not None:
-        if not TaskStatus.is_valid(status):
-            print("Error: Invalid status filter. Use 'complete' or 'incomplete'")
-            sys.exit(1)
-        tasks = storage.get_by_status(status)
-        filter_msg = f" (filtered: {status})"
-    else:
-        tasks = storage.get_all()
-        filter_msg = ""
+    if status is not None and not TaskStatus.is_valid(status):
+        print("Error: Invalid status filter. Use 'complete' or 'incomplete'")
+        sys.exit(1)
+    if sort not in SORT_KEYS:
+        print("Error: Invalid sort order. Use 'id', 'created', 'title' or 'status'")
+        sys.exit(1)
+    if limit is not None and limit < 1:
+        print("Error: Limit must be a positive number")
+        sys.exit(1)
+    if output not in OUTPUT_FORMATS:
+        print("Error: Invalid output format. Use 'table', 'json', 'ndjson' or 'tsv'")
+        sys.exit(1)
+
+    tasks = storage.get_sorted(sort, reverse, limit, status)
+    if output != "table":
+        with profiling.phase("render"):
+            WRITERS[output](tasks, sys.stdout)
+        return
+
+    filter_msg = f" (filtered: {status})" if status else ""
 
     if not tasks:
         if status:
@@ -41,24 +73,28 @@ def list_tasks(status: str | None = None) -> None:
             print("\nUse 'todo add <title>' to create your first task.")
         return
 
-    headers = ["ID", "Title", "Status", "Description"]
-    rows = []
-
-    for task in tasks:
-        rows.append([
-            str(task.id),  # Convert numeric ID to string for display
-            truncate_text(task.title, 20),
-            task.status,
-            truncate_text(task.description, 25) if task.description else "",
-        ])
-
-    print(format_table(headers, rows, col_widths=[12, 20, 10, 25]))
-
-    complete_count = sum(1 for t in tasks if t.status == TaskStatus.COMPLETE)
-    incomplete_count = len(tasks) - complete_count
+    with profiling.phase("render"):
+        headers = ["ID", "Title", "Status", "Description"]
+        # Rows are formatted and written one at a time, never all held at once
+        rows = (
+            [
+                str(task.id),  # Convert numeric ID to string for display
+                truncate_text(task.title, 20),
+                task.status,
+                truncate_text(task.description, 25) if task.description else "",
+            ]
+            for task in tasks
+        )
+        write_table(headers, rows, sys.stdout, col_widths=[12, 20, 10, 25])
 
-    print(f"\nTotal: {len(tasks)} task(s){filter_msg}", end="")
+    counts = storage.counts()
+    matched = counts[status] if status else counts["total"]
+    shown = f"{len(tasks)} of {matched}" if len(tasks) < matched else len(tasks)
+    print(f"\nTotal: {shown} task(s){filter_msg}", end="")
     if not status:
-        print(f" ({complete_count} complete, {incomplete_count} incomplete)")
+        print(
+            f" ({counts[TaskStatus.COMPLETE]} complete, "
+            f"{counts[TaskStatus.INCOMPLETE]} incomplete)"
+        )
     else:
         print()
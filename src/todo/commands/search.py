@@ -0,0 +1,53 @@
+"""Search command implementation for the Todo CLI application.
+
+This module provides the functionality to find tasks by words in their
+title or description, using the storage's full-text index.
+"""
+
+import sys
+
+from todo import profiling
+from todo.storage import storage
+from todo.utils import format_table, truncate_text
+
+
+def search_tasks(query: str, limit: int = 20) -> None:
+    """Search tasks and display the best matches.
+
+    A task matches when its title or description contains every word of
+    the query, ignoring case and punctuation. Matches in the title rank
+    above matches in the description.
+
+    Args:
+        query: The words to search for.
+        limit: Maximum number of matches to display.
+
+    Raises:
+        SystemExit: If the query has no words or the limit is not positive.
+    """
+    if not query.strip():
+        print("Error: Search query cannot be empty")
+        sys.exit(1)
+    if limit < 1:
+        print("Error: Limit must be a positive number")
+        sys.exit(1)
+
+    tasks = storage.search(query, limit)
+    if not tasks:
+        print(f"No tasks found matching: {query}")
+        return
+
+    with profiling.phase("render"):
+        headers = ["ID", "Title", "Status", "Description"]
+        rows = [
+            [
+                str(task.id),
+                truncate_text(task.title, 20),
+                task.status,
+                truncate_text(task.description, 25) if task.description else "",
+            ]
+            for task in tasks
+        ]
+
+        print(format_table(headers, rows, col_widths=[12, 20, 10, 25]))
+    print(f"\nFound {len(tasks)} task(s) matching: {query}")
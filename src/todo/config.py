@@ -0,0 +1,115 @@
+"""Runtime configuration for the Todo CLI application.
+
+This module reads storage settings from environment variables so each
+deployment can tune persistence behaviour without code changes.
+"""
+
+import os
+from dataclasses import dataclass
+
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset.
+
+    Returns:
+        True if the variable is set to a truthy value, False otherwise.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float from the environment, falling back on invalid input.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset or invalid.
+
+    Returns:
+        The parsed float value.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment, falling back on invalid input.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is unset or invalid.
+
+    Returns:
+        The parsed integer value.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    """Settings controlling how tasks are persisted.
+
+    Attributes:
+        backend: Storage backend, 'json', 'sqlite' or 'binary' (TODO_BACKEND).
+        data_file: Path of the JSON data file (TODO_DATA_FILE).
+        sqlite_file: Path of the SQLite database (TODO_SQLITE_FILE).
+        binary_file: Path of the memory-mapped binary file (TODO_BINARY_FILE).
+        journal: If True, mutations are appended to a journal file instead
+            of rewriting the whole data file (TODO_JOURNAL).
+        compact_ratio: Journal records allowed per stored task before the
+            journal is folded back into the snapshot (TODO_COMPACT_RATIO).
+        durability: How far writes are pushed to disk before returning:
+            'none', 'flush', 'fsync' or 'fsync+dir' (TODO_DURABILITY).
+        codec: Format of the JSON data file: 'pretty', 'compact', 'ndjson'
+            or 'orjson' (TODO_CODEC).
+        changelog_size: Recent task changes the JSON backend keeps for
+            incremental sync (TODO_CHANGELOG_SIZE).
+    """
+
+    backend: str = "json"
+    data_file: str = "todos.json"
+    sqlite_file: str = "todos.db"
+    binary_file: str = "todos.bin"
+    journal: bool = False
+    compact_ratio: float = 1.0
+    durability: str = "flush"
+    codec: str = "compact"
+    changelog_size: int = 1000
+
+
+def load_settings() -> StorageSettings:
+    """Build storage settings from the current environment.
+
+    Returns:
+        The storage settings for this process.
+    """
+    return StorageSettings(
+        backend=os.environ.get("TODO_BACKEND", "json").strip().lower(),
+        data_file=os.environ.get("TODO_DATA_FILE", "todos.json"),
+        sqlite_file=os.environ.get("TODO_SQLITE_FILE", "todos.db"),
+        binary_file=os.environ.get("TODO_BINARY_FILE", "todos.bin"),
+        journal=_env_bool("TODO_JOURNAL", False),
+        compact_ratio=_env_float("TODO_COMPACT_RATIO", 1.0),
+        durability=os.environ.get("TODO_DURABILITY", "flush").strip().lower(),
+        codec=os.environ.get("TODO_CODEC", "compact").strip().lower(),
+        changelog_size=_env_int("TODO_CHANGELOG_SIZE", 1000),
+    )
@@ -1,18 +1,24 @@
 """Main CLI entry point for the Todo application.
 
 This module defines the Typer application and wires up all commands.
+Command modules, and through them the storage, are imported inside each
+command function, so ``--version`` and ``--help`` never load tasks.
+
+The global ``--profile`` option reports how long each phase of a command
+took: startup, importing the command, loading the storage, the command
+itself, persisting changes and rendering output.
 """
 
+import sys
+import time
 from typing import Annotated, Optional
 
-import typer
+# Taken before importing Typer, so --profile can report the CLI's own startup
+_STARTED = time.perf_counter()
+
+import typer  # noqa: E402
 
-from todo import __app_name__, __version__
-from todo.commands.add import add_task
-from todo.commands.delete import delete_task
-from todo.commands.list import list_tasks
-from todo.commands.toggle import toggle_status
-from todo.commands.update import update_task
+from todo import __app_name__, __version__, profiling  # noqa: E402
 
 app = typer.Typer(
     name="todo",
@@ -28,8 +34,45 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def start_profile(ctx: typer.Context, stats_file: str | None) -> None:
+    """Time the phases of the dispatched command and report them on exit.
+
+    The report goes to stderr, so it never mixes with the command's output.
+    With a stats file the command also runs under cProfile, which slows it
+    down, and the hottest functions are listed after the phases.
+
+    Args:
+        ctx: The context of the top-level command.
+        stats_file: Optional path to write cProfile statistics to.
+    """
+    timer = profiling.start(_STARTED)
+    timer.charge("startup", time.perf_counter() - _STARTED)
+    profiler = None
+    if stats_file:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def report() -> None:
+        if profiler is not None:
+            profiler.disable()
+        profiling.stop()
+        print(timer.report(), file=sys.stderr)
+        if profiler is not None:
+            import pstats
+
+            profiler.dump_stats(stats_file)
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats("tottime").print_stats(10)
+            print(f"Profile written to {stats_file}", file=sys.stderr)
+
+    ctx.call_on_close(report)
+
+
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Annotated[
         Optional[bool],
         typer.Option(
@@ -40,9 +83,25 @@ def main(
             is_eager=True,
         ),
     ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Report where the command spends its time on stderr.",
+        ),
+    ] = False,
+    profile_output: Annotated[
+        Optional[str],
+        typer.Option(
+            "--profile-output",
+            metavar="FILE",
+            help="Also write cProfile statistics to this .pstats file.",
+        ),
+    ] = None,
 ) -> None:
     """Todo CLI - Manage your tasks from the command line."""
-    pass
+    if profile or profile_output:
+        start_profile(ctx, profile_output)
 
 
 @app.command()
@@ -58,6 +117,9 @@ def add(
     ] = "",
 ) -> None:
     """Add a new task to your todo list."""
+    with profiling.phase("import"):
+        from todo.commands.add import add_task
+
     add_task(title, description)
 
 
@@ -71,9 +133,42 @@ def list_cmd(
             help="Filter by status: 'complete' or 'incomplete'",
         ),
     ] = None,
+    sort: Annotated[
+        str,
+        typer.Option(
+            "--sort",
+            help="Sort by 'id', 'created', 'title' or 'status'",
+        ),
+    ] = "id",
+    reverse: Annotated[
+        bool,
+        typer.Option(
+            "--reverse",
+            "-r",
+            help="List in descending order",
+        ),
+    ] = False,
+    limit: Annotated[
+        Optional[int],
+        typer.Option(
+            "--limit",
+            "-n",
+            help="Show only the first N tasks of the sort order",
+        ),
+    ] = None,
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            help="Output format: 'table', or 'json', 'ndjson' or 'tsv' for scripts",
+        ),
+    ] = "table",
 ) -> None:
     """List all tasks or filter by status."""
-    list_tasks(status)
+    with profiling.phase("import"):
+        from todo.commands.list import list_tasks
+
+    list_tasks(status, sort, reverse, limit, output)
 
 
 @app.command()
@@ -97,6 +192,9 @@ def update(
     ] = None,
 ) -> None:
     """Update an existing task's title or description."""
+    with profiling.phase("import"):
+        from todo.commands.update import update_task
+
     update_task(task_id, title, description)
 
 
@@ -113,6 +211,9 @@ def delete(
     ] = False,
 ) -> None:
     """Delete a task from your todo list."""
+    with profiling.phase("import"):
+        from todo.commands.delete import delete_task
+
     delete_task(task_id, force)
 
 
@@ -121,8 +222,110 @@ def toggle(
     task_id: Annotated[str, typer.Argument(help="The task ID to toggle")],
 ) -> None:
     """Toggle a task's status between complete and incomplete."""
+    with profiling.phase("import"):
+        from todo.commands.toggle import toggle_status
+
     toggle_status(task_id)
 
 
+@app.command()
+def clear(
+    completed: Annotated[
+        bool,
+        typer.Option(
+            "--completed",
+            help="Delete every completed task",
+        ),
+    ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            "-f",
+            help="Skip confirmation prompt",
+        ),
+    ] = False,
+) -> None:
+    """Delete completed tasks in one go."""
+    with profiling.phase("import"):
+        from todo.commands.clear import clear_tasks
+
+    clear_tasks(completed, force)
+
+
+@app.command()
+def search(
+    query: Annotated[str, typer.Argument(help="Words to search for")],
+    limit: Annotated[
+        int,
+        typer.Option(
+            "--limit",
+            "-n",
+            help="Maximum number of matches to show",
+        ),
+    ] = 20,
+) -> None:
+    """Search task titles and descriptions."""
+    with profiling.phase("import"):
+        from todo.commands.search import search_tasks
+
+    search_tasks(query, limit)
+
+
+@app.command(name="import")
+def import_cmd(
+    source: Annotated[
+        str, typer.Argument(help="JSONL or CSV file to import, or '-' for stdin")
+    ],
+    fmt: Annotated[
+        Optional[str],
+        typer.Option(
+            "--format",
+            "-F",
+            help="Input format: 'jsonl' or 'csv' (default: from file extension)",
+        ),
+    ] = None,
+) -> None:
+    """Bulk-import tasks from a JSONL or CSV file."""
+    with profiling.phase("import"):
+        from todo.commands.import_tasks import import_tasks
+
+    import_tasks(source, fmt)
+
+
+@app.command(name="export")
+def export_cmd(
+    fmt: Annotated[
+        str,
+        typer.Option(
+            "--format",
+            "-F",
+            help="Output format: 'ndjson', 'csv', 'tsv' or 'json'",
+        ),
+    ] = "ndjson",
+    status: Annotated[
+        Optional[str],
+        typer.Option(
+            "--status",
+            "-s",
+            help="Filter by status: 'complete' or 'incomplete'",
+        ),
+    ] = None,
+    output: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output",
+            "-o",
+            help="File to write to (default: standard output)",
+        ),
+    ] = None,
+) -> None:
+    """Export tasks as NDJSON, CSV, TSV or JSON."""
+    with profiling.phase("import"):
+        from todo.commands.export_tasks import export_tasks
+
+    export_tasks(fmt, status, output)
+
+
 if __name__ == "__main__":
     app()
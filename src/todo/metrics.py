@@ -0,0 +1,457 @@
+"""Prometheus-style metrics for the Todo application.
+
+This module provides counters, gauges and histograms that render in the
+Prometheus text exposition format, plus the metrics the storage layer and
+the web apps record. It has no dependencies, so the storage can record
+metrics unconditionally and any app can serve ``REGISTRY.render()`` on a
+``/metrics`` endpoint.
+"""
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+# Content type of the text exposition format rendered by Registry.render()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket bounds in seconds, from sub-millisecond in-memory
+# operations up to full rewrites of large data files
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus parses it.
+
+    Args:
+        value: The sample value.
+
+    Returns:
+        The value as text, with infinities spelled '+Inf' and '-Inf'.
+    """
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format.
+
+    Args:
+        value: The raw label value.
+
+    Returns:
+        The value with backslashes, quotes and newlines escaped.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render a label set, e.g. ``{op="add"}``.
+
+    Args:
+        names: Label names.
+        values: Label values, in the same order.
+
+    Returns:
+        The rendered label set, or an empty string if there are no labels.
+    """
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class holding a metric's name, help text and label names.
+
+    Attributes:
+        name: The metric name.
+        help: One-line description shown in the HELP comment.
+        labelnames: Names of the labels every sample carries.
+        _lock: Private lock guarding the sample values.
+        _functions: Private callbacks computing values at render time.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize a metric with no samples.
+
+        Args:
+            name: The metric name.
+            help: One-line description of the metric.
+            labelnames: Names of the labels every sample carries.
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Order label values by the metric's label names.
+
+        Args:
+            labels: Label values by name.
+
+        Returns:
+            The label values as a tuple.
+
+        Raises:
+            ValueError: If the labels do not match the metric's label names.
+        """
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' takes labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Compute a sample's value by calling a function at render time.
+
+        Args:
+            function: Returns the current value.
+            **labels: The sample's label values.
+        """
+        with self._lock:
+            self._functions[self._key(labels)] = function
+
+    def _samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Collect the metric's samples.
+
+        Returns:
+            (name suffix, label values, value) tuples.
+        """
+        return [("", key, function()) for key, function in self._functions.items()]
+
+    def render(self) -> List[str]:
+        """Render the metric in the text exposition format.
+
+        Returns:
+            The HELP and TYPE comments followed by one line per sample.
+        """
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, value in self._samples():
+            labels = _format_labels(self._sample_labelnames(suffix), key)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+    def _sample_labelnames(self, suffix: str) -> Tuple[str, ...]:
+        """Return the label names of samples with the given name suffix.
+
+        Args:
+            suffix: The sample's name suffix.
+
+        Returns:
+            The label names.
+        """
+        return self.labelnames
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, such as operations performed.
+
+    Attributes:
+        _values: Private mapping of label values to the current count.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize a counter with no samples.
+
+        Args:
+            name: The metric name, conventionally ending in '_total'.
+            help: One-line description of the metric.
+            labelnames: Names of the labels every sample carries.
+        """
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the count.
+
+        Args:
+            amount: How much to add; must not be negative.
+            **labels: The sample's label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current count.
+
+        Args:
+            **labels: The sample's label values.
+
+        Returns:
+            The count, or 0 if it was never increased.
+        """
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Collect the recorded counts and computed values."""
+        with self._lock:
+            recorded = [("", key, value) for key, value in self._values.items()]
+        return recorded + super()._samples()
+
+
+class Gauge(Counter):
+    """Value that can go up and down, such as the number of stored tasks."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        """Replace the value.
+
+        Args:
+            value: The new value.
+            **labels: The sample's label values.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, such as operation latencies.
+
+    Attributes:
+        buckets: Upper bounds of the buckets, ascending, ending in +Inf.
+        _counts: Private per-label-set count of observations per bucket.
+        _sums: Private per-label-set sum of observed values.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize a histogram with no observations.
+
+        Args:
+            name: The metric name, conventionally ending in '_seconds'.
+            help: One-line description of the metric.
+            labelnames: Names of the labels every sample carries.
+            buckets: Upper bounds of the buckets; +Inf is appended.
+        """
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: The observed value.
+            **labels: The sample's label values.
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe how long the enclosed block takes, even if it raises.
+
+        Args:
+            **labels: The sample's label values.
+
+        Yields:
+            None.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations.
+
+        Args:
+            **labels: The sample's label values.
+
+        Returns:
+            The number of observations, or 0 if there were none.
+        """
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def _samples(self) -> List[Tuple[str, LabelValues, float]]:
+        """Collect cumulative bucket counts, the sum and the count."""
+        samples = []
+        with self._lock:
+            for key, counts in self._counts.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    le = (_format_value(bound),)
+                    samples.append(("_bucket", key + le, cumulative))
+                samples.append(("_sum", key, self._sums[key]))
+                samples.append(("_count", key, cumulative))
+        return samples
+
+    def _sample_labelnames(self, suffix: str) -> Tuple[str, ...]:
+        """Add the 'le' label to bucket samples."""
+        if suffix == "_bucket":
+            return self.labelnames + ("le",)
+        return self.labelnames
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class Registry:
+    """Collection of metrics rendered together.
+
+    Attributes:
+        _metrics: Private mapping of metric name to metric, in the order
+            they were registered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        """Add a metric to the registry.
+
+        Args:
+            metric: The metric to add.
+
+        Returns:
+            The metric, for chaining.
+
+        Raises:
+            ValueError: If a metric with the same name is registered.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every registered metric in the text exposition format.
+
+        Returns:
+            The exposition text, ending in a newline.
+        """
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Registry served by the web apps' /metrics endpoints
+REGISTRY = Registry()
+
+STORAGE_LOAD_SECONDS = REGISTRY.register(
+    Histogram(
+        "todo_storage_load_seconds",
+        "Time spent loading the data file and replaying the journal.",
+    )
+)
+STORAGE_SAVE_SECONDS = REGISTRY.register(
+    Histogram(
+        "todo_storage_save_seconds",
+        "Time spent writing to disk, by kind of write (snapshot or journal).",
+        ["kind"],
+    )
+)
+STORAGE_MUTATION_SECONDS = REGISTRY.register(
+    Histogram(
+        "todo_storage_mutation_seconds",
+        "Time spent in each storage mutation, including locking and saving.",
+        ["op"],
+    )
+)
+STORAGE_MUTATION_ERRORS = REGISTRY.register(
+    Counter(
+        "todo_storage_mutation_errors_total",
+        "Storage mutations that raised, by operation and exception type.",
+        ["op", "error"],
+    )
+)
+STORAGE_RELOADS = REGISTRY.register(
+    Counter(
+        "todo_storage_reloads_total",
+        "Reloads of the data file after another process changed it.",
+    )
+)
+STORAGE_TASKS = REGISTRY.register(
+    Gauge(
+        "todo_storage_tasks",
+        "Tasks currently stored, by data file and status.",
+        ["file", "status"],
+    )
+)
+STORAGE_FILE_BYTES = REGISTRY.register(
+    Gauge(
+        "todo_storage_file_bytes",
+        "Size of the storage's files on disk, by file name.",
+        ["file"],
+    )
+)
+STORAGE_LOCK_ACQUISITIONS = REGISTRY.register(
+    Counter(
+        "todo_storage_lock_acquisitions_total",
+        "Acquisitions of the inter-process file lock, by data file.",
+        ["file"],
+    )
+)
+STORAGE_LOCK_CONTENDED = REGISTRY.register(
+    Counter(
+        "todo_storage_lock_contended_total",
+        "Lock acquisitions that had to wait for another process, by data file.",
+        ["file"],
+    )
+)
+STORAGE_LOCK_WAIT_SECONDS = REGISTRY.register(
+    Counter(
+        "todo_storage_lock_wait_seconds_total",
+        "Time spent waiting for another process to release the lock.",
+        ["file"],
+    )
+)
+HTTP_REQUEST_SECONDS = REGISTRY.register(
+    Histogram(
+        "todo_http_request_seconds",
+        "Time spent serving HTTP requests, by method, route and status.",
+        ["method", "route", "status"],
+    )
+)
@@ -1,11 +1,33 @@
 """Task model for the Todo CLI application.
 
-This module defines the Task dataclass and TaskStatus constants used
+This module defines the Task class and TaskStatus constants used
 to represent and manage todo items throughout the application.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
+from typing import Any
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a datetime to microseconds since the epoch.
+
+    Naive datetimes are taken as local time, like ``datetime.now()``.
+    Timezone-aware ones are converted to local time first, so they order
+    correctly among the naive timestamps of other tasks.
+
+    Args:
+        value: The datetime to convert.
+
+    Returns:
+        The number of microseconds between the epoch and ``value``.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
 
 
 class TaskStatus:
@@ -46,23 +68,91 @@ class TaskStatus:
         return status in (cls.INCOMPLETE, cls.COMPLETE)
 
 
-@dataclass
 class Task:
     """Represents a todo task.
 
+    Tasks are slotted and keep ``created_at`` as integer microseconds since
+    the epoch, building a datetime only when it is read. Status values are
+    interned, so every task shares the same two strings. Together this keeps
+    large task lists compact in memory.
+
     Attributes:
         id: Unique identifier for the task.
         title: Task title (required, non-empty).
         description: Task description (optional, defaults to empty string).
         status: Task status ('incomplete' or 'complete').
         created_at: Timestamp when the task was created.
+        created_us: Creation time in microseconds since the epoch.
     """
 
-    id: int  # Changed from str to int for numeric IDs
-    title: str
-    description: str = ""
-    status: str = field(default=TaskStatus.INCOMPLETE)
-    created_at: datetime = field(default_factory=datetime.now)
+    __slots__ = ("id", "title", "description", "status", "_created_us")
+
+    def __init__(
+        self,
+        id: int,  # Changed from str to int for numeric IDs
+        title: str,
+        description: str = "",
+        status: str = TaskStatus.INCOMPLETE,
+        created_at: datetime | None = None,
+        *,
+        created_us: int | None = None,
+    ) -> None:
+        """Initialize a task.
+
+        Args:
+            id: Unique identifier for the task.
+            title: Task title.
+            description: Task description.
+            status: Task status ('incomplete' or 'complete').
+            created_at: Creation timestamp. Defaults to now.
+            created_us: Creation time in microseconds since the epoch, used
+                        instead of ``created_at`` by storages that keep raw
+                        timestamps.
+        """
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = sys.intern(status)
+        if created_us is None:
+            created_us = _to_micros(created_at or datetime.now())
+        self._created_us = created_us
+
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp when the task was created."""
+        return _EPOCH + self._created_us * _MICROSECOND
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_us = _to_micros(value)
+
+    @property
+    def created_us(self) -> int:
+        """Creation time in microseconds since the epoch."""
+        return self._created_us
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two tasks field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.title == other.title
+            and self.description == other.description
+            and self.status == other.status
+            and self._created_us == other._created_us
+        )
+
+    # Tasks are mutable, so like the dataclass they replace they are unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return a representation in the style of a dataclass."""
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, "
+            f"description={self.description!r}, status={self.status!r}, "
+            f"created_at={self.created_at!r})"
+        )
 
     def is_complete(self) -> bool:
         """Check if the task is marked as complete.
@@ -71,3 +161,38 @@ class Task:
             True if the task status is 'complete', False otherwise.
         """
         return self.status == TaskStatus.COMPLETE
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the task to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with the task fields, ``created_at`` as an ISO string.
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Task":
+        """Create a task from a dictionary produced by ``to_dict``.
+
+        Args:
+            data: Dictionary with the task fields.
+
+        Returns:
+            The reconstructed task.
+
+        Raises:
+            KeyError: If a required field is missing.
+        """
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            status=data["status"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+        )
@@ -0,0 +1,186 @@
+"""Phase timing for the CLI's ``--profile`` mode.
+
+This module provides a timer that splits a command's run time into named
+phases such as storage load, persist and render. Code marks a phase with
+``with profiling.phase("load"):``; that is a no-op unless ``--profile``
+started the timer, so the markers can stay in hot paths.
+
+Phases nest: time spent in an inner phase is charged to it rather than to
+the phase around it, so the phase totals add up to the wall-clock total.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import IO, Any, ContextManager, Dict, Iterator, List
+
+# Order in which phases are reported; any others follow in first-seen order
+PHASES = ["startup", "import", "load", "command", "persist", "render"]
+
+_active: "PhaseTimer | None" = None
+
+
+class PhaseTimer:
+    """Accumulates exclusive time per phase for one thread.
+
+    Time not inside any phase is charged to the base phase, normally
+    'command', when the report is built.
+
+    Attributes:
+        started: ``time.perf_counter()`` value the run started at.
+        totals: Seconds charged to each phase so far.
+        _thread: Private ID of the thread whose phases are recorded.
+        _stack: Private list of open phases as [name, start, child seconds].
+    """
+
+    def __init__(self, started: float) -> None:
+        """Initialize a timer with no phases recorded.
+
+        Args:
+            started: ``time.perf_counter()`` value the run started at.
+        """
+        self.started = started
+        self.totals: Dict[str, float] = {}
+        self._thread = threading.get_ident()
+        self._stack: List[List[Any]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the enclosed block's time, minus nested phases, to a phase.
+
+        Blocks run by other threads are not recorded.
+
+        Args:
+            name: The phase to charge.
+
+        Yields:
+            None.
+        """
+        if threading.get_ident() != self._thread:
+            yield
+            return
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self.totals[name] = self.totals.get(name, 0.0) + elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def charge(self, name: str, seconds: float) -> None:
+        """Charge time measured elsewhere to a phase.
+
+        Args:
+            name: The phase to charge.
+            seconds: The time to add.
+        """
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+    def report(self, base: str = "command") -> str:
+        """Summarize the phases, charging unattributed time to ``base``.
+
+        Args:
+            base: Phase receiving the time spent outside every phase.
+
+        Returns:
+            A multi-line table of milliseconds and shares per phase.
+        """
+        total = time.perf_counter() - self.started
+        totals = dict(self.totals)
+        totals[base] = totals.get(base, 0.0) + total - sum(self.totals.values())
+        names = [n for n in PHASES if n in totals]
+        names += [n for n in totals if n not in PHASES]
+        lines = [f"Profile: {total * 1000:.1f} ms total"]
+        for name in names:
+            seconds = max(totals[name], 0.0)
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"  {name:<10}{seconds * 1000:>10.1f} ms {share:>5.1f}%")
+        return "\n".join(lines)
+
+
+class TimedStream:
+    """Text stream wrapper charging the time spent writing to 'render'.
+
+    Attributes:
+        _stream: Private wrapped stream.
+    """
+
+    def __init__(self, stream: IO[str]) -> None:
+        """Wrap a stream.
+
+        Args:
+            stream: The stream to forward writes to.
+        """
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        """Write text to the wrapped stream.
+
+        Args:
+            text: The text to write.
+
+        Returns:
+            The number of characters written.
+        """
+        with phase("render"):
+            return self._stream.write(text)
+
+    def flush(self) -> None:
+        """Flush the wrapped stream."""
+        with phase("render"):
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped stream."""
+        return getattr(self._stream, name)
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Mark a block as belonging to a phase while profiling is active.
+
+    Args:
+        name: The phase to charge.
+
+    Returns:
+        A context manager timing the block, or a no-op one when not
+        profiling.
+    """
+    if _active is None:
+        return nullcontext()
+    return _active.phase(name)
+
+
+def start(started: float) -> PhaseTimer:
+    """Start recording phases and timing writes to standard output.
+
+    Args:
+        started: ``time.perf_counter()`` value the run started at.
+
+    Returns:
+        The active timer.
+    """
+    global _active
+    _active = PhaseTimer(started)
+    sys.stdout = TimedStream(sys.stdout)
+    return _active
+
+
+def stop() -> PhaseTimer | None:
+    """Stop recording phases and restore standard output.
+
+    Output still buffered is flushed first, so its cost is counted.
+
+    Returns:
+        The timer that was active, or None if profiling was not started.
+    """
+    global _active
+    timer = _active
+    if isinstance(sys.stdout, TimedStream):
+        sys.stdout.flush()
+        sys.stdout = sys.stdout._stream
+    _active = None
+    return timer
@@ -1,9 +1,114 @@
 """Storage package for the Todo CLI application.
 
 This package contains storage implementations for persisting tasks.
-Currently provides file-based storage with JSON persistence.
+Provides file-based storage with JSON persistence, a SQLite backend and a
+memory-mapped binary backend, selected through the TODO_BACKEND environment
+variable.
+
+Backends are imported, and the module-level ``storage`` is opened, on first
+access, so importing this package never reads the data file.
 """
 
-from todo.storage.file import FileStorage, storage
+import importlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from todo import profiling
+from todo.config import StorageSettings, load_settings
+
+if TYPE_CHECKING:
+    from todo.storage.binary import BinaryStorage
+    from todo.storage.file import FileStorage
+    from todo.storage.sqlite import SqliteStorage
+
+# Backend classes re-exported from this package, by defining module
+_BACKENDS = {
+    "BinaryStorage": "todo.storage.binary",
+    "FileStorage": "todo.storage.file",
+    "SqliteStorage": "todo.storage.sqlite",
+}
+
+
+def open_storage(
+    settings: StorageSettings | None = None,
+) -> "FileStorage | SqliteStorage | BinaryStorage":
+    """Create the storage backend described by the settings.
+
+    Only the selected backend's module is imported.
+
+    Args:
+        settings: Storage settings. Defaults to the current environment.
+
+    Returns:
+        A FileStorage, SqliteStorage or BinaryStorage instance.
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+    """
+    settings = settings or load_settings()
+    if settings.backend == "sqlite":
+        with profiling.phase("import"):
+            from todo.storage.sqlite import SqliteStorage
+
+        return SqliteStorage(
+            Path(settings.sqlite_file),
+            migrate_from=Path(settings.data_file),
+            durability=settings.durability,
+        )
+    if settings.backend == "binary":
+        with profiling.phase("import"):
+            from todo.storage.binary import BinaryStorage
+
+        return BinaryStorage(
+            Path(settings.binary_file),
+            migrate_from=Path(settings.data_file),
+            durability=settings.durability,
+        )
+    if settings.backend == "json":
+        with profiling.phase("import"):
+            from todo.storage.file import FileStorage
+
+        return FileStorage(
+            Path(settings.data_file),
+            journal=settings.journal,
+            compact_ratio=settings.compact_ratio,
+            durability=settings.durability,
+            codec=settings.codec,
+            changelog_size=settings.changelog_size,
+        )
+    raise ValueError(
+        f"Invalid backend '{settings.backend}'. Use 'json', 'sqlite' or 'binary'."
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve backend classes and the shared ``storage`` on first access.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The backend class, or the module-level storage instance.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    if name == "storage":
+        # Module-level storage instance for use throughout the application
+        with profiling.phase("load"):
+            value = open_storage()
+    elif name in _BACKENDS:
+        value = getattr(importlib.import_module(_BACKENDS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-__all__ = ["FileStorage", "storage"]
+__all__ = [
+    "BinaryStorage",
+    "FileStorage",
+    "SqliteStorage",
+    "open_storage",
+    "storage",
+]
@@ -0,0 +1,193 @@
+"""Asynchronous facade over the blocking storage backends.
+
+This module lets async web handlers await storage calls without blocking
+the event loop: file work runs in bounded thread pools, with mutations
+funnelled through a single writer thread so they are applied in order.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+from todo.models import Task
+
+# Storage methods that only read, and may run concurrently with each other
+_READ_METHODS = frozenset(
+    {
+        "get_all",
+        "get_by_id",
+        "get_by_status",
+        "get_sorted",
+        "counts",
+        "page",
+        "search",
+    }
+)
+
+T = TypeVar("T")
+
+
+class AsyncStorage:
+    """Awaitable wrapper running storage calls off the event loop.
+
+    Attributes:
+        _opener: Private callable returning the storage to operate on.
+        _readers: Private thread pool for read-only calls.
+        _writer: Private single-thread pool serializing mutations.
+    """
+
+    def __init__(self, opener: Callable[[], Any], max_readers: int = 4) -> None:
+        """Initialize the async facade.
+
+        Args:
+            opener: Callable returning the storage, invoked inside the worker
+                    thread on every call so any refresh I/O is offloaded too.
+            max_readers: Maximum number of concurrent read calls.
+        """
+        self._opener = opener
+        self._readers = ThreadPoolExecutor(
+            max_workers=max_readers, thread_name_prefix="todo-read"
+        )
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="todo-write"
+        )
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a storage method in a worker thread (blocking).
+
+        Args:
+            method: Name of the storage method to invoke.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Whatever the storage method returns.
+        """
+        return getattr(self._opener(), method)(*args, **kwargs)
+
+    async def _run(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Await a storage method executed in the matching thread pool.
+
+        Args:
+            method: Name of the storage method to invoke.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Whatever the storage method returns.
+        """
+        executor = self._readers if method in _READ_METHODS else self._writer
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self._call, method, *args, **kwargs)
+        )
+
+    async def run(self, fn: Callable[[Any], T], write: bool = False) -> T:
+        """Await an arbitrary function of the storage in a worker thread.
+
+        Args:
+            fn: Function called with the storage as its only argument.
+            write: True if the function mutates the storage, so it runs on
+                   the writer thread.
+
+        Returns:
+            Whatever the function returns.
+        """
+        executor = self._writer if write else self._readers
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, lambda: fn(self._opener()))
+
+    async def get_all(self) -> List[Task]:
+        """Retrieve all tasks from storage."""
+        return await self._run("get_all")
+
+    async def get_by_id(self, task_id: int) -> Task | None:
+        """Retrieve a task by its ID."""
+        return await self._run("get_by_id", task_id)
+
+    async def get_by_status(self, status: str) -> List[Task]:
+        """Retrieve tasks filtered by status."""
+        return await self._run("get_by_status", status)
+
+    async def counts(self) -> Dict[str, int]:
+        """Return task counts per status and in total."""
+        return await self._run("counts")
+
+    async def page(
+        self,
+        limit: int,
+        after: int | None = None,
+        sort: str = "id",
+        reverse: bool = False,
+    ) -> Tuple[List[Task], int | None]:
+        """Retrieve one page of tasks in a sort order."""
+        return await self._run("page", limit, after, sort=sort, reverse=reverse)
+
+    async def get_sorted(
+        self,
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        status: str | None = None,
+    ) -> List[Task]:
+        """Retrieve tasks in a sort order, optionally only the first few."""
+        return await self._run(
+            "get_sorted", sort, reverse, limit=limit, status=status
+        )
+
+    async def search(self, query: str, limit: int | None = None) -> List[Task]:
+        """Find tasks matching a full-text query, best match first.
+
+        Runs in the reader pool: the storages serialize building their
+        index on the first search themselves.
+        """
+        return await self._run("search", query, limit)
+
+    async def add(self, task: Task) -> Task:
+        """Add a new task to storage."""
+        return await self._run("add", task)
+
+    async def update(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+    ) -> Task:
+        """Update an existing task."""
+        return await self._run(
+            "update", task_id, title=title, description=description
+        )
+
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task from storage."""
+        return await self._run("delete", task_id)
+
+    async def toggle_status(self, task_id: int) -> Task:
+        """Toggle a task's status between complete and incomplete."""
+        return await self._run("toggle_status", task_id)
+
+    async def add_many(self, tasks: List[Task]) -> List[Task]:
+        """Add several tasks with a single persist."""
+        return await self._run("add_many", tasks)
+
+    async def delete_many(
+        self,
+        task_ids: List[int] | None = None,
+        predicate: Callable[[Task], bool] | None = None,
+    ) -> List[int]:
+        """Delete tasks chosen by ID and/or predicate with a single persist."""
+        return await self._run("delete_many", task_ids, predicate)
+
+    async def toggle_many(self, task_ids: List[int]) -> List[Task]:
+        """Toggle several tasks with a single persist."""
+        return await self._run("toggle_many", task_ids)
+
+    async def clear(self) -> None:
+        """Remove all tasks from storage."""
+        await self._run("clear")
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once pending calls have finished."""
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
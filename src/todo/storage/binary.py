@@ -0,0 +1,813 @@
+"""Memory-mapped binary storage implementation for the Todo CLI application.
+
+This module provides a storage backend over a compact binary file that is
+memory-mapped instead of parsed. Opening the store only reads a fixed-size
+header; each task is decoded when a command actually touches it, so point
+lookups and toggles start in constant time however many tasks are stored.
+
+File layout (all integers little-endian)::
+
+    header   magic, task count, next ID, offset of the offsets table
+    records  created_at in microseconds since the epoch, title length and
+             description length, followed by the UTF-8 title and description
+    table    one (id, record offset, record length, status) entry per task,
+             sorted by ID
+"""
+
+import mmap
+import os
+import struct
+import time
+import uuid
+import warnings
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Tuple
+
+from todo import profiling
+from todo.exceptions import TaskNotFoundError
+from todo.models import Task, TaskStatus
+from todo.storage.bulk import BulkOperationsMixin
+from todo.storage.codec import read_tasks
+from todo.storage.durability import Durability, atomic_write, sync_handle
+from todo.storage.index import sort_key, top_tasks
+from todo.storage.search import SearchIndex, SearchIndexLog
+from todo.utils import generate_task_id
+
+_MAGIC = b"TODOBIN1"
+
+# magic, task count, next ID, offsets table position
+_HEADER = struct.Struct("<8sQQQ")
+
+# task ID, record offset, record length, status code
+_ENTRY = struct.Struct("<QQIB3x")
+_ENTRY_ID = struct.Struct("<Q")
+
+# Position of the status code within a table entry
+_STATUS_OFFSET = 20
+
+# created_at in microseconds since the epoch, title length, description length
+_RECORD = struct.Struct("<qII")
+
+_STATUS_CODES = {TaskStatus.INCOMPLETE: 0, TaskStatus.COMPLETE: 1}
+_STATUSES = (TaskStatus.INCOMPLETE, TaskStatus.COMPLETE)
+
+
+def _encode_record(task: Task) -> bytes:
+    """Serialize the variable-length fields of a task.
+
+    Args:
+        task: The task to encode.
+
+    Returns:
+        The record bytes as laid out in the data file.
+    """
+    title = task.title.encode("utf-8")
+    description = task.description.encode("utf-8")
+    header = _RECORD.pack(task.created_us, len(title), len(description))
+    return header + title + description
+
+
+class _TableIds:
+    """Read-only sequence of the IDs in a mapped offsets table.
+
+    Entries are unpacked on access, so ``bisect`` can search the table
+    without the IDs ever being loaded into a list.
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, offset: int, count: int) -> None:
+        """Initialize the view.
+
+        Args:
+            buffer: The mapped data file.
+            offset: Position of the offsets table.
+            count: Number of entries in the table.
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        """Return the task ID stored in an entry.
+
+        Args:
+            index: Position of the entry in the table.
+
+        Returns:
+            The entry's task ID.
+        """
+        position = self._offset + index * _ENTRY.size
+        return _ENTRY_ID.unpack_from(self._buffer, position)[0]
+
+
+class BinaryStorage(BulkOperationsMixin):
+    """Memory-mapped binary storage for task management.
+
+    Provides the same CRUD operations as FileStorage. Reads bisect the
+    mapped offsets table and decode only the records they return, and a
+    toggle rewrites the task's status byte in place. Other mutations
+    rewrite the file atomically, copying untouched records byte for byte.
+
+    Attributes:
+        file_path: Path to the binary data file.
+        index_path: Path to the sidecar file holding the search index.
+        durability: Durability policy applied to every write.
+        instance_id: Random token identifying this storage instance.
+        version: Counter bumped on every mutation or reload from disk.
+        _file: Private unbuffered handle of the mapped file.
+        _map: Private memory map of the file, or None if there is none.
+        _count: Private number of tasks in the mapped file.
+        _table: Private position of the offsets table.
+        _ids: Private view of the task IDs in the offsets table.
+        _next_id: The next ID to assign to a new task.
+        _search: Private full-text index, or None until the first search.
+        _index_log: Private recorder persisting search index changes beside
+            the saved index.
+        _signature: Private stat fingerprint of the file as last seen.
+        _batch_depth: Private nesting depth of open ``batch()`` blocks.
+        _pending: Private tasks changed since the file was last written,
+            by ID, with None marking a deleted task.
+    """
+
+    def __init__(
+        self,
+        file_path: Path = None,
+        migrate_from: Path | None = None,
+        durability: str = Durability.FLUSH,
+    ) -> None:
+        """Initialize binary storage.
+
+        Args:
+            file_path: Path to the binary data file.
+                       Defaults to Path("todos.bin") in current directory.
+            migrate_from: Optional JSON data file converted once when the
+                          binary file does not exist yet.
+            durability: One of 'none', 'flush', 'fsync' or 'fsync+dir'.
+
+        Raises:
+            ValueError: If durability is not a known policy.
+        """
+        if not Durability.is_valid(durability):
+            raise ValueError(
+                f"Invalid durability '{durability}'. "
+                "Use 'none', 'flush', 'fsync' or 'fsync+dir'."
+            )
+        self.file_path = file_path or Path("todos.bin")
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self.durability = durability
+        self.instance_id = uuid.uuid4().hex[:12]
+        self.version = 0
+        self._file: IO[bytes] | None = None
+        self._map: mmap.mmap | None = None
+        self._count = 0
+        self._table = _HEADER.size
+        self._ids = _TableIds(b"", 0, 0)
+        self._next_id = 1
+        self._search: SearchIndex | None = None
+        self._index_log = SearchIndexLog(self.index_path)
+        self._signature: tuple = ()
+        self._batch_depth = 0
+        self._pending: Dict[int, Task | None] = {}
+        self._open()
+        if migrate_from is not None:
+            self._migrate_from_json(migrate_from)
+
+    def _open(self) -> None:
+        """Map the data file and read its header, leaving records undecoded."""
+        self._close_map()
+        self._next_id = 1
+        try:
+            self._file = self.file_path.open("r+b", buffering=0)
+        except FileNotFoundError:
+            self._file = None
+        else:
+            if os.fstat(self._file.fileno()).st_size:
+                self._map = mmap.mmap(self._file.fileno(), 0)
+                if not self._read_header():
+                    self._close_map()
+                    self._quarantine_corrupt_file()
+        self._signature = self._file_signature()
+        self.version += 1
+
+    def _read_header(self) -> bool:
+        """Read and check the header of the mapped file.
+
+        Returns:
+            True if the header is valid and the offsets table fits the file.
+        """
+        try:
+            magic, count, next_id, table = _HEADER.unpack_from(self._map)
+        except struct.error:
+            return False
+        if magic != _MAGIC or table + count * _ENTRY.size > len(self._map):
+            return False
+        self._count = count
+        self._table = table
+        self._next_id = next_id
+        self._ids = _TableIds(self._map, table, count)
+        return True
+
+    def _close_map(self) -> None:
+        """Unmap and close the data file, if it is open."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+        self._table = _HEADER.size
+        self._ids = _TableIds(b"", 0, 0)
+
+    def _quarantine_corrupt_file(self) -> None:
+        """Move an unreadable data file aside so it can be recovered by hand."""
+        corrupt_path = self.file_path.with_name(
+            f"{self.file_path.name}.corrupt-{int(time.time())}"
+        )
+        os.replace(self.file_path, corrupt_path)
+        warnings.warn(
+            f"Could not read '{self.file_path}'; moved it to '{corrupt_path}' "
+            "and started with an empty task list.",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+
+    def _migrate_from_json(self, json_path: Path) -> None:
+        """Convert a FileStorage JSON file, once.
+
+        The conversion only runs while the binary file does not exist, so
+        an existing store is never overwritten.
+
+        Args:
+            json_path: Path to the JSON data file.
+        """
+        if self.file_path.exists() or not json_path.exists():
+            return
+        with self.batch():
+            for task in read_tasks(json_path):
+                self.add(task)
+
+    def _file_signature(self) -> tuple:
+        """Fingerprint the data file by inode, size and mtime.
+
+        Returns:
+            A tuple that changes whenever the file is replaced or written.
+        """
+        try:
+            st = self.file_path.stat()
+        except FileNotFoundError:
+            return ()
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def refresh(self) -> bool:
+        """Remap the file if another process replaced it since last seen.
+
+        Returns:
+            True if the file changed and was remapped.
+        """
+        if self._file_signature() == self._signature:
+            return False
+        self._open()
+        self._search = None
+        return True
+
+    def _locate(self, task_id: int) -> int | None:
+        """Find a task's position in the offsets table.
+
+        Args:
+            task_id: The ID to look up.
+
+        Returns:
+            The table slot holding the task, or None if it is not in the file.
+        """
+        slot = bisect_left(self._ids, task_id)
+        if slot < self._count and self._ids[slot] == task_id:
+            return slot
+        return None
+
+    def _entry(self, slot: int) -> Tuple[int, int, int, int]:
+        """Read an offsets table entry.
+
+        Args:
+            slot: Position of the entry in the table.
+
+        Returns:
+            The task ID, record offset, record length and status code.
+        """
+        return _ENTRY.unpack_from(self._map, self._table + slot * _ENTRY.size)
+
+    def _decode(self, slot: int) -> Task:
+        """Materialize the task stored in a table slot.
+
+        Args:
+            slot: Position of the task's entry in the table.
+
+        Returns:
+            The decoded task.
+        """
+        task_id, offset, _, code = self._entry(slot)
+        created, title_length, description_length = _RECORD.unpack_from(
+            self._map, offset
+        )
+        start = offset + _RECORD.size
+        middle = start + title_length
+        return Task(
+            id=task_id,
+            title=self._map[start:middle].decode("utf-8"),
+            description=self._map[middle : middle + description_length].decode(
+                "utf-8"
+            ),
+            status=_STATUSES[code],
+            created_us=created,
+        )
+
+    def _status_codes(self) -> bytes:
+        """Return the status code of every task in the file, in table order.
+
+        Returns:
+            One status byte per table slot.
+        """
+        if self._map is None:
+            return b""
+        start = self._table + _STATUS_OFFSET
+        end = self._table + self._count * _ENTRY.size
+        return self._map[start:end:_ENTRY.size]
+
+    def _rows(
+        self, after: int | None = None
+    ) -> Iterator[Tuple[int, int, Task | None]]:
+        """Walk the file's tasks and pending changes together, in ID order.
+
+        Args:
+            after: Only yield tasks with a greater ID, if given.
+
+        Yields:
+            (task ID, table slot, task) for each stored task. Tasks from the
+            file come with ``task`` None and are decoded by the caller only
+            if needed; pending tasks come with slot -1.
+        """
+        pending_ids = sorted(self._pending)
+        slot = 0 if after is None else bisect_right(self._ids, after)
+        p = 0 if after is None else bisect_right(pending_ids, after)
+        while slot < self._count or p < len(pending_ids):
+            file_id = self._ids[slot] if slot < self._count else None
+            pending_id = pending_ids[p] if p < len(pending_ids) else None
+            if pending_id is not None and (file_id is None or pending_id <= file_id):
+                if pending_id == file_id:
+                    slot += 1
+                p += 1
+                task = self._pending[pending_id]
+                if task is not None:
+                    yield pending_id, -1, task
+            else:
+                yield file_id, slot, None
+                slot += 1
+
+    def _write_file(self) -> None:
+        """Rewrite the data file with the pending changes merged in.
+
+        Records of unchanged tasks are copied from the current mapping
+        without being decoded, and everything before the first changed ID,
+        which is the whole file when a task is appended, is copied as one
+        block. The file is replaced atomically and then remapped.
+        """
+
+        def write(f: IO[bytes]) -> None:
+            f.write(bytes(_HEADER.size))
+            table = bytearray()
+            position = _HEADER.size
+            first_changed = min(self._pending, default=None)
+            if first_changed is None:
+                prefix = self._count
+            else:
+                prefix = bisect_left(self._ids, first_changed)
+            after = None
+            if prefix:
+                after, offset, length, _ = self._entry(prefix - 1)
+                position = offset + length
+                f.write(self._map[_HEADER.size : position])
+                table += self._map[self._table : self._table + prefix * _ENTRY.size]
+            for task_id, slot, task in self._rows(after):
+                if task is None:
+                    _, offset, length, code = self._entry(slot)
+                    record = self._map[offset : offset + length]
+                else:
+                    record = _encode_record(task)
+                    code = _STATUS_CODES[task.status]
+                f.write(record)
+                table += _ENTRY.pack(task_id, position, len(record), code)
+                position += len(record)
+            f.write(table)
+            f.seek(0)
+            count = len(table) // _ENTRY.size
+            f.write(_HEADER.pack(_MAGIC, count, self._next_id, position))
+
+        before = self._signature
+        with profiling.phase("persist"):
+            atomic_write(self.file_path, write, self.durability, binary=True)
+        self._pending.clear()
+        self._open()
+        self._index_log.commit(before, self._signature, self.durability, self._search)
+
+    def _commit(self) -> None:
+        """Persist pending changes, unless a batch will persist them."""
+        self.version += 1
+        if not self._batch_depth:
+            self._write_file()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations so they are persisted with a single write.
+
+        Yields:
+            None.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._write_file()
+
+    def add(self, task: Task) -> Task:
+        """Add a new task to storage.
+
+        Args:
+            task: The task to add.
+
+        Returns:
+            The added task.
+        """
+        if task.id is None or task.id == 0:
+            task.id = self._next_id
+            self._next_id = generate_task_id(task.id)
+        elif task.id >= self._next_id:
+            self._next_id = task.id + 1
+        if self._search is not None or self._index_log.active:
+            previous = self.get_by_id(task.id)
+            if previous is not None:
+                self._unindex_text(previous)
+            self._index_text(task)
+        self._pending[task.id] = task
+        self._commit()
+        return task
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks from storage.
+
+        Returns:
+            List of all tasks, may be empty.
+        """
+        return list(self.iter_tasks())
+
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Retrieve a task by its ID, decoding only that record.
+
+        Args:
+            task_id: The unique identifier of the task.
+
+        Returns:
+            The task if found, None otherwise.
+        """
+        if task_id in self._pending:
+            return self._pending[task_id]
+        slot = self._locate(task_id)
+        return self._decode(slot) if slot is not None else None
+
+    def get_by_status(self, status: str) -> List[Task]:
+        """Retrieve tasks filtered by status.
+
+        Args:
+            status: Filter value ('complete' or 'incomplete').
+
+        Returns:
+            List of tasks matching the status filter.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        return list(self.iter_tasks(status))
+
+    def iter_tasks(self, status: str | None = None) -> Iterator[Task]:
+        """Iterate over stored tasks, decoding each record as it is reached.
+
+        The status filter is checked against the offsets table, so records
+        of non-matching tasks are never decoded.
+
+        Args:
+            status: Optional filter ('complete' or 'incomplete').
+
+        Yields:
+            Each matching task, in ID order.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        if status is not None and not TaskStatus.is_valid(status):
+            raise ValueError(
+                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+            )
+        return self._iter_tasks(status)
+
+    def _iter_tasks(self, status: str | None) -> Iterator[Task]:
+        """Generator behind ``iter_tasks``, run after the status is checked.
+
+        Args:
+            status: Optional, already validated, status filter.
+
+        Yields:
+            Each matching task, in ID order.
+        """
+        codes = self._status_codes()
+        code = _STATUS_CODES.get(status)
+        for _, slot, task in self._rows():
+            if task is not None:
+                if status is None or task.status == status:
+                    yield task
+            elif status is None or codes[slot] == code:
+                yield self._decode(slot)
+
+    def counts(self) -> Dict[str, int]:
+        """Return task counts from the offsets table, without decoding records.
+
+        Returns:
+            Dictionary with 'total', 'complete' and 'incomplete' counts.
+        """
+        if self._pending:
+            codes = self._status_codes()
+            total = complete = 0
+            for _, slot, task in self._rows():
+                total += 1
+                if task is not None:
+                    complete += task.status == TaskStatus.COMPLETE
+                else:
+                    complete += codes[slot] == _STATUS_CODES[TaskStatus.COMPLETE]
+        else:
+            total = self._count
+            complete = self._status_codes().count(
+                _STATUS_CODES[TaskStatus.COMPLETE]
+            )
+        return {
+            "total": total,
+            TaskStatus.COMPLETE: complete,
+            TaskStatus.INCOMPLETE: total - complete,
+        }
+
+    def page(
+        self,
+        limit: int,
+        after: int | None = None,
+        sort: str = "id",
+        reverse: bool = False,
+    ) -> Tuple[List[Task], int | None]:
+        """Retrieve tasks in a sort order, one page at a time.
+
+        Ascending ID pages are read straight from the offsets table. Other
+        orders have no index on disk, so every record is decoded and the
+        page is picked with a heap.
+
+        Args:
+            limit: Maximum number of tasks to return.
+            after: Cursor returned by the previous page, or None for the
+                   first page.
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+
+        Returns:
+            The page of tasks and the cursor for the next page, which is
+            None when there are no more tasks.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the cursor's task
+                        was deleted while paging in an order other than ID.
+        """
+        key = sort_key(sort)
+        if sort == "id" and not reverse:
+            rows = list(islice(self._rows(after), limit + 1))
+            tasks = [
+                task if task is not None else self._decode(slot)
+                for _, slot, task in rows
+            ]
+        else:
+            start = None
+            if after is not None:
+                cursor = self.get_by_id(after)
+                if cursor is None and sort != "id":
+                    raise ValueError(f"Cursor task '{after}' no longer exists")
+                start = (after if cursor is None else key(cursor), after)
+            tasks = top_tasks(self.iter_tasks(), sort, reverse, limit + 1, start)
+        next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+        return tasks[:limit], next_cursor
+
+    def get_sorted(
+        self,
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        status: str | None = None,
+    ) -> List[Task]:
+        """Retrieve tasks in a sort order, optionally only the first few.
+
+        Records are decoded one at a time and, with a limit, only the
+        first ``limit`` tasks are kept in a heap.
+
+        Args:
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            status: Optional filter ('complete' or 'incomplete').
+
+        Returns:
+            The matching tasks in order.
+
+        Raises:
+            ValueError: If the sort order or status is invalid.
+        """
+        tasks = self.iter_tasks(status)
+        if sort == "id" and not reverse:
+            # Records are already stored in ID order
+            return list(islice(tasks, limit))
+        return top_tasks(tasks, sort, reverse, limit)
+
+    def search(self, query: str, limit: int | None = None) -> List[Task]:
+        """Find tasks whose title or description contain every query word.
+
+        The search index is loaded from the index file, and only built by
+        decoding every record once when there is no usable saved copy;
+        mutations then keep it up to date in memory and on disk.
+
+        Args:
+            query: Free text to search for.
+            limit: Maximum number of tasks to return, or None for all.
+
+        Returns:
+            Matching tasks, best match first.
+        """
+        if self._search is None:
+            # Pending batch changes mean memory no longer matches the file
+            persisted = not self._pending
+            if persisted:
+                self._search = SearchIndex.load(self.index_path, self._signature)
+                if self._search is not None and self._index_log.should_fold():
+                    self._search.save(
+                        self.index_path, self._signature, self.durability
+                    )
+            if self._search is None:
+                self._search = SearchIndex()
+                self._search.rebuild(self.iter_tasks())
+                if persisted:
+                    self._search.save(
+                        self.index_path, self._signature, self.durability
+                    )
+        ids = self._search.search(query, limit)
+        return [self.get_by_id(task_id) for task_id in ids]
+
+    def _index_text(self, task: Task) -> None:
+        """Add a task to the search index and the saved index's delta log.
+
+        Args:
+            task: The task as it will be stored.
+        """
+        if self._search is not None:
+            self._search.add(task)
+        self._index_log.added(task)
+
+    def _unindex_text(self, task: Task) -> None:
+        """Remove a task from the search index and the saved index.
+
+        Must be called before the task's title or description changes.
+
+        Args:
+            task: The task as it is currently indexed.
+        """
+        if self._search is not None:
+            self._search.remove(task)
+        self._index_log.removed(task)
+
+    def update(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+    ) -> Task:
+        """Update an existing task.
+
+        Only the provided fields are updated; others remain unchanged.
+
+        Args:
+            task_id: The unique identifier of the task to update.
+            title: New title (optional, None means no change).
+            description: New description (optional, None means no change).
+
+        Returns:
+            The updated task.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            raise TaskNotFoundError(str(task_id))
+
+        self._unindex_text(task)
+        if title is not None:
+            task.title = title
+        if description is not None:
+            task.description = description
+        self._index_text(task)
+        self._pending[task_id] = task
+        self._commit()
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Delete a task from storage.
+
+        Args:
+            task_id: The unique identifier of the task to delete.
+
+        Returns:
+            True if the task was deleted successfully.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            raise TaskNotFoundError(str(task_id))
+
+        self._unindex_text(task)
+        self._pending[task_id] = None
+        self._commit()
+        return True
+
+    def _remove_tasks(self, tasks: List[Task]) -> None:
+        """Remove stored tasks with a single rewrite of the file.
+
+        Args:
+            tasks: The tasks to remove, all currently stored.
+        """
+        for task in tasks:
+            self._unindex_text(task)
+            self._pending[task.id] = None
+        self._commit()
+
+    def toggle_status(self, task_id: int) -> Task:
+        """Toggle a task's status between complete and incomplete.
+
+        Outside a batch, a task already in the file is toggled by writing
+        its one status byte in place rather than rewriting the file.
+
+        Args:
+            task_id: The unique identifier of the task.
+
+        Returns:
+            The updated task with toggled status.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            raise TaskNotFoundError(str(task_id))
+
+        task.status = TaskStatus.toggle(task.status)
+        slot = None if task_id in self._pending else self._locate(task_id)
+        if slot is None or self._batch_depth:
+            self._pending[task_id] = task
+            self._commit()
+            return task
+
+        self._file.seek(self._table + slot * _ENTRY.size + _STATUS_OFFSET)
+        with profiling.phase("persist"):
+            self._file.write(bytes((_STATUS_CODES[task.status],)))
+            sync_handle(self._file, self.durability)
+        self.version += 1
+        before, self._signature = self._signature, self._file_signature()
+        # The text is unchanged, but the saved index must follow the new mtime
+        self._index_log.commit(before, self._signature, self.durability, self._search)
+        return task
+
+    def clear(self) -> None:
+        """Remove all tasks from storage.
+
+        Primarily useful for testing purposes.
+        """
+        self._pending.clear()
+        self._close_map()
+        self._next_id = 1
+        if self._search is not None:
+            self._search.clear()
+        self._index_log.discard()
+        self.version += 1
+        self._write_file()
+
+    def close(self) -> None:
+        """Unmap and close the data file."""
+        self._close_map()
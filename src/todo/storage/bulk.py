@@ -0,0 +1,102 @@
+"""Bulk operations shared by the storage backends.
+
+This module provides multi-task variants of the storage mutations. Each
+runs inside the backend's ``batch()`` context, so however many tasks are
+touched the backend persists them with a single write.
+"""
+
+from typing import Callable, Iterable, List
+
+from todo.models import Task
+
+
+class BulkOperationsMixin:
+    """Multi-task mutations built on a storage's single-task methods.
+
+    Classes using this mixin provide ``batch()``, ``add``, ``delete``,
+    ``toggle_status``, ``get_by_id`` and ``iter_tasks``, and may override
+    ``_remove_tasks`` to delete many tasks faster than one at a time.
+    """
+
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Add several tasks with a single persist.
+
+        Args:
+            tasks: The tasks to add.
+
+        Returns:
+            The added tasks, with their assigned IDs.
+        """
+        with self.batch():
+            return [self.add(task) for task in tasks]
+
+    def delete_many(
+        self,
+        task_ids: Iterable[int] | None = None,
+        predicate: Callable[[Task], bool] | None = None,
+    ) -> List[int]:
+        """Delete several tasks in one pass with a single persist.
+
+        Tasks are chosen by ID, by predicate, or by both, in which case a
+        task must be listed and satisfy the predicate. IDs that do not
+        exist are skipped rather than raising.
+
+        Args:
+            task_ids: IDs of the tasks to delete, or None to consider every
+                      stored task.
+            predicate: Function returning True for tasks to delete, or None
+                       to delete every listed task.
+
+        Returns:
+            IDs of the tasks that were actually deleted.
+
+        Raises:
+            ValueError: If neither task_ids nor predicate is given.
+        """
+        if task_ids is None and predicate is None:
+            raise ValueError("delete_many needs task_ids, a predicate or both")
+        with self.batch():
+            if task_ids is None:
+                tasks = self.iter_tasks()
+            else:
+                found = (self.get_by_id(task_id) for task_id in dict.fromkeys(task_ids))
+                tasks = (task for task in found if task is not None)
+            if predicate is not None:
+                tasks = (task for task in tasks if predicate(task))
+            # Materialize before removing anything, since removal changes
+            # what the generators above iterate over
+            doomed = list(tasks)
+            if doomed:
+                self._remove_tasks(doomed)
+        return [task.id for task in doomed]
+
+    def _remove_tasks(self, tasks: List[Task]) -> None:
+        """Remove stored tasks with a single persist.
+
+        Backends override this to drop every task in one pass; this
+        fallback deletes them one at a time inside a batch.
+
+        Args:
+            tasks: The tasks to remove, all currently stored.
+        """
+        with self.batch():
+            for task in tasks:
+                self.delete(task.id)
+
+    def toggle_many(self, task_ids: Iterable[int]) -> List[Task]:
+        """Toggle the status of several tasks with a single persist.
+
+        IDs that do not exist are skipped rather than raising.
+
+        Args:
+            task_ids: IDs of the tasks to toggle.
+
+        Returns:
+            The toggled tasks.
+        """
+        toggled = []
+        with self.batch():
+            for task_id in task_ids:
+                if self.get_by_id(task_id) is not None:
+                    toggled.append(self.toggle_status(task_id))
+        return toggled
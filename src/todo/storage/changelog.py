@@ -0,0 +1,104 @@
+"""In-memory change feed for the file-based storage backend.
+
+This module provides a bounded log of the task changes a storage made,
+tagged with the storage version each change produced. Clients that hold a
+copy of the tasks at some version ask for the changes since then and apply
+them, instead of downloading every task again. When the log no longer
+reaches back to a client's version, because old changes were dropped or
+the tasks were reloaded from disk, the client is told to resync.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+# Changes kept by default; older ones force clients to resync
+DEFAULT_CAPACITY = 1000
+
+
+class Changelog:
+    """Ring buffer of task changes ordered by storage version.
+
+    Each change is a dictionary with the 'version' it produced, the 'op'
+    ('add', 'update', 'toggle' or 'delete'), the task 'id' and, except for
+    deletions, the resulting 'task'. Callers serialize access; FileStorage
+    records under its write lock and reads under its read lock.
+
+    Attributes:
+        capacity: Maximum number of changes kept.
+        floor: Oldest version the log can bring a client forward from.
+        _changes: Private deque of (version, change), oldest first.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize an empty log.
+
+        Args:
+            capacity: Maximum number of changes kept.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Changelog capacity must be a positive number")
+        self.capacity = capacity
+        self.floor = 0
+        self._changes: Deque[Tuple[int, Dict[str, Any]]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of changes kept."""
+        return len(self._changes)
+
+    def record(self, version: int, op: str, task_id: int, task: Any = None) -> None:
+        """Append a change, dropping the oldest one if the log is full.
+
+        Args:
+            version: Storage version the change produced.
+            op: 'add', 'update', 'toggle' or 'delete'.
+            task_id: ID of the changed task.
+            task: The task's dictionary after the change, or None for a
+                  deletion.
+        """
+        change: Dict[str, Any] = {"version": version, "op": op, "id": task_id}
+        if task is not None:
+            change["task"] = task
+        if len(self._changes) == self.capacity:
+            # A client at the dropped version already has it, older ones don't
+            self.floor = self._changes.popleft()[0]
+        self._changes.append((version, change))
+
+    def reset(self, version: int) -> None:
+        """Forget every change, e.g. after the tasks were reloaded from disk.
+
+        Args:
+            version: The storage's current version, the oldest one clients
+                     can resume from afterwards.
+        """
+        self._changes.clear()
+        self.floor = version
+
+    def since(self, version: int, current: int) -> List[Dict[str, Any]] | None:
+        """Collect the changes a client at some version is missing.
+
+        Only the latest change to each task is returned, so applying them
+        in order (upserting 'task', removing deleted IDs) brings the client
+        to the current version. The cost grows with the number of changes
+        since ``version``, not with the number of tasks.
+
+        Args:
+            version: The version the client's copy of the tasks is at.
+            current: The storage's current version.
+
+        Returns:
+            The changes, oldest first, or None if the client must resync
+            because the log does not reach back to its version or the
+            version is newer than the storage's.
+        """
+        if version < self.floor or version > current:
+            return None
+        # Walk back from the newest change, keeping the first seen per task
+        latest: Dict[int, Dict[str, Any]] = {}
+        for change_version, change in reversed(self._changes):
+            if change_version <= version:
+                break
+            latest.setdefault(change["id"], change)
+        return list(reversed(latest.values()))
@@ -0,0 +1,250 @@
+"""Serialization codecs for the file-based storage backend.
+
+This module provides the formats FileStorage can write its data file in:
+indented JSON for reading by hand, compact JSON (the default), NDJSON with
+one task per line, and orjson when that package is installed. The stdlib
+codecs format each task straight from its attributes, without building an
+intermediate dictionary, and write the file in chunks.
+
+Every codec reads every format: a file starting with '[' is a JSON array,
+anything else is NDJSON. Switching codecs therefore needs no migration; the
+file is rewritten in the new format on the next save.
+"""
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, List
+
+from todo.models import Task
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Tasks formatted per write, bounding the text held in memory during a save
+_CHUNK_SIZE = 4096
+
+# The stdlib's string escaper, as used by json.dumps(ensure_ascii=False)
+_quote = json.encoder.encode_basestring
+
+
+def _check_tasks(tasks: List[Any]) -> List[Task]:
+    """Make sure decoding produced a list of tasks.
+
+    Args:
+        tasks: The decoded values.
+
+    Returns:
+        The tasks, unchanged.
+
+    Raises:
+        TypeError: If the file did not hold a list of task objects.
+    """
+    if not isinstance(tasks, list) or not all(isinstance(t, Task) for t in tasks):
+        raise TypeError("Data file does not hold a list of tasks")
+    return tasks
+
+
+class Codec:
+    """Stdlib JSON codec writing tasks from a per-task template.
+
+    Subclasses choose the template and the text around and between tasks.
+
+    Attributes:
+        name: The codec's name, as used in configuration.
+        template: Format string for one task, filled with its ID, quoted
+            title, quoted description, quoted status and ISO timestamp.
+        opening: Text written before the first task.
+        separator: Text written between tasks.
+        closing: Text written after the last task.
+        empty: Text written instead when there are no tasks.
+    """
+
+    name = ""
+    template = (
+        '{{"id":{},"title":{},"description":{},"status":{},"created_at":"{}"}}'
+    )
+    opening = "["
+    separator = ","
+    closing = "]"
+    empty = "[]"
+
+    def encode(self, task: Task) -> str:
+        """Format one task.
+
+        Args:
+            task: The task to format.
+
+        Returns:
+            The task as JSON text.
+        """
+        return self.template.format(
+            task.id,
+            _quote(task.title),
+            _quote(task.description),
+            _quote(task.status),
+            task.created_at.isoformat(),
+        )
+
+    def dump(self, tasks: Iterable[Task], f: IO[bytes]) -> None:
+        """Write tasks to a binary file.
+
+        Args:
+            tasks: The tasks to write, in order.
+            f: The file to write to.
+        """
+        iterator = iter(tasks)
+        written = False
+        while chunk := list(islice(iterator, _CHUNK_SIZE)):
+            prefix = self.separator if written else self.opening
+            text = self.separator.join(map(self.encode, chunk))
+            f.write((prefix + text).encode("utf-8"))
+            written = True
+        f.write((self.closing if written else self.empty).encode("utf-8"))
+
+    def load(self, f: IO[bytes]) -> List[Task]:
+        """Read the tasks from a data file in any supported format.
+
+        Args:
+            f: The binary file to read.
+
+        Returns:
+            The tasks, in file order.
+
+        Raises:
+            ValueError: If the file is not valid JSON or NDJSON.
+            KeyError: If a task is missing a field.
+            TypeError: If the file does not hold task objects.
+        """
+        data = f.read()
+        if data.lstrip()[:1] != b"[":
+            # Parsing NDJSON as one array is much faster than line by line
+            lines = [line for line in data.splitlines() if line.strip()]
+            data = b"[" + b",".join(lines) + b"]"
+        return _check_tasks(self.load_array(data))
+
+    def load_array(self, data: bytes) -> List[Any]:
+        """Decode a JSON array of tasks.
+
+        Tasks are built as the parser produces each object, so the decoded
+        dictionaries never pile up alongside the tasks.
+
+        Args:
+            data: The file's contents.
+
+        Returns:
+            The decoded array.
+        """
+        return json.loads(data, object_hook=Task.from_dict)
+
+
+class PrettyCodec(Codec):
+    """Indented JSON array, as written by ``json.dump(indent=2)``."""
+
+    name = "pretty"
+    template = (
+        "  {{\n"
+        '    "id": {},\n'
+        '    "title": {},\n'
+        '    "description": {},\n'
+        '    "status": {},\n'
+        '    "created_at": "{}"\n'
+        "  }}"
+    )
+    opening = "[\n"
+    separator = ",\n"
+    closing = "\n]"
+
+
+class CompactCodec(Codec):
+    """JSON array without whitespace; the smallest and fastest stdlib format."""
+
+    name = "compact"
+
+
+class NdjsonCodec(Codec):
+    """One compact JSON object per line, without an enclosing array."""
+
+    name = "ndjson"
+    opening = ""
+    separator = "\n"
+    closing = "\n"
+    empty = ""
+
+
+class OrjsonCodec(Codec):
+    """Compact JSON array encoded and decoded by the orjson package."""
+
+    name = "orjson"
+
+    def dump(self, tasks: Iterable[Task], f: IO[bytes]) -> None:
+        """Write tasks as one compact JSON array.
+
+        Args:
+            tasks: The tasks to write, in order.
+            f: The file to write to.
+        """
+        f.write(orjson.dumps([task.to_dict() for task in tasks]))
+
+    def load_array(self, data: bytes) -> List[Any]:
+        """Decode a JSON array of tasks with orjson.
+
+        Args:
+            data: The file's contents.
+
+        Returns:
+            The decoded array.
+
+        Raises:
+            TypeError: If an element is not a JSON object.
+        """
+        return [Task.from_dict(item) for item in orjson.loads(data)]
+
+
+# Codec classes by configuration name
+CODECS: Dict[str, Callable[[], Codec]] = {
+    codec.name: codec
+    for codec in (PrettyCodec, CompactCodec, NdjsonCodec, OrjsonCodec)
+}
+
+
+def get_codec(name: str) -> Codec:
+    """Create the codec with the given name.
+
+    Args:
+        name: 'pretty', 'compact', 'ndjson' or 'orjson'.
+
+    Returns:
+        The codec.
+
+    Raises:
+        ValueError: If the name is unknown, or names orjson while it is not
+                    installed.
+    """
+    if name not in CODECS:
+        raise ValueError(
+            f"Invalid codec '{name}'. Use 'pretty', 'compact', 'ndjson' or 'orjson'."
+        )
+    if name == OrjsonCodec.name and orjson is None:
+        raise ValueError("The 'orjson' codec requires the orjson package.")
+    return CODECS[name]()
+
+
+def read_tasks(path: Path) -> List[Task]:
+    """Read the tasks from a FileStorage data file in any supported format.
+
+    Args:
+        path: Path to the data file.
+
+    Returns:
+        The tasks, in file order.
+
+    Raises:
+        ValueError: If the file is not valid JSON or NDJSON.
+        KeyError: If a task is missing a field.
+        TypeError: If the file does not hold task objects.
+    """
+    with path.open("rb") as f:
+        return CompactCodec().load(f)
@@ -0,0 +1,107 @@
+"""Durability policies for the file-based storage backend.
+
+This module defines how hard the storage works to get bytes onto disk
+before a mutation is reported as done, and provides the atomic
+write-to-temp-and-rename helper used for every snapshot write.
+"""
+
+import os
+from pathlib import Path
+from typing import IO, Callable
+
+
+class Durability:
+    """Constants and utilities for durability policy values.
+
+    Attributes:
+        NONE: Leave buffering to Python and the OS.
+        FLUSH: Flush Python buffers to the OS after every write.
+        FSYNC: Also fsync the written file before returning.
+        FSYNC_DIR: Also fsync the parent directory so renames survive a crash.
+    """
+
+    NONE: str = "none"
+    FLUSH: str = "flush"
+    FSYNC: str = "fsync"
+    FSYNC_DIR: str = "fsync+dir"
+
+    @classmethod
+    def is_valid(cls, policy: str) -> bool:
+        """Check if a durability policy value is valid.
+
+        Args:
+            policy: The policy value to validate.
+
+        Returns:
+            True if the policy is valid, False otherwise.
+        """
+        return policy in (cls.NONE, cls.FLUSH, cls.FSYNC, cls.FSYNC_DIR)
+
+
+def sync_handle(handle: IO, policy: str) -> None:
+    """Push a handle's pending writes to disk as far as the policy requires.
+
+    Args:
+        handle: An open file handle that has just been written to.
+        policy: The durability policy to honour.
+    """
+    if policy == Durability.NONE:
+        return
+    handle.flush()
+    if policy in (Durability.FSYNC, Durability.FSYNC_DIR):
+        os.fsync(handle.fileno())
+
+
+def fsync_directory(path: Path) -> None:
+    """Fsync a directory so entries created or renamed in it are durable.
+
+    Args:
+        path: The directory to sync.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # Platforms such as Windows cannot open directories for syncing
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(
+    path: Path,
+    write: Callable[[IO], None],
+    policy: str,
+    binary: bool = False,
+) -> None:
+    """Replace a file's contents without ever exposing a partial file.
+
+    The content is written to a temporary file in the same directory which
+    is then renamed over the target, so readers see either the old or the
+    new file, never a truncated one.
+
+    Args:
+        path: The file to replace.
+        write: Callback that writes the new content to the given handle.
+        policy: The durability policy to honour.
+        binary: If True, the callback gets a binary handle instead of a
+                UTF-8 text handle.
+    """
+    # Per-process name, so concurrent writers never share a temporary file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if binary:
+            handle = tmp_path.open("wb")
+        else:
+            handle = tmp_path.open("w", encoding="utf-8")
+        with handle as f:
+            write(f)
+            sync_handle(f, policy)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if policy == Durability.FSYNC_DIR:
+        fsync_directory(path.parent.resolve())
@@ -1,19 +1,42 @@
 """File-based storage implementation for the Todo CLI application.
 
 This module provides a JSON file-based storage backend for managing tasks
-with persistence between sessions.
+with persistence between sessions. In journal mode each mutation is appended
+to a log beside the data file and periodically compacted into the snapshot.
+Processes sharing the files coordinate through an advisory lock, and each
+storage reloads whenever another process has changed them. Recent changes
+are also kept in memory, so clients can sync without reloading every task.
 """
 
 import json
+import os
+import threading
+import time
+import uuid
+import warnings
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
+from todo import metrics, profiling
 from todo.exceptions import TaskNotFoundError
 from todo.models import Task, TaskStatus
+from todo.storage.bulk import BulkOperationsMixin
+from todo.storage.changelog import DEFAULT_CAPACITY, Changelog
+from todo.storage.codec import get_codec
+from todo.storage.durability import Durability, atomic_write
+from todo.storage.index import OrderIndex, StatusIndex
+from todo.storage.journal import Journal
+from todo.storage.locking import FileLock, ReadWriteLock
+from todo.storage.search import SearchIndex, SearchIndexLog
 from todo.utils import generate_task_id
 
+# Journal records always tolerated before compaction, so small stores do not
+# rewrite the snapshot on nearly every mutation.
+_COMPACT_MIN_RECORDS = 64
 
-class FileStorage:
+
+class FileStorage(BulkOperationsMixin):
     """File-based storage for task management.
 
     Provides CRUD operations for tasks using a JSON file backend.
@@ -21,70 +44,430 @@ class FileStorage:
 
     Attributes:
         file_path: Path to the JSON file used for storage.
+        meta_path: Path to the sidecar file holding the ID high-water mark.
+        index_path: Path to the sidecar file holding the search index.
+        journal: Append-only mutation log, or None when journaling is off.
+        codec: Codec the data file is written with.
+        lock: Inter-process lock held while loading or writing the files.
+        compact_ratio: Journal records allowed per task before compaction.
+        durability: Durability policy applied to every write.
+        instance_id: Random token identifying this storage instance.
+        version: Counter bumped on every mutation or reload from disk.
+        changelog: Recent task changes by version, for incremental sync.
         _tasks: Private dictionary mapping task IDs to Task objects.
+        _status_index: Private index of task IDs by status.
+        _order_index: Private sorted indexes of task IDs, one per sort order.
+        _search: Private full-text index, or None until the first search.
+        _search_lock: Private mutex serializing threads building ``_search``.
+        _log: Private view of "<file>.log", replayed on load even when
+            journaling is off, so records left by a journaling process are
+            never ignored.
+        _index_log: Private recorder persisting search index changes beside
+            the saved index.
+        _rw: Private lock letting threads read at once but write one at a
+            time.
         _next_id: The next ID to assign to a new task.
+        _signature: Private stat fingerprint of the files as last seen.
+        _batch_depth: Private nesting depth of open ``batch()`` blocks.
+        _pending: Private journal records held back until the batch ends.
     """
 
-    def __init__(self, file_path: Path = None) -> None:
+    def __init__(
+        self,
+        file_path: Path = None,
+        journal: bool = False,
+        compact_ratio: float = 1.0,
+        durability: str = Durability.FLUSH,
+        codec: str = "compact",
+        changelog_size: int = DEFAULT_CAPACITY,
+    ) -> None:
         """Initialize file-based storage.
 
         Args:
             file_path: Path to the JSON file for storage.
                       Defaults to Path("todos.json") in current directory.
+            journal: If True, append mutations to "<file>.log" instead of
+                     rewriting the JSON file on every change.
+            compact_ratio: Fold the journal into the JSON file once it holds
+                           more than this many records per stored task.
+            durability: One of 'none', 'flush', 'fsync' or 'fsync+dir'.
+            codec: Format the data file is written in: 'pretty', 'compact',
+                   'ndjson' or 'orjson'. Files in any of them are read.
+            changelog_size: Number of recent changes kept for ``changes()``.
+
+        Raises:
+            ValueError: If durability is not a known policy, the codec is
+                        unknown or not installed, or changelog_size is not
+                        positive.
         """
+        if not Durability.is_valid(durability):
+            raise ValueError(
+                f"Invalid durability '{durability}'. "
+                "Use 'none', 'flush', 'fsync' or 'fsync+dir'."
+            )
+        self.codec = get_codec(codec)
         self.file_path = file_path or Path("todos.json")
+        self.meta_path = self.file_path.with_name(self.file_path.name + ".meta")
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self.durability = durability
+        self._log = Journal(
+            self.file_path.with_name(self.file_path.name + ".log"),
+            durability=durability,
+        )
+        self.journal = self._log if journal else None
+        self.compact_ratio = compact_ratio
+        self.lock = FileLock(self.file_path.with_name(self.file_path.name + ".lock"))
         self._tasks: Dict[int, Task] = {}  # Changed from str to int for numeric IDs
+        self._status_index = StatusIndex()
+        self._order_index = OrderIndex()
+        self._search: SearchIndex | None = None
+        self._search_lock = threading.Lock()
+        self._index_log = SearchIndexLog(self.index_path)
+        self._rw = ReadWriteLock()
         self._next_id = 1
-        self._load_from_file()
+        self._signature: tuple = ()
+        self._batch_depth = 0
+        self._pending: List[Dict[str, Any]] = []
+        self.instance_id = uuid.uuid4().hex[:12]
+        self.version = 0
+        self.changelog = Changelog(changelog_size)
+        with self.lock.shared(), metrics.STORAGE_LOAD_SECONDS.time():
+            self._load_from_file()
+        if self.journal is None and self._log.record_count:
+            # Fold a journaling process's records in, so the snapshot this
+            # storage rewrites never sits under a stale journal
+            self.compact()
 
     def _load_from_file(self) -> None:
-        """Load tasks from the JSON file."""
+        """Load tasks from the JSON file and replay any journal on top."""
+        self._tasks = {}
+        self._next_id = self._load_high_water_mark()
         if self.file_path.exists():
             try:
-                with self.file_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for task_data in data:
-                        # Convert dict back to Task object
-                        task = Task(
-                            id=task_data["id"],
-                            title=task_data["title"],
-                            description=task_data["description"],
-                            status=task_data["status"],
-                            created_at=task_data["created_at"]  # Will be converted to datetime in Task
-                        )
-                        # Since datetime is stored as ISO string, we need to handle it properly
-                        from datetime import datetime
-                        task.created_at = datetime.fromisoformat(task_data["created_at"])
-                        self._tasks[task.id] = task
-
-                        # Update the next ID to be one more than the highest ID found
-                        if task.id >= self._next_id:
-                            self._next_id = task.id + 1
-            except (json.JSONDecodeError, KeyError, TypeError):
-                # If there's an error loading the file, start with empty storage
+                with self.file_path.open("rb") as f:
+                    tasks = self.codec.load(f)
+                for task in tasks:
+                    self._tasks[task.id] = task
+
+                    # Update the next ID to be one more than the highest ID found
+                    if task.id >= self._next_id:
+                        self._next_id = task.id + 1
+            except (KeyError, TypeError, ValueError):
+                # Keep the unreadable file instead of overwriting it on the
+                # next save, then start with empty storage
+                self._quarantine_corrupt_file()
                 self._tasks = {}
-                self._next_id = 1
-        else:
-            # If file doesn't exist, start with empty storage
-            self._tasks = {}
-            self._next_id = 1
 
-    def _save_to_file(self) -> None:
-        """Save tasks to the JSON file."""
-        # Convert tasks to dictionaries for JSON serialization
-        data = []
+        # Replayed even when journaling is off: another process sharing the
+        # files may journal, and its records are newer than the snapshot
+        for record in self._log.replay():
+            self._apply_record(record)
+
+        self._status_index.clear()
         for task in self._tasks.values():
-            task_dict = {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "status": task.status,
-                "created_at": task.created_at.isoformat()
-            }
-            data.append(task_dict)
-
-        with self.file_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            self._status_index.add(task.id, task.status)
+        self._order_index.rebuild(self._tasks.values())
+        self._search = None
+        self._signature = self._file_signature()
+        self.version += 1
+        # What changed on disk is unknown, so clients must resync
+        self.changelog.reset(self.version)
+
+    def _index_task(self, task: Task) -> None:
+        """Add a stored task to every secondary index.
+
+        Args:
+            task: The task, already present in ``_tasks``.
+        """
+        self._status_index.add(task.id, task.status)
+        self._order_index.add(task)
+        if self._search is not None:
+            self._search.add(task)
+        self._index_log.added(task)
+
+    def _unindex_task(self, task: Task) -> None:
+        """Remove a task from every secondary index.
+
+        Must be called before the indexed fields of the task change.
+
+        Args:
+            task: The task as it is currently indexed.
+        """
+        self._status_index.remove(task.id, task.status)
+        self._order_index.remove(task.id)
+        if self._search is not None:
+            self._search.remove(task)
+        self._index_log.removed(task)
+
+    def _load_high_water_mark(self) -> int:
+        """Read the persisted next ID, so IDs of deleted tasks are not reused.
+
+        Returns:
+            The next ID recorded in the meta file, or 1 if there is none.
+        """
+        try:
+            with self.meta_path.open("r", encoding="utf-8") as f:
+                return int(json.load(f)["next_id"])
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return 1
+
+    def _file_signature(self) -> tuple:
+        """Fingerprint the data and journal files by inode, size and mtime.
+
+        Returns:
+            A tuple that changes whenever either file is replaced or written.
+        """
+        signature = []
+        for path in (self.file_path, self._log.path):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(signature)
+
+    def refresh(self) -> bool:
+        """Reload tasks if another process changed the files since last seen.
+
+        Only a stat call is made when nothing changed, so this is cheap
+        enough to run before every read served from the in-memory tasks.
+        The files are reloaded under a shared lock, so a writer in another
+        process is never caught halfway.
+
+        Returns:
+            True if the files changed and the tasks were reloaded.
+
+        Raises:
+            RuntimeError: If the calling thread is in the middle of a read.
+        """
+        if self._file_signature() == self._signature:
+            return False
+        with self._rw.write(), self.lock.shared():
+            # Another thread may have reloaded while this one waited
+            if self._file_signature() == self._signature:
+                return False
+            self._log.close()
+            with metrics.STORAGE_LOAD_SECONDS.time():
+                self._load_from_file()
+            metrics.STORAGE_RELOADS.inc()
+        return True
+
+    @contextmanager
+    def _locked_for_read(self) -> Iterator[None]:
+        """Hold the lock for reading, reloading first if the files changed.
+
+        Many threads may read at once. A read nested in another operation
+        of the same thread skips the reload, so it sees the same tasks as
+        the operation around it.
+
+        Yields:
+            None.
+        """
+        if not self._rw.held:
+            self.refresh()
+        with self._rw.read():
+            yield
+
+    @contextmanager
+    def _locked_for_write(self, op: str) -> Iterator[None]:
+        """Hold the lock exclusively, reloading first if the files changed.
+
+        Every mutation runs inside this block, so it is applied to the
+        latest data on disk and no other thread or process writes in
+        between. The block's duration, including waiting for the lock and
+        saving, is recorded under the operation's name.
+
+        Args:
+            op: Name of the mutation, used as its metrics label.
+
+        Yields:
+            None.
+        """
+        outermost = not self._rw.held
+        with metrics.STORAGE_MUTATION_SECONDS.time(op=op):
+            try:
+                with self._rw.write(), self.lock.exclusive():
+                    if outermost:
+                        self.refresh()
+                    yield
+            except Exception as e:
+                metrics.STORAGE_MUTATION_ERRORS.inc(op=op, error=type(e).__name__)
+                raise
+
+    def _quarantine_corrupt_file(self) -> None:
+        """Move an unreadable data file aside so it can be recovered by hand."""
+        corrupt_path = self.file_path.with_name(
+            f"{self.file_path.name}.corrupt-{int(time.time())}"
+        )
+        os.replace(self.file_path, corrupt_path)
+        warnings.warn(
+            f"Could not parse '{self.file_path}'; moved it to '{corrupt_path}' "
+            "and started with an empty task list.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a single journal record to the in-memory tasks.
+
+        Records describe resulting state rather than relative changes, so
+        replaying a record the snapshot already contains is harmless.
+
+        Args:
+            record: The journal record to apply.
+        """
+        op = record.get("op")
+        if op == "add":
+            task = Task.from_dict(record["task"])
+            self._tasks[task.id] = task
+            if task.id >= self._next_id:
+                self._next_id = task.id + 1
+            return
+
+        if op == "delete_many":
+            for task_id in record["ids"]:
+                self._tasks.pop(task_id, None)
+            return
+
+        task = self._tasks.get(record.get("id"))
+        if task is None:
+            return
+        if op == "update":
+            if "title" in record:
+                task.title = record["title"]
+            if "description" in record:
+                task.description = record["description"]
+        elif op == "toggle":
+            task.status = record["status"]
+        elif op == "delete":
+            del self._tasks[task.id]
+
+    def _save_to_file(self) -> None:
+        """Save tasks to the data file in the storage's codec.
+
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous version intact rather than a truncated file.
+        """
+        with metrics.STORAGE_SAVE_SECONDS.time(kind="snapshot"):
+            atomic_write(
+                self.file_path,
+                lambda f: self.codec.dump(self._tasks.values(), f),
+                self.durability,
+                binary=True,
+            )
+            atomic_write(
+                self.meta_path,
+                lambda f: json.dump({"next_id": self._next_id}, f),
+                self.durability,
+            )
+
+    def _persist(self, record: Dict[str, Any]) -> None:
+        """Persist a mutation that has already been applied in memory.
+
+        Without a journal the whole file is rewritten. With a journal the
+        record is appended, and the journal is compacted once it grows past
+        the configured ratio of records per task.
+
+        Inside a ``batch()`` block the record is held back and written
+        together with the rest of the batch when the block ends.
+
+        Args:
+            record: Journal record describing the mutation.
+        """
+        self.version += 1
+        self._log_change(record)
+        if self._batch_depth:
+            self._pending.append(record)
+            return
+        self._write_records([record])
+
+    def _log_change(self, record: Dict[str, Any]) -> None:
+        """Add a mutation to the changelog under the current version.
+
+        Args:
+            record: Journal record describing the mutation.
+        """
+        op = record["op"]
+        if op == "add":
+            task = record["task"]
+            self.changelog.record(self.version, op, task["id"], task)
+        elif op == "delete_many":
+            for task_id in record["ids"]:
+                self.changelog.record(self.version, "delete", task_id)
+        elif op == "delete":
+            self.changelog.record(self.version, op, record["id"])
+        else:
+            task_id = record["id"]
+            self.changelog.record(
+                self.version, op, task_id, self._tasks[task_id].to_dict()
+            )
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        """Write mutations to disk with a single file write.
+
+        Args:
+            records: Journal records describing the mutations, oldest first.
+        """
+        with profiling.phase("persist"):
+            if self.journal is None:
+                self._save_to_file()
+                # Drop records a journaling process appended, now that the
+                # snapshot holds them
+                self._log.truncate()
+            else:
+                with metrics.STORAGE_SAVE_SECONDS.time(kind="journal"):
+                    self.journal.append_many(records)
+                limit = max(_COMPACT_MIN_RECORDS, self.compact_ratio * len(self._tasks))
+                if self.journal.record_count > limit:
+                    self.compact()
+            self._advance_signature()
+
+    def _advance_signature(self) -> None:
+        """Note the files' signature after a write of this storage.
+
+        The search index changes made by the write are persisted along
+        with it, so the saved index stays valid for other processes.
+        """
+        signature = self._file_signature()
+        self._index_log.commit(
+            self._signature, signature, self.durability, self._search
+        )
+        self._signature = signature
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations so they are persisted with a single write.
+
+        Mutations inside the block are applied in memory immediately and
+        written out once when the outermost block exits, even if it exits
+        with an error, so disk never lags behind memory. The lock is held
+        throughout, so the batch is applied atomically with respect to
+        other processes.
+
+        Yields:
+            None.
+        """
+        with self._locked_for_write("batch"):
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._pending:
+                    records, self._pending = self._pending, []
+                    self._write_records(records)
+
+    def compact(self) -> None:
+        """Fold the journal into the JSON snapshot and truncate it.
+
+        The snapshot is written before the journal is removed, so a crash in
+        between only leaves records that replay as no-ops.
+        """
+        with self._locked_for_write("compact"), profiling.phase("persist"):
+            self._save_to_file()
+            self._log.truncate()
+            self._advance_signature()
 
     def add(self, task: Task) -> Task:
         """Add a new task to storage.
@@ -95,14 +478,19 @@ class FileStorage:
         Returns:
             The added task.
         """
-        # If the task doesn't have an ID yet, assign one
-        if task.id is None or task.id == 0:
-            task.id = self._next_id
-            self._next_id = generate_task_id(self._next_id - 1)  # Increment the next ID
-
-        self._tasks[task.id] = task
-        self._save_to_file()
-        return task
+        with self._locked_for_write("add"):
+            # If the task doesn't have an ID yet, assign one
+            if task.id is None or task.id == 0:
+                task.id = self._next_id
+                self._next_id = generate_task_id(task.id)
+
+            previous = self._tasks.get(task.id)
+            if previous is not None:
+                self._unindex_task(previous)
+            self._tasks[task.id] = task
+            self._index_task(task)
+            self._persist({"op": "add", "task": task.to_dict()})
+            return task
 
     def get_all(self) -> List[Task]:
         """Retrieve all tasks from storage.
@@ -110,7 +498,8 @@ class FileStorage:
         Returns:
             List of all tasks, may be empty.
         """
-        return list(self._tasks.values())
+        with self._locked_for_read():
+            return list(self._tasks.values())
 
     def get_by_id(self, task_id: int) -> Task | None:  # Changed from str to int
         """Retrieve a task by its ID.
@@ -121,7 +510,8 @@ class FileStorage:
         Returns:
             The task if found, None otherwise.
         """
-        return self._tasks.get(task_id)
+        with self._locked_for_read():
+            return self._tasks.get(task_id)
 
     def get_by_status(self, status: str) -> List[Task]:
         """Retrieve tasks filtered by status.
@@ -135,11 +525,178 @@ class FileStorage:
         Raises:
             ValueError: If status is not 'complete' or 'incomplete'.
         """
-        if not TaskStatus.is_valid(status):
-            raise ValueError(
-                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+        with self._locked_for_read():
+            if not TaskStatus.is_valid(status):
+                raise ValueError(
+                    f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                )
+            ids = self._status_index.ids(status)
+            return [self._tasks[task_id] for task_id in ids]
+
+    def iter_tasks(self, status: str | None = None) -> Iterator[Task]:
+        """Iterate over stored tasks without building a list.
+
+        The read lock is held until the iteration finishes or the iterator
+        is closed, so writers in other threads wait for it.
+
+        Args:
+            status: Optional filter ('complete' or 'incomplete').
+
+        Yields:
+            Each matching task.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        with self._locked_for_read():
+            if status is None:
+                yield from self._tasks.values()
+                return
+            if not TaskStatus.is_valid(status):
+                raise ValueError(
+                    f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                )
+            for task_id in self._status_index.ids(status):
+                yield self._tasks[task_id]
+
+    def counts(self) -> Dict[str, int]:
+        """Return task counts without scanning the stored tasks.
+
+        Returns:
+            Dictionary with 'total', 'complete' and 'incomplete' counts.
+        """
+        with self._locked_for_read():
+            return self._status_index.counts()
+
+    def changes(self, since: int) -> Tuple[int, List[Dict[str, Any]] | None]:
+        """Return the task changes made after a given version.
+
+        Args:
+            since: The version the caller's copy of the tasks is at.
+
+        Returns:
+            The current version, and the latest change to each task changed
+            since then, oldest first. The changes are None if the caller
+            must reload every task instead, because the version fell off
+            the changelog or the tasks were reloaded from disk since.
+        """
+        with self._locked_for_read():
+            return self.version, self.changelog.since(since, self.version)
+
+    def page(
+        self,
+        limit: int,
+        after: int | None = None,
+        sort: str = "id",
+        reverse: bool = False,
+    ) -> Tuple[List[Task], int | None]:
+        """Retrieve tasks in a sort order, one page at a time.
+
+        Pages are read from the sort order's index with a bisect walk.
+
+        Args:
+            limit: Maximum number of tasks to return.
+            after: Cursor returned by the previous page, or None for the
+                   first page.
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+
+        Returns:
+            The page of tasks and the cursor for the next page, which is
+            None when there are no more tasks.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the cursor's task
+                        was deleted while paging in an order other than ID.
+        """
+        with self._locked_for_read():
+            tasks = self._order_index.select(
+                self._tasks, sort, reverse, limit + 1, after
             )
-        return [task for task in self._tasks.values() if task.status == status]
+            next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+            return tasks[:limit], next_cursor
+
+    def get_sorted(
+        self,
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        status: str | None = None,
+    ) -> List[Task]:
+        """Retrieve tasks in a sort order, optionally only the first few.
+
+        Args:
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            status: Optional filter ('complete' or 'incomplete').
+
+        Returns:
+            The matching tasks in order.
+
+        Raises:
+            ValueError: If the sort order or status is invalid.
+        """
+        with self._locked_for_read():
+            among = None
+            if status is not None:
+                if not TaskStatus.is_valid(status):
+                    raise ValueError(
+                        f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                    )
+                among = self._status_index.ids(status)
+            return self._order_index.select(
+                self._tasks, sort, reverse, limit, among=among
+            )
+
+    def search(self, query: str, limit: int | None = None) -> List[Task]:
+        """Find tasks whose title or description contain every query word.
+
+        The search index is loaded from the index file on first use, and
+        built from every task only when there is no usable saved copy. It
+        is then kept up to date in memory and on disk by every mutation.
+
+        Args:
+            query: Free text to search for.
+            limit: Maximum number of tasks to return, or None for all.
+
+        Returns:
+            Matching tasks, best match first.
+        """
+        with self._locked_for_read():
+            if self._search is None:
+                # Readers only read the tasks, so concurrent readers take
+                # turns building the index and publish it when complete
+                with self._search_lock:
+                    if self._search is None:
+                        self._search = self._load_search_index()
+            ids = self._search.search(query, limit)
+            return [self._tasks[task_id] for task_id in ids]
+
+    def _load_search_index(self) -> SearchIndex:
+        """Load the saved search index, or build and save a fresh one.
+
+        Returns:
+            An index of every stored task.
+        """
+        # Held-back batch records mean memory no longer matches the files
+        if self._pending:
+            index = SearchIndex()
+            index.rebuild(self._tasks.values())
+            return index
+        # Writers in other processes append to the delta log under the
+        # exclusive lock, so hold it shared while reading or replacing it
+        with self.lock.shared():
+            current = self._file_signature() == self._signature
+            index = SearchIndex.load(self.index_path, self._signature)
+            if index is None:
+                index = SearchIndex()
+                index.rebuild(self._tasks.values())
+            elif not self._index_log.should_fold():
+                return index
+            if current:
+                index.save(self.index_path, self._signature, self.durability)
+        return index
 
     def update(
         self,
@@ -162,17 +719,23 @@ class FileStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        task = self._tasks.get(task_id)
-        if task is None:
-            raise TaskNotFoundError(str(task_id))
-
-        if title is not None:
-            task.title = title
-        if description is not None:
-            task.description = description
-
-        self._save_to_file()
-        return task
+        with self._locked_for_write("update"):
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise TaskNotFoundError(str(task_id))
+
+            record: Dict[str, Any] = {"op": "update", "id": task_id}
+            self._unindex_task(task)
+            if title is not None:
+                task.title = title
+                record["title"] = title
+            if description is not None:
+                task.description = description
+                record["description"] = description
+            self._index_task(task)
+
+            self._persist(record)
+            return task
 
     def delete(self, task_id: int) -> bool:  # Changed from str to int
         """Delete a task from storage.
@@ -186,12 +749,30 @@ class FileStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        if task_id not in self._tasks:
-            raise TaskNotFoundError(str(task_id))
+        with self._locked_for_write("delete"):
+            if task_id not in self._tasks:
+                raise TaskNotFoundError(str(task_id))
 
-        del self._tasks[task_id]
-        self._save_to_file()
-        return True
+            task = self._tasks.pop(task_id)
+            self._unindex_task(task)
+            self._persist({"op": "delete", "id": task_id})
+            return True
+
+    def _remove_tasks(self, tasks: List[Task]) -> None:
+        """Remove stored tasks in one pass with a single persist.
+
+        Args:
+            tasks: The tasks to remove, all currently stored.
+        """
+        with self._locked_for_write("delete_many"):
+            for task in tasks:
+                del self._tasks[task.id]
+                self._status_index.remove(task.id, task.status)
+                if self._search is not None:
+                    self._search.remove(task)
+                self._index_log.removed(task)
+            self._order_index.remove_many(task.id for task in tasks)
+            self._persist({"op": "delete_many", "ids": [task.id for task in tasks]})
 
     def toggle_status(self, task_id: int) -> Task:  # Changed from str to int
         """Toggle a task's status between complete and incomplete.
@@ -205,23 +786,38 @@ class FileStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        task = self._tasks.get(task_id)
-        if task is None:
-            raise TaskNotFoundError(str(task_id))
+        with self._locked_for_write("toggle"):
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise TaskNotFoundError(str(task_id))
 
-        task.status = TaskStatus.toggle(task.status)
-        self._save_to_file()
-        return task
+            self._unindex_task(task)
+            task.status = TaskStatus.toggle(task.status)
+            self._index_task(task)
+            self._persist({"op": "toggle", "id": task_id, "status": task.status})
+            return task
 
     def clear(self) -> None:
         """Remove all tasks from storage.
 
         Primarily useful for testing purposes.
         """
-        self._tasks.clear()
-        self._next_id = 1
-        self._save_to_file()
+        with self._locked_for_write("clear"):
+            self._tasks.clear()
+            self._status_index.clear()
+            self._order_index.clear()
+            if self._search is not None:
+                self._search.clear()
+            self._index_log.discard()
+            self._next_id = 1
+            self.version += 1
+            self.changelog.reset(self.version)
+            # The snapshot written below already reflects held-back mutations
+            self._pending.clear()
+            self.compact()
 
+    def close(self) -> None:
+        """Release the journal and lock file handles, if open."""
+        self._log.close()
+        self.lock.close()
 
-# Module-level storage instance for use throughout the application
-storage = FileStorage()
\ No newline at end of file
@@ -0,0 +1,398 @@
+"""Secondary indexes shared by the storage backends.
+
+This module provides in-memory indexes that the storage classes keep up to
+date on every mutation, so filtered reads, sorted reads and summary counts
+do not need to scan or sort every stored task.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Tuple
+
+from todo.models import Task, TaskStatus
+
+# Orders offered by sorted reads, by name. Ties are broken by task ID, so
+# every order is total and pages never skip or repeat a task.
+SORT_KEYS: Dict[str, Callable[[Task], Any]] = {
+    "id": lambda task: task.id,
+    "created": lambda task: task.created_us,
+    "title": lambda task: task.title.casefold(),
+    "status": lambda task: task.status,
+}
+
+
+def sort_key(sort: str) -> Callable[[Task], Any]:
+    """Look up the key function of a sort order.
+
+    Args:
+        sort: 'id', 'created', 'title' or 'status'.
+
+    Returns:
+        Function returning the value tasks are ordered by.
+
+    Raises:
+        ValueError: If the sort order is unknown.
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(
+            f"Invalid sort '{sort}'. Use 'id', 'created', 'title' or 'status'."
+        )
+    return SORT_KEYS[sort]
+
+
+def top_tasks(
+    tasks: Iterable[Task],
+    sort: str = "id",
+    reverse: bool = False,
+    limit: int | None = None,
+    after: Tuple[Any, int] | None = None,
+) -> List[Task]:
+    """Sort tasks without an index.
+
+    With a limit only the first ``limit`` tasks are kept, in a heap, so
+    the cost is O(n log limit) rather than a full sort.
+
+    Args:
+        tasks: The tasks to sort.
+        sort: 'id', 'created', 'title' or 'status'.
+        reverse: If True, sort in descending order.
+        limit: Maximum number of tasks to return, or None for all.
+        after: Only return tasks whose (key, ID) entry sorts after this
+               one, or before it when ``reverse`` is set.
+
+    Returns:
+        The tasks in order.
+
+    Raises:
+        ValueError: If the sort order is unknown.
+    """
+    key = sort_key(sort)
+
+    def entry(task: Task) -> Tuple[Any, int]:
+        return (key(task), task.id)
+
+    if after is not None:
+        if reverse:
+            tasks = (task for task in tasks if entry(task) < after)
+        else:
+            tasks = (task for task in tasks if entry(task) > after)
+    if limit is None:
+        return sorted(tasks, key=entry, reverse=reverse)
+    pick = heapq.nlargest if reverse else heapq.nsmallest
+    return pick(limit, tasks, key=entry)
+
+
+class StatusIndex:
+    """Index of task IDs grouped by status.
+
+    IDs are kept in insertion-ordered dicts so filtered results come back in
+    the same order as the underlying task dictionary.
+
+    Attributes:
+        _ids: Private mapping of status value to the IDs having that status.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty status index."""
+        self._ids: Dict[str, Dict[int, None]] = {
+            TaskStatus.INCOMPLETE: {},
+            TaskStatus.COMPLETE: {},
+        }
+
+    def add(self, task_id: int, status: str) -> None:
+        """Record a task under its status.
+
+        Args:
+            task_id: The task's ID.
+            status: The task's current status.
+        """
+        self._ids.setdefault(status, {})[task_id] = None
+
+    def remove(self, task_id: int, status: str) -> None:
+        """Forget a task recorded under the given status.
+
+        Args:
+            task_id: The task's ID.
+            status: The status the task was recorded under.
+        """
+        self._ids.get(status, {}).pop(task_id, None)
+
+    def clear(self) -> None:
+        """Remove every task from the index."""
+        for ids in self._ids.values():
+            ids.clear()
+
+    def ids(self, status: str) -> Dict[int, None]:
+        """Return the IDs recorded under a status.
+
+        Args:
+            status: The status to look up.
+
+        Returns:
+            Insertion-ordered mapping whose keys are the matching task IDs.
+        """
+        return self._ids.get(status, {})
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of tasks per status plus the overall total.
+
+        Returns:
+            Dictionary with 'total', 'complete' and 'incomplete' counts.
+        """
+        complete = len(self._ids[TaskStatus.COMPLETE])
+        incomplete = len(self._ids[TaskStatus.INCOMPLETE])
+        return {
+            "total": complete + incomplete,
+            TaskStatus.COMPLETE: complete,
+            TaskStatus.INCOMPLETE: incomplete,
+        }
+
+
+class SortedIndex:
+    """Index of task IDs kept in order of a sort key.
+
+    Entries are ``(key, task_id)`` tuples in a sorted list, so ordered pages
+    are found with a bisect instead of sorting every stored task.
+
+    Attributes:
+        _key: Private function computing a task's sort key.
+        _entries: Private sorted list of (key, task_id) entries.
+        _by_id: Private mapping of task ID to its current entry.
+    """
+
+    def __init__(self, key: Callable[[Task], Any]) -> None:
+        """Initialize an empty sorted index.
+
+        Args:
+            key: Function returning the value tasks are ordered by.
+        """
+        self._key = key
+        self._entries: List[Tuple[Any, int]] = []
+        self._by_id: Dict[int, Tuple[Any, int]] = {}
+
+    def add(self, task: Task) -> None:
+        """Insert a task at its sorted position.
+
+        Args:
+            task: The task to index.
+        """
+        entry = (self._key(task), task.id)
+        insort(self._entries, entry)
+        self._by_id[task.id] = entry
+
+    def remove(self, task_id: int) -> None:
+        """Remove a task from the index.
+
+        Args:
+            task_id: The ID of the task to remove.
+        """
+        entry = self._by_id.pop(task_id, None)
+        if entry is not None:
+            del self._entries[bisect_left(self._entries, entry)]
+
+    def remove_many(self, task_ids: Iterable[int]) -> None:
+        """Remove several tasks with one pass over the index.
+
+        Cheaper than calling ``remove`` per task once more than a handful
+        are removed, since each single removal shifts the list.
+
+        Args:
+            task_ids: IDs of the tasks to remove.
+        """
+        removed = {self._by_id.pop(task_id, None) for task_id in task_ids}
+        removed.discard(None)
+        if removed:
+            self._entries = [e for e in self._entries if e not in removed]
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Replace the index contents with the given tasks.
+
+        Args:
+            tasks: Every task currently stored.
+        """
+        self._by_id = {task.id: (self._key(task), task.id) for task in tasks}
+        self._entries = sorted(self._by_id.values())
+
+    def clear(self) -> None:
+        """Remove every task from the index."""
+        self._entries.clear()
+        self._by_id.clear()
+
+    def entry(self, task_id: int) -> Tuple[Any, int] | None:
+        """Return a task's (key, task_id) entry.
+
+        Args:
+            task_id: The task's ID.
+
+        Returns:
+            The entry, or None if the task is not indexed.
+        """
+        return self._by_id.get(task_id)
+
+    def iter_ids(
+        self, after: Tuple[Any, int] | None = None, reverse: bool = False
+    ) -> Iterator[int]:
+        """Yield task IDs in sort order, starting with a bisect.
+
+        Args:
+            after: The (key, task_id) entry to start after, or None to
+                   start from the beginning.
+            reverse: If True, walk the index backwards.
+
+        Yields:
+            Task IDs in sort order, or in reverse order.
+        """
+        entries = self._entries
+        if reverse:
+            end = len(entries) if after is None else bisect_left(entries, after)
+            for position in range(end - 1, -1, -1):
+                yield entries[position][1]
+        else:
+            start = 0 if after is None else bisect_right(entries, after)
+            for position in range(start, len(entries)):
+                yield entries[position][1]
+
+
+class OrderIndex:
+    """Sorted indexes over a storage's tasks, one per sort order.
+
+    The ID order is always maintained. Every other order is built the
+    second time it is read and maintained from then on, so a long-running
+    server answers sorted pages with a bisect walk while a one-off query,
+    such as a single CLI run, is answered by ``top_tasks`` without paying
+    for a full sort.
+
+    Attributes:
+        _indexes: Private mapping of sort order to its sorted index.
+        _reads: Private number of reads per not yet indexed sort order.
+        _lock: Private mutex serializing threads building an index.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with an empty ID index."""
+        self._indexes: Dict[str, SortedIndex] = {"id": SortedIndex(SORT_KEYS["id"])}
+        self._reads: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, task: Task) -> None:
+        """Insert a task into every built index.
+
+        Args:
+            task: The task to index.
+        """
+        for index in self._indexes.values():
+            index.add(task)
+
+    def remove(self, task_id: int) -> None:
+        """Remove a task from every built index.
+
+        Args:
+            task_id: The ID of the task to remove.
+        """
+        for index in self._indexes.values():
+            index.remove(task_id)
+
+    def remove_many(self, task_ids: Iterable[int]) -> None:
+        """Remove several tasks with one pass over each built index.
+
+        Args:
+            task_ids: IDs of the tasks to remove.
+        """
+        task_ids = list(task_ids)
+        for index in self._indexes.values():
+            index.remove_many(task_ids)
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Replace the contents of every built index with the given tasks.
+
+        Args:
+            tasks: Every task currently stored.
+        """
+        tasks = list(tasks)
+        for index in self._indexes.values():
+            index.rebuild(tasks)
+
+    def clear(self) -> None:
+        """Remove every task from every built index."""
+        for index in self._indexes.values():
+            index.clear()
+
+    def _index_for(
+        self, sort: str, tasks: Dict[int, Task], limit: int | None
+    ) -> SortedIndex | None:
+        """Return the index of a sort order, building it if it is due.
+
+        Args:
+            sort: The sort order being read.
+            tasks: Every stored task, by ID.
+            limit: The read's limit; unlimited reads sort everything anyway,
+                   so they build the index straight away.
+
+        Returns:
+            The index, or None if the read should use a heap instead.
+        """
+        index = self._indexes.get(sort)
+        if index is not None:
+            return index
+        with self._lock:
+            if sort in self._indexes:
+                return self._indexes[sort]
+            self._reads[sort] = self._reads.get(sort, 0) + 1
+            if limit is not None and self._reads[sort] < 2:
+                return None
+            index = SortedIndex(SORT_KEYS[sort])
+            index.rebuild(tasks.values())
+            # Publish only once complete, for readers not holding the mutex
+            self._indexes[sort] = index
+            return index
+
+    def select(
+        self,
+        tasks: Dict[int, Task],
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        after: int | None = None,
+        among: Collection[int] | None = None,
+    ) -> List[Task]:
+        """Return stored tasks in a sort order.
+
+        Args:
+            tasks: Every stored task, by ID.
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            after: ID of the task to start after, as returned at the end of
+                   the previous page, or None to start from the beginning.
+            among: IDs to restrict the result to, or None for every task.
+
+        Returns:
+            The tasks in order.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the ``after`` task
+                        is not stored.
+        """
+        key = sort_key(sort)
+        start = None
+        if after is not None:
+            if sort == "id":
+                # ID cursors stay valid after their task is deleted
+                start = (after, after)
+            elif after in tasks:
+                start = (key(tasks[after]), after)
+            else:
+                raise ValueError(f"Cursor task '{after}' no longer exists")
+        index = self._index_for(sort, tasks, limit)
+        if index is None:
+            if among is None:
+                candidates: Iterable[Task] = tasks.values()
+            else:
+                candidates = (tasks[task_id] for task_id in among)
+            return top_tasks(candidates, sort, reverse, limit, start)
+        ids = index.iter_ids(start, reverse)
+        if among is not None:
+            ids = (task_id for task_id in ids if task_id in among)
+        return [tasks[task_id] for task_id in islice(ids, limit)]
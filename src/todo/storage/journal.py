@@ -0,0 +1,109 @@
+"""Append-only journal for the file-based storage backend.
+
+This module provides a write-ahead log where each storage mutation is
+recorded as one compact JSON line. The storage rebuilds its state by
+loading the last snapshot and replaying the journal on top of it.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, TextIO
+
+from todo.storage.durability import Durability, fsync_directory, sync_handle
+
+
+class Journal:
+    """Line-oriented append-only log of storage mutations.
+
+    Attributes:
+        path: Path to the journal file.
+        durability: Durability policy applied after every append.
+        record_count: Number of records currently in the journal.
+        _handle: Lazily opened append handle, kept open between writes.
+    """
+
+    def __init__(self, path: Path, durability: str = Durability.FLUSH) -> None:
+        """Initialize the journal.
+
+        Args:
+            path: Path to the journal file. It is created on first append.
+            durability: Durability policy applied after every append.
+        """
+        self.path = path
+        self.durability = durability
+        self.record_count = 0
+        self._handle: TextIO | None = None
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Yield the records stored in the journal, oldest first.
+
+        A torn final line left by a crash during an append is skipped,
+        since the mutation it describes never completed.
+
+        Yields:
+            Each journal record as a dictionary.
+        """
+        self.record_count = 0
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                self.record_count += 1
+                yield record
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a single record to the journal.
+
+        Args:
+            record: The mutation record to write.
+        """
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]) -> None:
+        """Append several records with one write and one sync.
+
+        The records are always flushed to the OS before returning; the
+        durability policy decides whether they are also fsynced.
+
+        Args:
+            records: The mutation records to write, oldest first.
+        """
+        if self._handle is None:
+            created = not self.path.exists()
+            self._handle = self.path.open("a", encoding="utf-8")
+            if created and self.durability == Durability.FSYNC_DIR:
+                fsync_directory(self.path.parent.resolve())
+        self._handle.write(
+            "".join(
+                json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for record in records
+            )
+        )
+        # Flush even under the 'none' policy: other processes read the journal
+        # as soon as the lock is released, so records must not sit in Python's
+        # buffer. The policy only decides whether to fsync as well.
+        self._handle.flush()
+        sync_handle(self._handle, self.durability)
+        self.record_count += len(records)
+
+    def truncate(self) -> None:
+        """Discard all records, typically after a compaction."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+            if self.durability == Durability.FSYNC_DIR:
+                fsync_directory(self.path.parent.resolve())
+        self.record_count = 0
+
+    def close(self) -> None:
+        """Close the append handle if it is open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
@@ -0,0 +1,262 @@
+"""Locking for storages shared between threads and processes.
+
+This module provides a reader/writer lock for threads within one process,
+so a threaded web server can serve many reads at once while mutations run
+one at a time, and a reader/writer lock on a sidecar lock file, so the CLI
+and every web worker sharing one data file take turns: writers reload and
+rewrite the file while holding the lock exclusively, and readers never
+load a snapshot and journal that belong to different versions.
+
+The lock file itself is never replaced, unlike the data file which is
+renamed over on every save, so all processes lock the same inode. On
+platforms without ``fcntl`` the lock only counts acquisitions.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class ReadWriteLock:
+    """Reentrant reader/writer lock for threads within one process.
+
+    Any number of threads may read at once, while a writer runs alone.
+    Waiting writers block new readers, so a steady stream of reads cannot
+    starve mutations. A thread may nest reads in reads, and reads or
+    writes in a write, but not a write in a read: two readers upgrading at
+    once would deadlock, so that raises instead.
+
+    Attributes:
+        _cond: Private condition guarding the fields below.
+        _readers: Private mapping of reading thread ID to nesting depth.
+        _writer: Private ID of the writing thread, or None.
+        _write_depth: Private nesting depth of the writer's acquisitions.
+        _waiting_writers: Private number of threads waiting to write.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unheld lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: Dict[int, int] = {}
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+
+    @property
+    def held(self) -> bool:
+        """True while the calling thread holds the lock in either mode."""
+        me = threading.get_ident()
+        return self._writer == me or me in self._readers
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock for reading for the enclosed block.
+
+        Yields:
+            None.
+        """
+        me = threading.get_ident()
+        with self._cond:
+            # The writer already excludes everyone else, so it nests as a write
+            as_writer = self._writer == me
+            if as_writer:
+                self._write_depth += 1
+            else:
+                if me not in self._readers:
+                    while self._writer is not None or self._waiting_writers:
+                        self._cond.wait()
+                self._readers[me] = self._readers.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                if as_writer:
+                    self._write_depth -= 1
+                    if not self._write_depth:
+                        self._writer = None
+                        self._cond.notify_all()
+                else:
+                    depth = self._readers.pop(me) - 1
+                    if depth:
+                        self._readers[me] = depth
+                    else:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively for the enclosed block.
+
+        Yields:
+            None.
+
+        Raises:
+            RuntimeError: If the calling thread is holding the lock for
+                          reading.
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+            elif me in self._readers:
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            else:
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+                self._write_depth = 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+class FileLock:
+    """Reentrant shared/exclusive ``flock`` on a lock file.
+
+    Nested acquisitions reuse the outermost one, which therefore has to be
+    exclusive if any nested acquisition is.
+
+    Every acquisition is first tried without blocking; one that has to wait
+    counts as contended, so the counters show how often processes get in
+    each other's way and for how long.
+
+    Attributes:
+        path: Path to the lock file.
+        acquired: Number of outermost acquisitions.
+        contended: Number of acquisitions that had to wait for another
+            process.
+        wait_seconds: Total time spent waiting for the lock.
+        max_wait_seconds: Longest single wait for the lock.
+        _fd: Private descriptor of the open lock file, or None.
+        _depth: Private nesting depth of held acquisitions.
+        _exclusive: Private flag, True while held exclusively.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize an unheld lock; the lock file is opened on first use.
+
+        Args:
+            path: Path to the lock file, created if missing.
+        """
+        self.path = path
+        self.acquired = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._fd: int | None = None
+        self._depth = 0
+        self._exclusive = False
+
+    @property
+    def held(self) -> bool:
+        """True while this process holds the lock in either mode."""
+        return self._depth > 0
+
+    def _acquire(self, exclusive: bool) -> None:
+        """Take the lock, waiting for other processes if necessary.
+
+        Args:
+            exclusive: If True, lock exclusively; otherwise shared.
+        """
+        self.acquired += 1
+        if fcntl is None:
+            return
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        try:
+            fcntl.flock(self._fd, mode | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            pass
+        start = time.perf_counter()
+        fcntl.flock(self._fd, mode)
+        waited = time.perf_counter() - start
+        self.contended += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def _release(self) -> None:
+        """Drop the lock so other processes can take it."""
+        if fcntl is not None and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _holding(self, exclusive: bool) -> Iterator[None]:
+        """Hold the lock in the given mode for the enclosed block.
+
+        Args:
+            exclusive: If True, lock exclusively; otherwise shared.
+
+        Yields:
+            None.
+
+        Raises:
+            RuntimeError: If an exclusive lock is requested while only a
+                          shared one is held.
+        """
+        if self._depth:
+            if exclusive and not self._exclusive:
+                raise RuntimeError("Cannot upgrade a shared lock to exclusive")
+        else:
+            self._acquire(exclusive)
+            self._exclusive = exclusive
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._release()
+
+    def shared(self) -> ContextManager[None]:
+        """Hold the lock shared for the enclosed block; readers may overlap.
+
+        Returns:
+            A context manager holding the lock.
+        """
+        return self._holding(False)
+
+    def exclusive(self) -> ContextManager[None]:
+        """Hold the lock exclusively for the enclosed block.
+
+        Returns:
+            A context manager holding the lock.
+        """
+        return self._holding(True)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the contention counters.
+
+        Returns:
+            Dictionary with 'acquired', 'contended', 'wait_seconds' and
+            'max_wait_seconds'.
+        """
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "wait_seconds": self.wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+    def close(self) -> None:
+        """Close the lock file; the lock must not be held."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -4,23 +4,76 @@ This module provides a simple dictionary-based storage backend for
 managing tasks during a session. Data is not persisted between runs.
 """
 
+from contextlib import contextmanager
+from typing import Iterator
+
 from todo.exceptions import TaskNotFoundError
 from todo.models import Task, TaskStatus
+from todo.storage.bulk import BulkOperationsMixin
+from todo.storage.index import OrderIndex, StatusIndex
+from todo.storage.locking import ReadWriteLock
+from todo.storage.search import SearchIndex
 
 
-class TaskStorage:
+class TaskStorage(BulkOperationsMixin):
     """In-memory storage for task management.
 
     Provides CRUD operations for tasks using a dictionary backend.
     Tasks are stored by their ID for efficient lookup.
 
     Attributes:
+        version: Counter bumped on every mutation.
         _tasks: Private dictionary mapping task IDs to Task objects.
+        _status_index: Private index of task IDs by status.
+        _order_index: Private sorted indexes of task IDs, one per sort order.
+        _search: Private full-text index over titles and descriptions.
+        _rw: Private lock letting threads read at once but write one at a
+            time.
     """
 
     def __init__(self) -> None:
         """Initialize an empty task storage."""
         self._tasks: dict[str, Task] = {}
+        self._status_index = StatusIndex()
+        self._order_index = OrderIndex()
+        self._search = SearchIndex()
+        self._rw = ReadWriteLock()
+        self.version = 0
+
+    def _index_task(self, task: Task) -> None:
+        """Add a stored task to every secondary index.
+
+        Args:
+            task: The task, already present in ``_tasks``.
+        """
+        self._status_index.add(task.id, task.status)
+        self._order_index.add(task)
+        self._search.add(task)
+
+    def _unindex_task(self, task: Task) -> None:
+        """Remove a task from every secondary index.
+
+        Must be called before the indexed fields of the task change.
+
+        Args:
+            task: The task as it is currently indexed.
+        """
+        self._status_index.remove(task.id, task.status)
+        self._order_index.remove(task.id)
+        self._search.remove(task)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations so other threads see them all at once.
+
+        Nothing is persisted, so this only holds the write lock for the
+        duration of the block.
+
+        Yields:
+            None.
+        """
+        with self._rw.write():
+            yield
 
     def add(self, task: Task) -> Task:
         """Add a new task to storage.
@@ -31,8 +84,14 @@ class TaskStorage:
         Returns:
             The added task.
         """
-        self._tasks[task.id] = task
-        return task
+        with self._rw.write():
+            previous = self._tasks.get(task.id)
+            if previous is not None:
+                self._unindex_task(previous)
+            self._tasks[task.id] = task
+            self._index_task(task)
+            self.version += 1
+            return task
 
     def get_all(self) -> list[Task]:
         """Retrieve all tasks from storage.
@@ -40,7 +99,8 @@ class TaskStorage:
         Returns:
             List of all tasks, may be empty.
         """
-        return list(self._tasks.values())
+        with self._rw.read():
+            return list(self._tasks.values())
 
     def get_by_id(self, task_id: str) -> Task | None:
         """Retrieve a task by its ID.
@@ -51,7 +111,8 @@ class TaskStorage:
         Returns:
             The task if found, None otherwise.
         """
-        return self._tasks.get(task_id)
+        with self._rw.read():
+            return self._tasks.get(task_id)
 
     def get_by_status(self, status: str) -> list[Task]:
         """Retrieve tasks filtered by status.
@@ -65,11 +126,128 @@ class TaskStorage:
         Raises:
             ValueError: If status is not 'complete' or 'incomplete'.
         """
-        if not TaskStatus.is_valid(status):
-            raise ValueError(
-                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+        with self._rw.read():
+            if not TaskStatus.is_valid(status):
+                raise ValueError(
+                    f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                )
+            ids = self._status_index.ids(status)
+            return [self._tasks[task_id] for task_id in ids]
+
+    def iter_tasks(self, status: str | None = None) -> Iterator[Task]:
+        """Iterate over stored tasks without building a list.
+
+        The read lock is held until the iteration finishes or the iterator
+        is closed, so writers in other threads wait for it.
+
+        Args:
+            status: Optional filter ('complete' or 'incomplete').
+
+        Yields:
+            Each matching task.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        with self._rw.read():
+            if status is None:
+                yield from self._tasks.values()
+                return
+            if not TaskStatus.is_valid(status):
+                raise ValueError(
+                    f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                )
+            for task_id in self._status_index.ids(status):
+                yield self._tasks[task_id]
+
+    def counts(self) -> dict[str, int]:
+        """Return task counts without scanning the stored tasks.
+
+        Returns:
+            Dictionary with 'total', 'complete' and 'incomplete' counts.
+        """
+        with self._rw.read():
+            return self._status_index.counts()
+
+    def page(
+        self,
+        limit: int,
+        after: int | None = None,
+        sort: str = "id",
+        reverse: bool = False,
+    ) -> tuple[list[Task], int | None]:
+        """Retrieve tasks in a sort order, one page at a time.
+
+        Pages are read from the sort order's index with a bisect walk.
+
+        Args:
+            limit: Maximum number of tasks to return.
+            after: Cursor returned by the previous page, or None for the
+                   first page.
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+
+        Returns:
+            The page of tasks and the cursor for the next page, which is
+            None when there are no more tasks.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the cursor's task
+                        was deleted while paging in an order other than ID.
+        """
+        with self._rw.read():
+            tasks = self._order_index.select(
+                self._tasks, sort, reverse, limit + 1, after
+            )
+            next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+            return tasks[:limit], next_cursor
+
+    def get_sorted(
+        self,
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        status: str | None = None,
+    ) -> list[Task]:
+        """Retrieve tasks in a sort order, optionally only the first few.
+
+        Args:
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            status: Optional filter ('complete' or 'incomplete').
+
+        Returns:
+            The matching tasks in order.
+
+        Raises:
+            ValueError: If the sort order or status is invalid.
+        """
+        with self._rw.read():
+            among = None
+            if status is not None:
+                if not TaskStatus.is_valid(status):
+                    raise ValueError(
+                        f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+                    )
+                among = self._status_index.ids(status)
+            return self._order_index.select(
+                self._tasks, sort, reverse, limit, among=among
             )
-        return [task for task in self._tasks.values() if task.status == status]
+
+    def search(self, query: str, limit: int | None = None) -> list[Task]:
+        """Find tasks whose title or description contain every query word.
+
+        Args:
+            query: Free text to search for.
+            limit: Maximum number of tasks to return, or None for all.
+
+        Returns:
+            Matching tasks, best match first.
+        """
+        with self._rw.read():
+            ids = self._search.search(query, limit)
+            return [self._tasks[task_id] for task_id in ids]
 
     def update(
         self,
@@ -92,16 +270,20 @@ class TaskStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        task = self._tasks.get(task_id)
-        if task is None:
-            raise TaskNotFoundError(task_id)
+        with self._rw.write():
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise TaskNotFoundError(task_id)
 
-        if title is not None:
-            task.title = title
-        if description is not None:
-            task.description = description
+            self._unindex_task(task)
+            if title is not None:
+                task.title = title
+            if description is not None:
+                task.description = description
+            self._index_task(task)
 
-        return task
+            self.version += 1
+            return task
 
     def delete(self, task_id: str) -> bool:
         """Delete a task from storage.
@@ -115,11 +297,28 @@ class TaskStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        if task_id not in self._tasks:
-            raise TaskNotFoundError(task_id)
+        with self._rw.write():
+            if task_id not in self._tasks:
+                raise TaskNotFoundError(task_id)
+
+            task = self._tasks.pop(task_id)
+            self._unindex_task(task)
+            self.version += 1
+            return True
 
-        del self._tasks[task_id]
-        return True
+    def _remove_tasks(self, tasks: list[Task]) -> None:
+        """Remove stored tasks in one pass.
+
+        Args:
+            tasks: The tasks to remove, all currently stored.
+        """
+        with self._rw.write():
+            for task in tasks:
+                del self._tasks[task.id]
+                self._status_index.remove(task.id, task.status)
+                self._search.remove(task)
+            self._order_index.remove_many(task.id for task in tasks)
+            self.version += 1
 
     def toggle_status(self, task_id: str) -> Task:
         """Toggle a task's status between complete and incomplete.
@@ -133,19 +332,28 @@ class TaskStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        task = self._tasks.get(task_id)
-        if task is None:
-            raise TaskNotFoundError(task_id)
+        with self._rw.write():
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise TaskNotFoundError(task_id)
 
-        task.status = TaskStatus.toggle(task.status)
-        return task
+            self._unindex_task(task)
+            task.status = TaskStatus.toggle(task.status)
+            self._index_task(task)
+            self.version += 1
+            return task
 
     def clear(self) -> None:
         """Remove all tasks from storage.
 
         Primarily useful for testing purposes.
         """
-        self._tasks.clear()
+        with self._rw.write():
+            self._tasks.clear()
+            self._status_index.clear()
+            self._order_index.clear()
+            self._search.clear()
+            self.version += 1
 
 
 # Module-level storage instance for use throughout the application
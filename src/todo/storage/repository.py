@@ -0,0 +1,105 @@
+"""Process-level task repository for the web applications.
+
+This module keeps one FileStorage per data file for the lifetime of the
+process, so web requests are served from memory and the file is only
+re-parsed when another process has actually changed it.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict
+
+from todo import metrics
+from todo.config import load_settings
+from todo.models import TaskStatus
+from todo.storage.file import FileStorage
+
+# Storage instances shared by every request in this process, by data file
+_repositories: Dict[Path, FileStorage] = {}
+
+# Serializes creating repositories, so concurrent first requests share one
+_repositories_lock = threading.Lock()
+
+
+def _file_size(path: Path) -> int:
+    """Return a file's size, or 0 if it does not exist.
+
+    Args:
+        path: The file to stat.
+
+    Returns:
+        The size in bytes.
+    """
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _export_metrics(repository: FileStorage) -> None:
+    """Report a repository's task counts, file sizes and lock contention.
+
+    The values are read from the repository whenever metrics are rendered.
+
+    Args:
+        repository: The storage to report on.
+    """
+    name = repository.file_path.name
+    for status in (TaskStatus.COMPLETE, TaskStatus.INCOMPLETE):
+        metrics.STORAGE_TASKS.set_function(
+            lambda status=status: repository.counts()[status],
+            file=name,
+            status=status,
+        )
+    paths = [repository.file_path]
+    if repository.journal is not None:
+        paths.append(repository.journal.path)
+    for path in paths:
+        metrics.STORAGE_FILE_BYTES.set_function(
+            lambda path=path: _file_size(path), file=path.name
+        )
+    lock = repository.lock
+    metrics.STORAGE_LOCK_ACQUISITIONS.set_function(lambda: lock.acquired, file=name)
+    metrics.STORAGE_LOCK_CONTENDED.set_function(lambda: lock.contended, file=name)
+    metrics.STORAGE_LOCK_WAIT_SECONDS.set_function(
+        lambda: lock.wait_seconds, file=name
+    )
+
+
+def get_repository(file_path: str | Path | None = None) -> FileStorage:
+    """Return the shared, up-to-date storage for a data file.
+
+    The storage is created on first use with the environment's settings.
+    Later calls only stat the file and reload it if it changed on disk.
+
+    Args:
+        file_path: Path to the JSON data file. Defaults to the configured
+                   data file (TODO_DATA_FILE), the one the CLI uses.
+
+    Returns:
+        The process-wide FileStorage for that file.
+    """
+    if file_path is None:
+        file_path = load_settings().data_file
+    key = Path(file_path).resolve()
+    repository = _repositories.get(key)
+    if repository is not None:
+        repository.refresh()
+        return repository
+
+    with _repositories_lock:
+        # Another thread may have created it while this one waited
+        repository = _repositories.get(key)
+        if repository is None:
+            settings = load_settings()
+            repository = FileStorage(
+                Path(file_path),
+                journal=settings.journal,
+                compact_ratio=settings.compact_ratio,
+                durability=settings.durability,
+                codec=settings.codec,
+                changelog_size=settings.changelog_size,
+            )
+            _repositories[key] = repository
+            _export_metrics(repository)
+    return repository
@@ -0,0 +1,399 @@
+"""Full-text search index shared by the storage backends.
+
+This module provides an inverted index from word tokens to the tasks whose
+title or description contains them. Storages keep it up to date on every
+mutation and can save it beside their data file, so a search only looks at
+the tasks that match instead of scanning every stored task.
+
+The saved index stays valid across writes: each write appends the index
+changes it made to a delta log beside the index file, and loading replays
+them, so a process that never searched does not force the next search to
+rebuild the index from every task.
+"""
+
+import heapq
+import json
+import math
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from todo.models import Task
+from todo.storage.durability import atomic_write, sync_handle
+
+_TOKEN = re.compile(r"\w+")
+
+# Weight of a token occurrence in the title relative to the description
+_TITLE_WEIGHT = 2
+
+# Version of the on-disk index layout
+_FORMAT = 1
+
+# Delta log size below which it is never folded into the saved index
+_MIN_FOLD_BYTES = 64 * 1024
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The tokens in order of appearance, including repeats.
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def delta_log_path(path: Path) -> Path:
+    """Return the path of the delta log kept beside an index file.
+
+    Args:
+        path: The index file.
+
+    Returns:
+        The delta log's path, e.g. 'todos.json.idx.log'.
+    """
+    return path.with_name(path.name + ".log")
+
+
+def _json_signature(signature: tuple) -> list:
+    """Normalize a file signature to the form it takes after a JSON round trip.
+
+    Args:
+        signature: A storage's file signature.
+
+    Returns:
+        The signature as nested lists.
+    """
+    return json.loads(json.dumps(signature))
+
+
+class SearchIndex:
+    """Inverted index of task IDs by word token.
+
+    Each posting records a token's weight in a task: one per occurrence in
+    the description and two per occurrence in the title. Results are ranked
+    by the sum of weight times inverse document frequency over the query
+    tokens, so rare words and title matches count most.
+
+    Attributes:
+        _postings: Private mapping of token to {task ID: weight}.
+        _count: Private number of indexed tasks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty search index."""
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return self._count
+
+    @staticmethod
+    def _weights(task: Task) -> Dict[str, int]:
+        """Compute a task's weight per token.
+
+        Args:
+            task: The task to tokenize.
+
+        Returns:
+            Mapping of each token in the task to its weight.
+        """
+        weights: Dict[str, int] = {}
+        for token in tokenize(task.title):
+            weights[token] = weights.get(token, 0) + _TITLE_WEIGHT
+        for token in tokenize(task.description):
+            weights[token] = weights.get(token, 0) + 1
+        return weights
+
+    def add(self, task: Task) -> None:
+        """Index a task that is not indexed yet.
+
+        Args:
+            task: The task to index.
+        """
+        self._insert(task.id, self._weights(task))
+
+    def _insert(self, task_id: int, weights: Dict[str, int]) -> None:
+        """Add a task's postings.
+
+        Args:
+            task_id: The task's ID.
+            weights: The task's weight per token.
+        """
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[task_id] = weight
+        self._count += 1
+
+    def remove(self, task: Task) -> None:
+        """Forget a task.
+
+        Must be called before the task's title or description changes, since
+        its postings are found by tokenizing them again.
+
+        Args:
+            task: The task as it is currently indexed.
+        """
+        self._delete(task.id, self._weights(task))
+
+    def _delete(self, task_id: int, tokens: Iterable[str]) -> None:
+        """Remove a task's postings.
+
+        Args:
+            task_id: The task's ID.
+            tokens: The tokens the task is indexed under.
+        """
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None or postings.pop(task_id, None) is None:
+                continue
+            if not postings:
+                del self._postings[token]
+        # Tasks without tokens have no postings but still count as indexed
+        self._count -= 1
+
+    def apply(self, changes: Iterable[list]) -> None:
+        """Replay index changes recorded by a SearchIndexLog.
+
+        Args:
+            changes: ['add', task ID, weights] and ['remove', task ID,
+                     tokens] entries, oldest first.
+        """
+        for op, task_id, data in changes:
+            if op == "add":
+                self._insert(task_id, data)
+            else:
+                self._delete(task_id, data)
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """Replace the index contents with the given tasks.
+
+        Args:
+            tasks: Every task currently stored.
+        """
+        self.clear()
+        for task in tasks:
+            self.add(task)
+
+    def clear(self) -> None:
+        """Remove every task from the index."""
+        self._postings.clear()
+        self._count = 0
+
+    def search(self, query: str, limit: int | None = None) -> List[int]:
+        """Find the tasks containing every token of a query, best first.
+
+        Args:
+            query: Free text; matching ignores case and punctuation.
+            limit: Maximum number of IDs to return, or None for all.
+
+        Returns:
+            Matching task IDs ordered by descending score, then ascending ID.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+        postings = sorted((self._postings.get(t, {}) for t in tokens), key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(other.keys())
+        if not candidates:
+            return []
+
+        idf = [math.log(1 + self._count / len(p)) for p in postings]
+        scored = [
+            (-sum(p[task_id] * w for p, w in zip(postings, idf)), task_id)
+            for task_id in candidates
+        ]
+        if limit is None:
+            scored.sort()
+        else:
+            scored = heapq.nsmallest(limit, scored)
+        return [task_id for _, task_id in scored]
+
+    def save(self, path: Path, signature: tuple, policy: str) -> None:
+        """Write the index to disk, tagged with the data it was built from.
+
+        The delta log is removed, since the saved index already holds its
+        changes.
+
+        Args:
+            path: The index file to write.
+            signature: File signature of the storage the index reflects.
+            policy: The durability policy to honour.
+        """
+        data = {
+            "format": _FORMAT,
+            "signature": signature,
+            "count": self._count,
+            "postings": {
+                token: [list(postings), list(postings.values())]
+                for token, postings in self._postings.items()
+            },
+        }
+        # dumps() encodes in C; dump() would encode chunk by chunk in Python
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        atomic_write(path, lambda f: f.write(text), policy)
+        delta_log_path(path).unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, path: Path, signature: tuple) -> "SearchIndex | None":
+        """Read an index saved by ``save`` and bring it up to date.
+
+        Changes in the delta log are replayed as long as each continues
+        from the data the index reflects so far.
+
+        Args:
+            path: The index file to read.
+            signature: Current file signature of the storage.
+
+        Returns:
+            The loaded index, or None if the file is missing or unreadable,
+            or the delta log does not lead to the current data.
+        """
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != _FORMAT:
+            return None
+        index = cls()
+        index._count = data["count"]
+        index._postings = {
+            token: dict(zip(ids, weights))
+            for token, (ids, weights) in data["postings"].items()
+        }
+        current = data.get("signature")
+        try:
+            with delta_log_path(path).open("r", encoding="utf-8") as f:
+                for line in f:
+                    delta = json.loads(line)
+                    if delta["from"] == current:
+                        index.apply(delta["changes"])
+                        current = delta["to"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError):
+            # A torn final line from a crash ends the usable log
+            pass
+        if current != _json_signature(signature):
+            return None
+        return index
+
+
+class SearchIndexLog:
+    """Records a storage's index changes and appends them to the delta log.
+
+    Storages report every task they index or unindex, then call
+    ``commit()`` once the write reached the data file. Changes are only
+    recorded while an index file exists, since otherwise the next search
+    builds a fresh index anyway.
+
+    Attributes:
+        path: The index file the delta log belongs to.
+        _changes: Private changes recorded since the last commit.
+        _tracking: Private flag, None until the current write checked for
+            an index file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize a log with no recorded changes.
+
+        Args:
+            path: The index file the delta log belongs to.
+        """
+        self.path = path
+        self._changes: List[list] = []
+        self._tracking: bool | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether there is a saved index to update; checked once per write."""
+        if self._tracking is None:
+            self._tracking = self.path.exists()
+        return self._tracking
+
+    def added(self, task: Task) -> None:
+        """Record that a task was indexed.
+
+        Args:
+            task: The task as indexed.
+        """
+        if self.active:
+            self._changes.append(["add", task.id, SearchIndex._weights(task)])
+
+    def removed(self, task: Task) -> None:
+        """Record that a task was unindexed.
+
+        Args:
+            task: The task as it was indexed.
+        """
+        if self.active:
+            self._changes.append(["remove", task.id, list(SearchIndex._weights(task))])
+
+    def commit(
+        self,
+        before: tuple,
+        after: tuple,
+        policy: str,
+        index: SearchIndex | None = None,
+    ) -> None:
+        """Persist the index changes of a write once it reached the data file.
+
+        A write that changed no tasks still links the signatures, so the
+        saved index stays valid. When the delta log has outgrown the saved
+        index and the caller holds an up-to-date index, that index is saved
+        in its place instead.
+
+        Args:
+            before: File signature of the data before the write.
+            after: File signature of the data after the write.
+            policy: The durability policy to honour.
+            index: The caller's index of the data after the write, if any.
+        """
+        changes, self._changes = self._changes, []
+        active = self.active
+        self._tracking = None
+        if not active or (before == after and not changes):
+            return
+        if index is not None and self.should_fold():
+            index.save(self.path, after, policy)
+            return
+        delta = {
+            "from": _json_signature(before),
+            "to": _json_signature(after),
+            "changes": changes,
+        }
+        with delta_log_path(self.path).open("a", encoding="utf-8") as f:
+            f.write(json.dumps(delta, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            sync_handle(f, policy)
+
+    def should_fold(self) -> bool:
+        """Check whether the delta log has grown larger than the saved index.
+
+        Returns:
+            True if saving the whole index again would be cheaper to load
+            than replaying the log.
+        """
+        try:
+            size = delta_log_path(self.path).stat().st_size
+        except FileNotFoundError:
+            return False
+        try:
+            index_size = self.path.stat().st_size
+        except FileNotFoundError:
+            index_size = 0
+        return size > max(_MIN_FOLD_BYTES, index_size)
+
+    def discard(self) -> None:
+        """Delete the saved index and its delta log, e.g. after a clear."""
+        self._changes = []
+        self._tracking = None
+        self.path.unlink(missing_ok=True)
+        delta_log_path(self.path).unlink(missing_ok=True)
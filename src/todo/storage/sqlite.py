@@ -0,0 +1,596 @@
+"""SQLite storage implementation for the Todo CLI application.
+
+This module provides a SQLite-backed storage with the same interface as
+FileStorage. Each mutation touches a single row, so its cost does not grow
+with the number of stored tasks.
+"""
+
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from todo import profiling
+from todo.exceptions import TaskNotFoundError
+from todo.models import Task, TaskStatus
+from todo.storage.bulk import BulkOperationsMixin
+from todo.storage.codec import read_tasks
+from todo.storage.durability import Durability
+from todo.storage.index import sort_key
+from todo.storage.search import tokenize
+
+# SQLite "synchronous" pragma used for each durability policy
+_SYNCHRONOUS = {
+    Durability.NONE: "OFF",
+    Durability.FLUSH: "NORMAL",
+    Durability.FSYNC: "FULL",
+    Durability.FSYNC_DIR: "FULL",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks (title COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Full-text index over titles and descriptions, kept in step by triggers
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, content='tasks', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO tasks_fts (rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+"""
+
+_COLUMNS = "id, title, description, status, created_at"
+
+# Column and collation each sort order is read by; ties are broken by ID
+_SORT_COLUMNS = {
+    "id": ("id", ""),
+    "created": ("created_at", ""),
+    "title": ("title", " COLLATE NOCASE"),
+    "status": ("status", ""),
+}
+_TASK_COLUMNS = ", ".join(f"tasks.{column}" for column in _COLUMNS.split(", "))
+
+
+def _row_to_task(row: sqlite3.Row) -> Task:
+    """Convert a database row into a Task.
+
+    Args:
+        row: A row selected with the standard task columns.
+
+    Returns:
+        The corresponding task.
+    """
+    return Task.from_dict(dict(row))
+
+
+class SqliteStorage(BulkOperationsMixin):
+    """SQLite-backed storage for task management.
+
+    Provides the same CRUD operations as FileStorage, backed by a SQLite
+    database in WAL journal mode with indexes on status and creation time,
+    and an FTS5 full-text index over titles and descriptions.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+        durability: Durability policy mapped onto SQLite's synchronous pragma.
+        instance_id: Random token identifying this storage instance.
+        _conn: Private database connection.
+        _writes: Private count of mutations committed through this instance.
+        _batch_depth: Private nesting depth of open ``batch()`` blocks.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = None,
+        migrate_from: Path | None = None,
+        durability: str = Durability.FLUSH,
+    ) -> None:
+        """Initialize SQLite storage.
+
+        Args:
+            db_path: Path to the database file.
+                     Defaults to Path("todos.db") in current directory.
+            migrate_from: Optional JSON data file imported once into an
+                          empty database.
+            durability: One of 'none', 'flush', 'fsync' or 'fsync+dir'.
+
+        Raises:
+            ValueError: If durability is not a known policy.
+        """
+        if not Durability.is_valid(durability):
+            raise ValueError(
+                f"Invalid durability '{durability}'. "
+                "Use 'none', 'flush', 'fsync' or 'fsync+dir'."
+            )
+        self.db_path = db_path or Path("todos.db")
+        self.durability = durability
+        self.instance_id = uuid.uuid4().hex[:12]
+        self._writes = 0
+        self._batch_depth = 0
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={_SYNCHRONOUS[durability]}")
+        # Lets the REPLACE in add() fire the delete trigger for the old row
+        self._conn.execute("PRAGMA recursive_triggers=ON")
+        self._conn.executescript(_SCHEMA)
+        self._create_search_index()
+        if migrate_from is not None:
+            self._migrate_from_json(migrate_from)
+
+    def _migrate_from_json(self, json_path: Path) -> None:
+        """Import tasks from a FileStorage JSON file, once.
+
+        The import only runs when the database has never been migrated and
+        holds no tasks, so an existing database is never overwritten.
+
+        Args:
+            json_path: Path to the JSON data file.
+        """
+        migrated = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'migrated_from'"
+        ).fetchone()
+        if migrated is not None or not json_path.exists():
+            return
+        if self._conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone():
+            return
+
+        tasks = read_tasks(json_path)
+
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        task.id,
+                        task.title,
+                        task.description,
+                        task.status,
+                        task.created_at.isoformat(),
+                    )
+                    for task in tasks
+                ),
+            )
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_from', ?)",
+                (str(json_path),),
+            )
+
+    def _create_search_index(self) -> None:
+        """Create the full-text index, filling it from any existing tasks."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'"
+        ).fetchone()
+        self._conn.executescript(_SEARCH_SCHEMA)
+        if not exists:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"
+                )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Commit the enclosed statements, unless a batch will commit them.
+
+        Yields:
+            None.
+        """
+        if self._batch_depth:
+            yield
+            return
+        with profiling.phase("persist"), self._conn:
+            yield
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations into a single transaction and commit.
+
+        Yields:
+            None.
+        """
+        self._batch_depth += 1
+        try:
+            if self._batch_depth == 1:
+                with self._conn:
+                    yield
+            else:
+                yield
+        finally:
+            self._batch_depth -= 1
+
+    @property
+    def version(self) -> int:
+        """Counter that increases whenever the stored tasks change.
+
+        Combines this connection's own commits with SQLite's data_version,
+        which moves when other connections commit.
+        """
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return self._writes + data_version
+
+    def refresh(self) -> bool:
+        """Match the file-based storages' reload hook.
+
+        Every read queries the database, so there is nothing to reload.
+
+        Returns:
+            Always False.
+        """
+        return False
+
+    def add(self, task: Task) -> Task:
+        """Add a new task to storage.
+
+        Args:
+            task: The task to add.
+
+        Returns:
+            The added task.
+        """
+        task_id = None if task.id is None or task.id == 0 else task.id
+        with self._transaction():
+            cursor = self._conn.execute(
+                f"INSERT OR REPLACE INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                (
+                    task_id,
+                    task.title,
+                    task.description,
+                    task.status,
+                    task.created_at.isoformat(),
+                ),
+            )
+        self._writes += 1
+        task.id = cursor.lastrowid
+        return task
+
+    def get_all(self) -> List[Task]:
+        """Retrieve all tasks from storage.
+
+        Returns:
+            List of all tasks, may be empty.
+        """
+        rows = self._conn.execute(f"SELECT {_COLUMNS} FROM tasks ORDER BY id")
+        return [_row_to_task(row) for row in rows]
+
+    def get_by_id(self, task_id: int) -> Task | None:
+        """Retrieve a task by its ID.
+
+        Args:
+            task_id: The unique identifier of the task.
+
+        Returns:
+            The task if found, None otherwise.
+        """
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        return _row_to_task(row) if row is not None else None
+
+    def get_by_status(self, status: str) -> List[Task]:
+        """Retrieve tasks filtered by status.
+
+        Args:
+            status: Filter value ('complete' or 'incomplete').
+
+        Returns:
+            List of tasks matching the status filter.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        if not TaskStatus.is_valid(status):
+            raise ValueError(
+                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+            )
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM tasks WHERE status = ? ORDER BY id", (status,)
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def iter_tasks(self, status: str | None = None) -> Iterator[Task]:
+        """Iterate over stored tasks, fetching rows from the cursor lazily.
+
+        Args:
+            status: Optional filter ('complete' or 'incomplete').
+
+        Yields:
+            Each matching task, in ID order.
+
+        Raises:
+            ValueError: If status is not 'complete' or 'incomplete'.
+        """
+        if status is None:
+            rows = self._conn.execute(f"SELECT {_COLUMNS} FROM tasks ORDER BY id")
+        elif TaskStatus.is_valid(status):
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tasks WHERE status = ? ORDER BY id",
+                (status,),
+            )
+        else:
+            raise ValueError(
+                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+            )
+        for row in rows:
+            yield _row_to_task(row)
+
+    def counts(self) -> Dict[str, int]:
+        """Return task counts using the status index.
+
+        Returns:
+            Dictionary with 'total', 'complete' and 'incomplete' counts.
+        """
+        counts = {TaskStatus.COMPLETE: 0, TaskStatus.INCOMPLETE: 0}
+        rows = self._conn.execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        )
+        for status, count in rows:
+            counts[status] = count
+        counts["total"] = counts[TaskStatus.COMPLETE] + counts[TaskStatus.INCOMPLETE]
+        return counts
+
+    def _sorted_query(
+        self,
+        sort: str,
+        reverse: bool,
+        limit: int | None,
+        status: str | None = None,
+        after: int | None = None,
+    ) -> List[Task]:
+        """Select tasks in a sort order, letting SQLite use its indexes.
+
+        Args:
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            status: Optional, already validated, status filter.
+            after: ID of the task to start after, or None.
+
+        Returns:
+            The tasks in order.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the ``after`` task
+                        is not stored.
+        """
+        sort_key(sort)
+        column, collation = _SORT_COLUMNS[sort]
+        direction = " DESC" if reverse else ""
+        conditions: List[str] = []
+        params: List[object] = []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if after is not None:
+            op = "<" if reverse else ">"
+            if sort == "id":
+                conditions.append(f"id {op} ?")
+                params.append(after)
+            else:
+                row = self._conn.execute(
+                    f"SELECT {column} FROM tasks WHERE id = ?", (after,)
+                ).fetchone()
+                if row is None:
+                    raise ValueError(f"Cursor task '{after}' no longer exists")
+                conditions.append(f"({column}{collation}, id) {op} (?, ?)")
+                params.extend((row[0], after))
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        order = f"id{direction}"
+        if sort != "id":
+            order = f"{column}{collation}{direction}, {order}"
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM tasks {where}ORDER BY {order} LIMIT ?",
+            (*params, -1 if limit is None else limit),
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def page(
+        self,
+        limit: int,
+        after: int | None = None,
+        sort: str = "id",
+        reverse: bool = False,
+    ) -> Tuple[List[Task], int | None]:
+        """Retrieve tasks in a sort order, one page at a time.
+
+        Args:
+            limit: Maximum number of tasks to return.
+            after: Cursor returned by the previous page, or None for the
+                   first page.
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+
+        Returns:
+            The page of tasks and the cursor for the next page, which is
+            None when there are no more tasks.
+
+        Raises:
+            ValueError: If the sort order is unknown, or the cursor's task
+                        was deleted while paging in an order other than ID.
+        """
+        tasks = self._sorted_query(sort, reverse, limit + 1, after=after)
+        next_cursor = tasks[limit - 1].id if len(tasks) > limit else None
+        return tasks[:limit], next_cursor
+
+    def get_sorted(
+        self,
+        sort: str = "id",
+        reverse: bool = False,
+        limit: int | None = None,
+        status: str | None = None,
+    ) -> List[Task]:
+        """Retrieve tasks in a sort order, optionally only the first few.
+
+        Args:
+            sort: 'id', 'created', 'title' or 'status'.
+            reverse: If True, sort in descending order.
+            limit: Maximum number of tasks to return, or None for all.
+            status: Optional filter ('complete' or 'incomplete').
+
+        Returns:
+            The matching tasks in order.
+
+        Raises:
+            ValueError: If the sort order or status is invalid.
+        """
+        if status is not None and not TaskStatus.is_valid(status):
+            raise ValueError(
+                f"Invalid status '{status}'. Use 'complete' or 'incomplete'."
+            )
+        return self._sorted_query(sort, reverse, limit, status)
+
+    def search(self, query: str, limit: int | None = None) -> List[Task]:
+        """Find tasks whose title or description contain every query word.
+
+        Args:
+            query: Free text to search for.
+            limit: Maximum number of tasks to return, or None for all.
+
+        Returns:
+            Matching tasks, best match first by BM25 with titles weighted
+            twice as much as descriptions.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Quoted tokens are matched literally and implicitly ANDed
+        match = " ".join(f'"{token}"' for token in tokens)
+        rows = self._conn.execute(
+            f"SELECT {_TASK_COLUMNS} FROM tasks_fts "
+            "JOIN tasks ON tasks.id = tasks_fts.rowid WHERE tasks_fts MATCH ? "
+            "ORDER BY bm25(tasks_fts, 2.0, 1.0), tasks.id LIMIT ?",
+            (match, -1 if limit is None else limit),
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def update(
+        self,
+        task_id: int,
+        title: str | None = None,
+        description: str | None = None,
+    ) -> Task:
+        """Update an existing task.
+
+        Only the provided fields are updated; others remain unchanged.
+
+        Args:
+            task_id: The unique identifier of the task to update.
+            title: New title (optional, None means no change).
+            description: New description (optional, None means no change).
+
+        Returns:
+            The updated task.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE tasks SET title = COALESCE(?, title), "
+                "description = COALESCE(?, description) WHERE id = ?",
+                (title, description, task_id),
+            )
+        if cursor.rowcount == 0:
+            raise TaskNotFoundError(str(task_id))
+        self._writes += 1
+        return self.get_by_id(task_id)
+
+    def delete(self, task_id: int) -> bool:
+        """Delete a task from storage.
+
+        Args:
+            task_id: The unique identifier of the task to delete.
+
+        Returns:
+            True if the task was deleted successfully.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        with self._transaction():
+            cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        if cursor.rowcount == 0:
+            raise TaskNotFoundError(str(task_id))
+        self._writes += 1
+        return True
+
+    def _remove_tasks(self, tasks: List[Task]) -> None:
+        """Remove stored tasks in a single transaction.
+
+        Args:
+            tasks: The tasks to remove, all currently stored.
+        """
+        with self._transaction():
+            self._conn.executemany(
+                "DELETE FROM tasks WHERE id = ?", [(task.id,) for task in tasks]
+            )
+        self._writes += 1
+
+    def toggle_status(self, task_id: int) -> Task:
+        """Toggle a task's status between complete and incomplete.
+
+        Args:
+            task_id: The unique identifier of the task.
+
+        Returns:
+            The updated task with toggled status.
+
+        Raises:
+            TaskNotFoundError: If no task exists with the given ID.
+        """
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE tasks SET status = CASE status WHEN ? THEN ? ELSE ? END "
+                "WHERE id = ?",
+                (
+                    TaskStatus.INCOMPLETE,
+                    TaskStatus.COMPLETE,
+                    TaskStatus.INCOMPLETE,
+                    task_id,
+                ),
+            )
+        if cursor.rowcount == 0:
+            raise TaskNotFoundError(str(task_id))
+        self._writes += 1
+        return self.get_by_id(task_id)
+
+    def clear(self) -> None:
+        """Remove all tasks from storage.
+
+        Primarily useful for testing purposes.
+        """
+        with self._transaction():
+            self._conn.execute("DELETE FROM tasks")
+            self._conn.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks'")
+        self._writes += 1
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -7,8 +7,10 @@ the application.
 from todo.utils.helpers import (
     format_table,
     generate_task_id,
+    iter_table,
     truncate_text,
     validate_title,
+    write_table,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "validate_title",
     "truncate_text",
     "format_table",
+    "iter_table",
+    "write_table",
 ]
@@ -4,6 +4,9 @@ This module provides common utilities including ID generation,
 input validation, text formatting, and table rendering.
 """
 
+from itertools import chain, islice
+from typing import Iterable, Iterator, TextIO
+
 from todo.exceptions import EmptyTitleError
 
 
@@ -62,28 +65,40 @@ def truncate_text(text: str, max_length: int = 30) -> str:
     return text[: max_length - 3] + "..."
 
 
-def format_table(headers: list[str], rows: list[list[str]], col_widths: list[int] | None = None) -> str:
-    """Format data as an ASCII table.
+def iter_table(
+    headers: list[str],
+    rows: Iterable[list[str]],
+    col_widths: list[int] | None = None,
+    sample_size: int | None = None,
+) -> Iterator[str]:
+    """Yield the lines of an ASCII table as the rows are consumed.
 
     Creates a formatted table with borders using ASCII characters
-    for Windows compatibility.
+    for Windows compatibility. Rows are formatted one at a time, so the
+    table is never held in memory as a whole.
 
     Args:
         headers: List of column header strings.
-        rows: List of rows, where each row is a list of cell values.
-        col_widths: Optional list of column widths. If None, auto-calculated.
-
-    Returns:
-        A formatted table string ready for display.
+        rows: Rows, where each row is a list of cell values; may be a
+              generator.
+        col_widths: Optional list of column widths. If None, widths are
+                    computed in one pass over the rows, capped at 25.
+        sample_size: Number of leading rows the computed widths are based
+                     on, or None for all rows. Only the sample is buffered.
+
+    Yields:
+        Each line of the table, without a trailing newline.
     """
+    rows = iter(rows)
+    sample: list[list[str]] = []
     if col_widths is None:
-        col_widths = []
-        for i, header in enumerate(headers):
-            max_width = len(header)
-            for row in rows:
-                if i < len(row):
-                    max_width = max(max_width, len(row[i]))
-            col_widths.append(min(max_width, 25))
+        sample = list(rows if sample_size is None else islice(rows, sample_size))
+        widths = [len(header) for header in headers]
+        for row in sample:
+            for i, cell in enumerate(row[: len(widths)]):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+        col_widths = [min(width, 25) for width in widths]
 
     def make_row(cells: list[str], sep: str = "|") -> str:
         padded = []
@@ -92,21 +107,58 @@ def format_table(headers: list[str], rows: list[list[str]], col_widths: list[int
             padded.append(f" {cell:<{width}} ")
         return sep + sep.join(padded) + sep
 
-    def make_separator(fill: str = "-") -> str:
-        parts = []
-        for width in col_widths:
-            parts.append(fill * (width + 2))
-        return "+" + "+".join(parts) + "+"
+    separator = "+" + "+".join("-" * (width + 2) for width in col_widths) + "+"
+    yield separator
+    yield make_row(headers)
+    yield separator
+
+    # Rows with one cell per header, the usual case, use a precompiled template
+    widths = [col_widths[i] if i < len(col_widths) else 10 for i in range(len(headers))]
+    template = "|" + "|".join(f" {{:<{width}}} " for width in widths) + "|"
+    for row in chain(sample, rows):
+        if len(row) == len(headers):
+            yield template.format(*row)
+        else:
+            yield make_row(row + [""] * (len(headers) - len(row)))
+
+    yield separator
+
 
-    lines = []
-    lines.append(make_separator())
-    lines.append(make_row(headers))
-    lines.append(make_separator())
+def write_table(
+    headers: list[str],
+    rows: Iterable[list[str]],
+    out: TextIO,
+    col_widths: list[int] | None = None,
+    sample_size: int | None = 1000,
+) -> None:
+    """Write an ASCII table to a stream row by row.
 
-    for row in rows:
-        padded_row = row + [""] * (len(headers) - len(row))
-        lines.append(make_row(padded_row))
+    Args:
+        headers: List of column header strings.
+        rows: Rows, where each row is a list of cell values; may be a
+              generator.
+        out: Destination text stream.
+        col_widths: Optional list of column widths. If None, widths are
+                    computed from the first ``sample_size`` rows.
+        sample_size: Number of leading rows computed widths are based on,
+                     or None for all rows.
+    """
+    for line in iter_table(headers, rows, col_widths, sample_size):
+        out.write(line + "\n")
 
-    lines.append(make_separator())
 
-    return "\n".join(lines)
+def format_table(headers: list[str], rows: list[list[str]], col_widths: list[int] | None = None) -> str:
+    """Format data as an ASCII table.
+
+    Creates a formatted table with borders using ASCII characters
+    for Windows compatibility.
+
+    Args:
+        headers: List of column header strings.
+        rows: List of rows, where each row is a list of cell values.
+        col_widths: Optional list of column widths. If None, auto-calculated.
+
+    Returns:
+        A formatted table string ready for display.
+    """
+    return "\n".join(iter_table(headers, rows, col_widths))
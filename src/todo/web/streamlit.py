@@ -1,7 +1,7 @@
 """Streamlit UI for the Todo CLI application - Modern Royal Blue Theme!"""
 
 import streamlit as st
-from todo.storage import storage
+from todo.storage import open_storage
 from todo.models import Task, TaskStatus
 from todo.exceptions import EmptyTitleError
 from todo.utils import validate_title
@@ -145,6 +145,34 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Choices offered for the number of tasks rendered per page
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+@st.cache_resource
+def _open_storage():
+    # One storage per server process, shared by every session and rerun
+    return open_storage()
+
+
+def get_storage():
+    """Return the shared storage, reloaded if another process changed it."""
+    storage = _open_storage()
+    storage.refresh()
+    return storage
+
+
+@st.cache_data(max_entries=8)
+def sorted_task_ids(_storage, instance_id, version, status):
+    """Return task IDs in display order, recomputed only when the data changes.
+
+    The storage itself is not hashed (leading underscore); its instance ID
+    and version identify the data, so reruns reuse the sorted list until a
+    task is added, removed or toggled.
+    """
+    return [task.id for task in _storage.get_sorted(status=status)]
+
+
 def main():
     st.set_page_config(page_title="Todo App", page_icon="✅", layout="wide", initial_sidebar_state="expanded")
 
@@ -158,7 +186,11 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
+    storage = get_storage()
+
     # Session state
+    if 'page' not in st.session_state:
+        st.session_state.page = 1
     if 'task_to_edit' not in st.session_state:
         st.session_state.task_to_edit = None
     if 'show_edit_form' not in st.session_state:
@@ -173,24 +205,22 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
-        all_tasks = storage.get_all()
-        complete_tasks = [t for t in all_tasks if t.status == TaskStatus.COMPLETE]
-        incomplete_tasks = [t for t in all_tasks if t.status == TaskStatus.INCOMPLETE]
+        counts = storage.counts()
 
         st.divider()
 
         # Stats
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total", len(all_tasks))
+            st.metric("Total", counts["total"])
         with col2:
-            st.metric("Done", len(complete_tasks))
+            st.metric("Done", counts[TaskStatus.COMPLETE])
         with col3:
-            st.metric("Pending", len(incomplete_tasks))
+            st.metric("Pending", counts[TaskStatus.INCOMPLETE])
 
         # Progress bar
-        if all_tasks:
-            progress = len(complete_tasks) / len(all_tasks)
+        if counts["total"]:
+            progress = counts[TaskStatus.COMPLETE] / counts["total"]
             st.markdown(f"""
             <div style="margin: 20px 0;">
                 <p style="color: #ffffff; margin-bottom: 8px;">📊 Progress: {int(progress*100)}%</p>
@@ -203,8 +233,9 @@ def main():
         st.divider()
 
         if st.button("🗑️ Clear Completed", type="secondary", use_container_width=True):
-            for task in complete_tasks:
-                storage.delete(task.id)
+            storage.delete_many(
+                [task.id for task in storage.iter_tasks(TaskStatus.COMPLETE)]
+            )
             st.rerun()
 
         # Tips
@@ -227,16 +258,28 @@ def main():
         st.subheader("📋 Your Tasks")
 
         # Filter
-        col1, col2 = st.columns([1, 4])
+        col1, col2, col3 = st.columns([1, 1, 3])
         with col1:
             status_filter = st.selectbox("🔍 Filter", ["All", "Complete", "Incomplete"])
+        with col2:
+            page_size = st.selectbox("📄 Per page", PAGE_SIZES, index=1)
 
         if status_filter == "Complete":
-            tasks = [t for t in all_tasks if t.status == TaskStatus.COMPLETE]
+            status = TaskStatus.COMPLETE
         elif status_filter == "Incomplete":
-            tasks = [t for t in all_tasks if t.status == TaskStatus.INCOMPLETE]
+            status = TaskStatus.INCOMPLETE
         else:
-            tasks = all_tasks
+            status = None
+        task_ids = sorted_task_ids(storage, storage.instance_id, storage.version, status)
+
+        # Only the tasks on the current page are loaded and rendered
+        page_count = max(1, -(-len(task_ids) // page_size))
+        st.session_state.page = min(st.session_state.page, page_count)
+        if page_count > 1:
+            with col3:
+                st.number_input("📑 Page", min_value=1, max_value=page_count, key="page")
+        start = (st.session_state.page - 1) * page_size
+        tasks = [storage.get_by_id(task_id) for task_id in task_ids[start:start + page_size]]
 
         if not tasks:
             st.markdown("""
@@ -247,7 +290,7 @@ def main():
             </div>
             """, unsafe_allow_html=True)
         else:
-            tasks.sort(key=lambda x: x.id)
+            st.caption(f"Showing {start + 1}-{start + len(tasks)} of {len(task_ids)} tasks · page {st.session_state.page} of {page_count}")
 
             for task in tasks:
                 with st.container():
@@ -0,0 +1,60 @@
+"""Tests for the journaling mode of the file-based storage."""
+
+import pytest
+
+from todo.models import Task
+from todo.storage.durability import Durability
+from todo.storage.file import FileStorage
+
+
+@pytest.mark.parametrize("durability", [Durability.NONE, Durability.FLUSH])
+def test_journal_records_are_visible_to_other_instances(tmp_path, durability):
+    data_file = tmp_path / "todos.json"
+    first = FileStorage(data_file, journal=True, durability=durability)
+    second = FileStorage(data_file, journal=True, durability=durability)
+    try:
+        a = first.add(Task(id=0, title="from a"))
+        b = second.add(Task(id=0, title="from b"))
+
+        assert a.id != b.id
+        reopened = FileStorage(data_file, journal=True)
+        try:
+            titles = sorted(task.title for task in reopened.get_all())
+        finally:
+            reopened.close()
+        assert titles == ["from a", "from b"]
+    finally:
+        first.close()
+        second.close()
+
+
+def test_journal_is_replayed_and_folded_when_journaling_is_off(tmp_path):
+    data_file = tmp_path / "todos.json"
+    journaling = FileStorage(data_file, journal=True)
+    try:
+        for title in ("one", "two", "three"):
+            journaling.add(Task(id=0, title=title))
+        journaling.toggle_status(2)
+        journaling.update(3, title="three updated")
+        journaling.delete(1)
+
+        plain = FileStorage(data_file)
+        try:
+            assert [task.title for task in plain.get_all()] == ["two", "three updated"]
+            assert not data_file.with_name("todos.json.log").exists()
+            added = plain.add(Task(id=0, title="from plain"))
+            assert added.id == 4
+        finally:
+            plain.close()
+
+        # The journaling instance sees the plain write instead of replaying
+        # its old records over it
+        journaling.add(Task(id=0, title="four"))
+        reopened = FileStorage(data_file, journal=True)
+        try:
+            titles = sorted(task.title for task in reopened.get_all())
+        finally:
+            reopened.close()
+        assert titles == ["four", "from plain", "three updated", "two"]
+    finally:
+        journaling.close()
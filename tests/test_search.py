@@ -0,0 +1,99 @@
+"""Tests for the full-text search index."""
+
+import pytest
+
+from todo.models import Task
+from todo.storage.binary import BinaryStorage
+from todo.storage.file import FileStorage
+from todo.storage.search import SearchIndex, delta_log_path
+
+
+@pytest.mark.parametrize("title", ["", "!!!"])
+def test_removing_task_without_tokens_restores_count(title):
+    index = SearchIndex()
+    index.add(Task(id=1, title="Buy milk"))
+    empty = Task(id=2, title=title)
+
+    index.add(empty)
+    index.remove(empty)
+
+    assert len(index) == 1
+
+
+def _forbid_rebuild(monkeypatch):
+    def rebuild(self, tasks):
+        raise AssertionError("search index was rebuilt")
+
+    monkeypatch.setattr(SearchIndex, "rebuild", rebuild)
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_saved_index_follows_writes_of_other_instances(tmp_path, monkeypatch, journal):
+    data_file = tmp_path / "todos.json"
+    first = FileStorage(data_file, journal=journal)
+    milk = first.add(Task(id=0, title="Buy milk"))
+    bread = first.add(Task(id=0, title="Buy bread"))
+    assert first.search("buy") == [milk, bread]
+    first.close()
+
+    # A process that never searches changes the tasks
+    second = FileStorage(data_file, journal=journal)
+    second.update(milk.id, title="Buy oat milk")
+    second.toggle_status(bread.id)
+    second.delete(bread.id)
+    second.add(Task(id=0, title="Call the bank"))
+    second.close()
+
+    _forbid_rebuild(monkeypatch)
+    third = FileStorage(data_file, journal=journal)
+    try:
+        assert [task.title for task in third.search("milk")] == ["Buy oat milk"]
+        assert third.search("bread") == []
+        assert [task.title for task in third.search("bank")] == ["Call the bank"]
+    finally:
+        third.close()
+
+
+def test_saved_binary_index_follows_writes_of_other_instances(tmp_path, monkeypatch):
+    data_file = tmp_path / "todos.bin"
+    first = BinaryStorage(data_file)
+    milk = first.add(Task(id=0, title="Buy milk"))
+    first.add(Task(id=0, title="Buy bread"))
+    assert [task.id for task in first.search("milk")] == [milk.id]
+    first.close()
+
+    second = BinaryStorage(data_file)
+    second.toggle_status(milk.id)
+    second.update(milk.id, title="Buy oat milk")
+    second.add(Task(id=0, title="Call the bank"))
+    second.close()
+
+    _forbid_rebuild(monkeypatch)
+    third = BinaryStorage(data_file)
+    try:
+        assert [task.title for task in third.search("milk")] == ["Buy oat milk"]
+        assert [task.title for task in third.search("bank")] == ["Call the bank"]
+    finally:
+        third.close()
+
+
+def test_large_delta_log_is_folded_into_saved_index(tmp_path, monkeypatch):
+    monkeypatch.setattr("todo.storage.search._MIN_FOLD_BYTES", 0)
+    data_file = tmp_path / "todos.json"
+    storage = FileStorage(data_file)
+    task = storage.add(Task(id=0, title="Plan trip"))
+    storage.search("trip")
+    storage.close()
+
+    writer = FileStorage(data_file)
+    for n in range(20):
+        writer.update(task.id, description=f"day {n}")
+    writer.close()
+    assert delta_log_path(tmp_path / "todos.json.idx").exists()
+
+    reader = FileStorage(data_file)
+    try:
+        assert reader.search("day 19") == [reader.get_by_id(task.id)]
+    finally:
+        reader.close()
+    assert not delta_log_path(tmp_path / "todos.json.idx").exists()
@@ -0,0 +1,49 @@
+"""Tests for the Task model."""
+
+import json
+from datetime import datetime, timezone
+
+from todo.models import Task
+from todo.storage.file import FileStorage
+
+
+def test_from_dict_accepts_timezone_aware_timestamp():
+    aware = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    task = Task.from_dict(
+        {
+            "id": 1,
+            "title": "Aware",
+            "description": "",
+            "status": "incomplete",
+            "created_at": aware.isoformat(),
+        }
+    )
+
+    assert task.created_at.tzinfo is None
+    assert task.created_at == aware.astimezone().replace(tzinfo=None)
+
+
+def test_file_storage_loads_timezone_aware_timestamp(tmp_path):
+    data_file = tmp_path / "todos.json"
+    data_file.write_text(
+        json.dumps(
+            [
+                {
+                    "id": 1,
+                    "title": "Aware",
+                    "description": "",
+                    "status": "incomplete",
+                    "created_at": "2026-01-01T00:00:00+00:00",
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    storage = FileStorage(data_file)
+    try:
+        assert [task.title for task in storage.get_all()] == ["Aware"]
+    finally:
+        storage.close()
+    assert not list(tmp_path.glob("todos.json.corrupt-*"))
@@ -0,0 +1,51 @@
+"""Concurrency tests running the thread stress workers at a small scale."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from todo.storage.file import FileStorage
+from todo.storage.memory import TaskStorage
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "benchmarks" / "thread_stress.py"
+_spec = importlib.util.spec_from_file_location("thread_stress", _SCRIPT)
+thread_stress = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(thread_stress)
+
+THREADS = 4
+OPS = 100
+
+
+def _run_workers(storage):
+    workers = [thread_stress.Worker(storage, n, OPS, seed=n) for n in range(THREADS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return workers
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_file_storage_loses_no_updates_under_threads(tmp_path, journal):
+    data_file = tmp_path / "todos.json"
+    storage = FileStorage(data_file, journal=journal)
+    try:
+        workers = _run_workers(storage)
+        assert thread_stress.check(storage, workers) == []
+
+        reopened = FileStorage(data_file, journal=journal)
+        try:
+            on_disk = {t.id: (t.title, t.status) for t in reopened.get_all()}
+        finally:
+            reopened.close()
+        in_memory = {t.id: (t.title, t.status) for t in storage.get_all()}
+        assert on_disk == in_memory
+    finally:
+        storage.close()
+
+
+def test_memory_storage_loses_no_updates_under_threads():
+    storage = TaskStorage()
+    workers = _run_workers(storage)
+    assert thread_stress.check(storage, workers) == []
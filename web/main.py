@@ -1,12 +1,23 @@
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-import json
 import os
-from datetime import datetime
+import sys
+import time
+from pathlib import Path
 from typing import Optional
 
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from todo import metrics
+from todo.api import apply_batch, changes_since, clamp_limit, etag_matches, make_etag
+from todo.exceptions import TaskNotFoundError, ValidationError
+from todo.models import Task
+from todo.storage.aio import AsyncStorage
+from todo.storage.repository import get_repository
+
 app = FastAPI()
 
 # Mount static files
@@ -15,59 +26,108 @@ app.mount("/static", StaticFiles(directory="web/static"), name="static")
 # Templates directory
 templates = Jinja2Templates(directory="web/templates")
 
-# File to store tasks
-TASKS_FILE = 'todos.json'
+def tasks_repository():
+    # Shared in-process storage for TODO_DATA_FILE, the same file the CLI uses;
+    # only re-reads the file if it changed on disk
+    return get_repository()
+
+# Runs storage calls in worker threads so file I/O never blocks the event loop
+storage = AsyncStorage(tasks_repository)
+
+@app.on_event("shutdown")
+async def shutdown_storage():
+    storage.shutdown()
 
-def load_tasks():
-    if os.path.exists(TASKS_FILE):
-        with open(TASKS_FILE, 'r') as f:
-            return json.load(f)
-    return []
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    # Label by route template, not raw path, so task IDs don't explode label values
+    route = request.scope.get("route")
+    metrics.HTTP_REQUEST_SECONDS.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        route=route.path if route is not None else "unmatched",
+        status=str(response.status_code),
+    )
+    return response
 
-def save_tasks(tasks):
-    with open(TASKS_FILE, 'w') as f:
-        json.dump(tasks, f, indent=2)
+@app.get("/metrics")
+async def prometheus_metrics():
+    # Rendered on a storage thread, since gauges read the storage
+    text = await storage.run(lambda s: metrics.REGISTRY.render())
+    return Response(text, media_type=metrics.CONTENT_TYPE)
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
-    tasks = load_tasks()
+    tasks = await storage.get_all()
     return templates.TemplateResponse("index.html", {"request": request, "tasks": tasks})
 
 @app.post("/add")
 async def add_task(title: str = Form(...), description: str = Form("")):
-    tasks = load_tasks()
-    new_task = {
-        'id': max([t['id'] for t in tasks], default=0) + 1,
-        'title': title,
-        'description': description,
-        'status': 'incomplete',
-        'created_at': datetime.now().isoformat()
-    }
-    tasks.append(new_task)
-    save_tasks(tasks)
+    await storage.add(Task(id=0, title=title, description=description))
     return {"message": "Task added successfully"}
 
 @app.put("/toggle/{task_id}")
 async def toggle_task(task_id: int):
-    tasks = load_tasks()
-    for task in tasks:
-        if task['id'] == task_id:
-            task['status'] = 'complete' if task['status'] == 'incomplete' else 'incomplete'
-            break
-    save_tasks(tasks)
+    try:
+        await storage.toggle_status(task_id)
+    except TaskNotFoundError:
+        pass
     return {"message": "Task toggled successfully"}
 
 @app.delete("/delete/{task_id}")
 async def delete_task(task_id: int):
-    tasks = load_tasks()
-    tasks = [task for task in tasks if task['id'] != task_id]
-    save_tasks(tasks)
+    try:
+        await storage.delete(task_id)
+    except TaskNotFoundError:
+        pass
     return {"message": "Task deleted successfully"}
 
 @app.get("/api/tasks")
-async def api_tasks():
-    tasks = load_tasks()
-    return tasks
+async def api_tasks(request: Request, limit: Optional[int] = None, after: Optional[int] = None, q: Optional[str] = None,
+                    sort: str = "id", reverse: bool = False):
+    # Answer unchanged polls from the version counter alone
+    version, etag = await storage.run(lambda s: (s.version, make_etag(s)))
+    # The version clients pass to /api/tasks/changes to sync from this listing
+    headers = {"ETag": etag, "X-Version": str(version), "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        if q is not None:
+            # Ranked full-text matches, best first
+            tasks = await storage.search(q, clamp_limit(limit) if limit is not None else None)
+        elif limit is None:
+            tasks = await storage.get_sorted(sort, reverse)
+        else:
+            # Sorted pages are walked from the storage's ordered indexes
+            tasks, next_cursor = await storage.page(clamp_limit(limit), after, sort, reverse)
+            if next_cursor is not None:
+                headers["X-Next-Cursor"] = str(next_cursor)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return JSONResponse([task.to_dict() for task in tasks], headers=headers)
+
+@app.get("/api/tasks/changes")
+async def api_tasks_changes(since: int):
+    # Only the tasks changed after the client's version, or a resync signal
+    body = await storage.run(lambda s: changes_since(s, since))
+    return JSONResponse(body, headers={"Cache-Control": "no-cache"})
+
+@app.post("/api/tasks/batch")
+async def api_tasks_batch(request: Request):
+    # Applies every operation in memory, then persists once
+    try:
+        payload = await request.json()
+    except ValueError:
+        return JSONResponse({"error": "Request body must be JSON"}, status_code=400)
+    operations = payload.get("operations") if isinstance(payload, dict) else None
+    try:
+        results = await storage.run(lambda s: apply_batch(s, operations), write=True)
+    except ValidationError as e:
+        return JSONResponse({"error": e.message}, status_code=400)
+    return {"results": results}
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,63 +1,125 @@
-from flask import Flask, render_template, request, redirect, url_for, jsonify
-import json
+from flask import Flask, render_template, request, redirect, url_for, jsonify, g
 import os
-from datetime import datetime
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from todo import metrics
+from todo.api import apply_batch, changes_since, clamp_limit, etag_matches, make_etag, parse_flag
+from todo.exceptions import TaskNotFoundError, ValidationError
+from todo.models import Task
+from todo.storage.repository import get_repository
 
 app = Flask(__name__)
 
-# File to store tasks
-TASKS_FILE = 'todos.json'
+def tasks_repository():
+    # Shared in-process storage for TODO_DATA_FILE, the same file the CLI uses;
+    # only re-reads the file if it changed on disk
+    return get_repository()
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
 
-def load_tasks():
-    if os.path.exists(TASKS_FILE):
-        with open(TASKS_FILE, 'r') as f:
-            return json.load(f)
-    return []
+@app.after_request
+def record_request_metrics(response):
+    # Label by route template, not raw path, so task IDs don't explode label values
+    rule = request.url_rule
+    metrics.HTTP_REQUEST_SECONDS.observe(
+        time.perf_counter() - g.request_start,
+        method=request.method,
+        route=rule.rule if rule is not None else 'unmatched',
+        status=str(response.status_code),
+    )
+    return response
 
-def save_tasks(tasks):
-    with open(TASKS_FILE, 'w') as f:
-        json.dump(tasks, f, indent=2)
+@app.route('/metrics')
+def prometheus_metrics():
+    tasks_repository()  # Registers the storage gauges on first use
+    return metrics.REGISTRY.render(), 200, {'Content-Type': metrics.CONTENT_TYPE}
 
 @app.route('/')
 def index():
-    tasks = load_tasks()
+    tasks = tasks_repository().get_all()
     return render_template('index.html', tasks=tasks)
 
 @app.route('/add', methods=['POST'])
 def add_task():
-    tasks = load_tasks()
-    new_task = {
-        'id': max([t['id'] for t in tasks], default=0) + 1,
-        'title': request.form['title'],
-        'description': request.form.get('description', ''),
-        'status': 'incomplete',
-        'created_at': datetime.now().isoformat()
-    }
-    tasks.append(new_task)
-    save_tasks(tasks)
+    tasks_repository().add(Task(
+        id=0,
+        title=request.form['title'],
+        description=request.form.get('description', ''),
+    ))
     return redirect(url_for('index'))
 
 @app.route('/toggle/<int:task_id>')
 def toggle_task(task_id):
-    tasks = load_tasks()
-    for task in tasks:
-        if task['id'] == task_id:
-            task['status'] = 'complete' if task['status'] == 'incomplete' else 'incomplete'
-            break
-    save_tasks(tasks)
+    try:
+        tasks_repository().toggle_status(task_id)
+    except TaskNotFoundError:
+        pass
     return redirect(url_for('index'))
 
 @app.route('/delete/<int:task_id>')
 def delete_task(task_id):
-    tasks = load_tasks()
-    tasks = [task for task in tasks if task['id'] != task_id]
-    save_tasks(tasks)
+    try:
+        tasks_repository().delete(task_id)
+    except TaskNotFoundError:
+        pass
     return redirect(url_for('index'))
 
 @app.route('/api/tasks')
 def api_tasks():
-    tasks = load_tasks()
-    return jsonify(tasks)
+    repository = tasks_repository()
+    # Answer unchanged polls from the version counter alone
+    etag = make_etag(repository)
+    # The version clients pass to /api/tasks/changes to sync from this listing
+    headers = {'ETag': etag, 'X-Version': str(repository.version), 'Cache-Control': 'no-cache'}
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        return '', 304, headers
+
+    limit = request.args.get('limit', type=int)
+    query = request.args.get('q')
+    sort = request.args.get('sort', 'id')
+    reverse = parse_flag(request.args.get('reverse'))
+    try:
+        if query is not None:
+            # Ranked full-text matches, best first
+            tasks = repository.search(query, clamp_limit(limit) if limit is not None else None)
+        elif limit is None:
+            tasks = repository.get_sorted(sort, reverse)
+        else:
+            # Sorted pages are walked from the storage's ordered indexes
+            tasks, next_cursor = repository.page(
+                clamp_limit(limit), request.args.get('after', type=int), sort, reverse
+            )
+            if next_cursor is not None:
+                headers['X-Next-Cursor'] = str(next_cursor)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify([task.to_dict() for task in tasks]), 200, headers
+
+@app.route('/api/tasks/changes')
+def api_tasks_changes():
+    # Only the tasks changed after the client's version, or a resync signal
+    since = request.args.get('since', type=int)
+    if since is None:
+        return jsonify({'error': "'since' must be an integer version"}), 400
+    return jsonify(changes_since(tasks_repository(), since)), 200, {'Cache-Control': 'no-cache'}
+
+@app.route('/api/tasks/batch', methods=['POST'])
+def api_tasks_batch():
+    # Applies every operation in memory, then persists once
+    payload = request.get_json(silent=True)
+    operations = payload.get('operations') if isinstance(payload, dict) else None
+    try:
+        results = apply_batch(tasks_repository(), operations)
+    except ValidationError as e:
+        return jsonify({'error': e.message}), 400
+    return jsonify({'results': results})
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=int(os.environ.get('PORT', 8000)))
\ No newline at end of file